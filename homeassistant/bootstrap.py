@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Mapping
 import contextlib
 from functools import partial
 from itertools import chain
@@ -87,6 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import json_bytes
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
@@ -96,12 +98,16 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_enable_setup_trace,
     async_get_setup_timings,
+    async_get_setup_trace,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_trace_setup_stage,
 )
 from .util.async_ import create_eager_task
+from .util.file import write_utf8_file
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
@@ -120,6 +126,7 @@ SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
 
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
@@ -263,6 +270,8 @@ async def async_setup_hass(
         hass.config.debug = True
 
     hass.config.safe_mode = runtime_config.safe_mode
+    if runtime_config.startup_trace:
+        async_enable_setup_trace(hass)
     hass.config.skip_pip = runtime_config.skip_pip
     hass.config.skip_pip_packages = runtime_config.skip_pip_packages
     if runtime_config.skip_pip or runtime_config.skip_pip_packages:
@@ -277,6 +286,9 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    if not runtime_config.recovery_mode and not runtime_config.safe_mode:
+        await loader.async_load_manifest_snapshot(hass)
+        conf_util.async_enable_yaml_cache(hass)
     block_async_io.enable()
 
     config_dict = None
@@ -734,22 +746,31 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    priorities: Mapping[str, int] | None = None,
 ) -> None:
-    """Set up multiple domains. Log on failure."""
+    """Set up multiple domains. Log on failure.
+
+    Domains with a higher priority are started first within each group.
+    """
     # Avoid creating tasks for domains that were setup in a previous stage
     domains_not_yet_setup = domains - hass.config.components
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # After that, start with the domains most other domains are waiting on
+    # so the critical path of the dependency graph gets going first.
+    priorities = priorities or {}
+
+    def _sort_key(domain: str) -> tuple[bool, int]:
+        return (SETUP_ORDER_SORT_KEY(domain), priorities.get(domain, 0))
+
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
             f"setup component {domain}",
             eager_start=True,
         )
-        for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
-        )
+        for domain in sorted(domains_not_yet_setup, key=_sort_key, reverse=True)
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
     for idx, domain in enumerate(futures):
@@ -927,9 +948,11 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
-    )
+    with async_trace_setup_stage(hass, "resolve"):
+        domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
+            hass, config
+        )
+    priorities = _count_dependants(domains_to_setup, integration_cache)
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -975,7 +998,10 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with async_trace_setup_stage(hass, name):
+                await async_setup_multi_components(
+                    hass, domain_group, config, priorities
+                )
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -984,10 +1010,13 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+            with async_trace_setup_stage(hass, "stage 1"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(
+                        hass, stage_1_domains, config, priorities
+                    )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1000,10 +1029,13 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+            with async_trace_setup_stage(hass, "stage 2"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(
+                        hass, stage_2_domains, config, priorities
+                    )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1013,8 +1045,11 @@ async def _async_set_up_integrations(
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with async_trace_setup_stage(hass, "wrap up"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -1029,3 +1064,25 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+
+    if (trace := async_get_setup_trace(hass)) is not None:
+        trace_path = hass.config.path(STARTUP_TRACE_FILENAME)
+        await hass.async_add_executor_job(
+            write_utf8_file, trace_path, json_bytes(trace).decode()
+        )
+        _LOGGER.info("Wrote startup trace to %s", trace_path)
+
+
+def _count_dependants(
+    domains: set[str], integration_cache: dict[str, loader.Integration]
+) -> Counter[str]:
+    """Count how many of the domains wait on each domain to be set up."""
+    dependants: Counter[str] = Counter()
+    for domain in domains:
+        if (integration := integration_cache.get(domain)) is None:
+            continue
+        dependants.update(integration.all_dependencies)
+        dependants.update(
+            dep for dep in integration.after_dependencies if dep in domains
+        )
+    return dependants
@@ -267,9 +267,14 @@ async def async_enable_proactive_mode(
         new_extra_arg: Any,
     ) -> bool:
         """Check if the serialized data has changed."""
-        return old_extra_arg is not None and old_extra_arg != new_extra_arg
+        return old_extra_arg is not None and _without_time_of_sample(
+            old_extra_arg
+        ) != _without_time_of_sample(new_extra_arg)
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
+    # The state each entity was last serialized from, a state changed event
+    # with the same state and attributes can't produce a different report
+    serialized_states: dict[str, State] = {}
 
     @callback
     def _async_entity_state_filter(data: EventStateChangedData) -> bool:
@@ -297,6 +302,15 @@ async def async_enable_proactive_mode(
         if TYPE_CHECKING:
             assert new_state is not None
 
+        entity_id = new_state.entity_id
+        if (
+            (serialized_state := serialized_states.get(entity_id)) is not None
+            and serialized_state.state == new_state.state
+            and serialized_state.attributes == new_state.attributes
+        ):
+            return
+        serialized_states[entity_id] = new_state
+
         alexa_changed_entity: AlexaEntity = ENTITY_ADAPTERS[new_state.domain](
             hass, smart_home_config, new_state
         )
@@ -345,6 +359,16 @@ async def async_enable_proactive_mode(
     )
 
 
+def _without_time_of_sample(
+    alexa_properties: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Return properties without the time they were sampled at."""
+    return [
+        {key: value for key, value in prop.items() if key != "timeOfSample"}
+        for prop in alexa_properties
+    ]
+
+
 async def async_send_changereport_message(
     hass: HomeAssistant,
     config: AbstractConfig,
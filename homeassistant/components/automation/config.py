@@ -25,6 +25,10 @@ from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config_cache import (
+    ValidatedConfigCache,
+    async_get_validated_config_cache,
+)
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -78,8 +82,12 @@ async def _async_validate_config_item(
     config: ConfigType,
     raise_on_errors: bool,
     warn_on_errors: bool,
+    validated_config_cache: ValidatedConfigCache[AutomationConfig] | None = None,
 ) -> AutomationConfig:
-    """Validate config item."""
+    """Validate config item.
+
+    If a cache is passed, configs which were validated before are taken from it.
+    """
     raw_config = None
     raw_blueprint_inputs = None
     uses_blueprint = False
@@ -161,6 +169,12 @@ async def _async_validate_config_item(
         elif CONF_ID in config:
             automation_name = f"Automation with ID '{config[CONF_ID]}'"
 
+    cache_key, cached_config = _async_get_cached_config(
+        validated_config_cache, config, raw_config, raw_blueprint_inputs
+    )
+    if cached_config is not None:
+        return cached_config
+
     try:
         validated_config = PLATFORM_SCHEMA(config)
     except vol.Invalid as err:
@@ -222,9 +236,38 @@ async def _async_validate_config_item(
         automation_config.validation_failed = True
         return automation_config
 
+    _async_set_cached_config(validated_config_cache, cache_key, automation_config)
     return automation_config
 
 
+def _async_get_cached_config(
+    validated_config_cache: ValidatedConfigCache[AutomationConfig] | None,
+    config: ConfigType,
+    raw_config: dict[str, Any] | None,
+    raw_blueprint_inputs: dict[str, Any] | None,
+) -> tuple[bytes | None, AutomationConfig | None]:
+    """Return the cache key of a config and the config if validated before."""
+    if validated_config_cache is None:
+        return None, None
+    cache_key = validated_config_cache.async_key(config)
+    if (cached_config := validated_config_cache.async_get(cache_key)) is None:
+        return cache_key, None
+    automation_config = AutomationConfig(cached_config)
+    automation_config.raw_blueprint_inputs = raw_blueprint_inputs
+    automation_config.raw_config = raw_config
+    return cache_key, automation_config
+
+
+def _async_set_cached_config(
+    validated_config_cache: ValidatedConfigCache[AutomationConfig] | None,
+    cache_key: bytes | None,
+    automation_config: AutomationConfig,
+) -> None:
+    """Store a validated config in the cache."""
+    if validated_config_cache is not None:
+        validated_config_cache.async_set(cache_key, automation_config)
+
+
 class AutomationConfig(dict):
     """Dummy class to allow adding attributes."""
 
@@ -236,10 +279,13 @@ class AutomationConfig(dict):
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
+    validated_config_cache: ValidatedConfigCache[AutomationConfig] | None = None,
 ) -> AutomationConfig | None:
     """Validate config item."""
     try:
-        return await _async_validate_config_item(hass, config, False, True)
+        return await _async_validate_config_item(
+            hass, config, False, True, validated_config_cache
+        )
     except (vol.Invalid, HomeAssistantError):
         return None
 
@@ -254,18 +300,26 @@ async def async_validate_config_item(
 
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
+    """Validate config.
+
+    Automations which did not change since the previous validation are taken
+    from the validated config cache.
+    """
+    validated_config_cache = async_get_validated_config_cache(hass, DOMAIN)
     # No gather here since _try_async_validate_config_item is unlikely to suspend
     # and the cost of creating many tasks is not worth the benefit.
     automations = list(
         filter(
             lambda x: x is not None,
             [
-                await _try_async_validate_config_item(hass, p_config)
+                await _try_async_validate_config_item(
+                    hass, p_config, validated_config_cache
+                )
                 for _, p_config in config_per_platform(config, DOMAIN)
             ],
         )
     )
+    validated_config_cache.async_prune()
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
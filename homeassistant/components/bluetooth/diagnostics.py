@@ -11,6 +11,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .api import _get_manager
+from .passive_update_processor import async_get_advertisement_stats
 
 
 async def async_get_config_entry_diagnostics(
@@ -23,6 +24,7 @@ async def async_get_config_entry_diagnostics(
     diagnostics = {
         "manager": manager_diagnostics,
         "adapters": adapters,
+        "passive_update_processors": async_get_advertisement_stats(hass),
     }
     if platform.system() == "Linux":
         diagnostics["dbus"] = await get_dbus_managed_objects()
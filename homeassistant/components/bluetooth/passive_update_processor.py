@@ -236,6 +236,23 @@ def async_register_coordinator_for_restore(
     return _unregister_coordinator_for_restore
 
 
+@callback
+def async_get_advertisement_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return how many advertisements of each coordinator parsed to the same data."""
+    if (data := hass.data.get(PASSIVE_UPDATE_PROCESSOR)) is None:
+        return {}
+    stats: dict[str, dict[str, Any]] = {}
+    for coordinator in data.coordinators:
+        received = coordinator.received_advertisements
+        unchanged = coordinator.unchanged_advertisements
+        stats[coordinator.address] = {
+            "received": received,
+            "unchanged": unchanged,
+            "unchanged_ratio": round(unchanged / received, 3) if received else 0.0,
+        }
+    return stats
+
+
 async def async_setup(hass: HomeAssistant) -> None:
     """Set up the passive update processor coordinators."""
     storage: Store[dict[str, dict[str, RestoredPassiveBluetoothDataUpdate]]] = Store(
@@ -301,6 +318,9 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         self.last_update_success = True
         self.restore_data: dict[str, RestoredPassiveBluetoothDataUpdate] = {}
         self.restore_key = None
+        self.received_advertisements = 0
+        self.unchanged_advertisements = 0
+        self._last_update: _DataT | None = None
         if config_entry := config_entries.current_entry.get():
             self.restore_key = config_entry.entry_id
         self._on_stop.append(async_register_coordinator_for_restore(self.hass, self))
@@ -368,6 +388,7 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         if self.hass.is_stopping:
             return
 
+        self.received_advertisements += 1
         try:
             update = self._update_method(service_info)
         except Exception:
@@ -375,6 +396,10 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
             self.logger.exception("Unexpected error updating %s data", self.name)
             return
 
+        if update == self._last_update:
+            self.unchanged_advertisements += 1
+        self._last_update = update
+
         if not self.last_update_success:
             self.last_update_success = True
             self.logger.info("Coordinator %s recovered", self.name)
@@ -29,6 +29,7 @@ from homeassistant.components.media_player import (
     SERVICE_PLAY_MEDIA,
 )
 from homeassistant.components.stream import (
+    CONF_LOOKBACK_BUFFER,
     FORMAT_CONTENT_TYPE,
     OUTPUT_FORMATS,
     Orientation,
@@ -401,15 +402,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     await component.async_setup(config)
 
     async def preload_stream(_event: Event) -> None:
-        """Load stream prefs and start stream if preload_stream is True."""
+        """Load stream prefs and start stream if preload_stream is True.
+
+        Streams with a lookback buffer are also started so the buffer fills.
+        """
         for camera in list(component.entities):
             stream_prefs = await prefs.get_dynamic_stream_settings(camera.entity_id)
-            if not stream_prefs.preload_stream:
+            lookback_buffer = camera.stream_options.get(CONF_LOOKBACK_BUFFER)
+            if not stream_prefs.preload_stream and not lookback_buffer:
                 continue
             stream = await camera.async_create_stream()
             if not stream:
                 continue
-            stream.add_provider("hls")
+            if stream_prefs.preload_stream:
+                stream.add_provider("hls")
             await stream.start()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, preload_stream)
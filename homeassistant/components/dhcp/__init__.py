@@ -6,11 +6,8 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
-from fnmatch import translate
-from functools import lru_cache
 import itertools
 import logging
-import re
 from typing import Any, Final
 
 import aiodhcpwatcher
@@ -58,7 +55,7 @@ from homeassistant.helpers.event import (
     async_track_time_interval,
 )
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import DHCPMatcher, async_get_dhcp
+from homeassistant.loader import DHCPMatcher, async_get_dhcp, compile_fnmatch
 
 from .const import DOMAIN
 
@@ -264,9 +261,7 @@ class WatcherBase:
             domain = matcher["domain"]
             if (
                 matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
+            ) is not None and not compile_fnmatch(matcher_hostname)(lowercase_hostname):
                 continue
 
             _LOGGER.debug("Matched %s against %s", data, matcher)
@@ -413,24 +408,3 @@ class DHCPWatcher(WatcherBase):
     async def async_start(self) -> None:
         """Start watching for dhcp packets."""
         self._unsub = await aiodhcpwatcher.async_start(self._async_process_dhcp_request)
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -14,6 +14,7 @@ from homeassistant.core import (
     EventStateChangedData,
     HassJob,
     HomeAssistant,
+    State,
     callback,
 )
 from homeassistant.helpers.event import async_call_later
@@ -45,6 +46,9 @@ def async_enable_report_state(
     checker = None
     unsub_pending: CALLBACK_TYPE | None = None
     pending: deque[dict[str, Any]] = deque([{}])
+    # The state each entity was last serialized from, a state changed event
+    # with the same state and attributes can't produce a different report
+    serialized_states: dict[str, State] = {}
 
     async def report_states(now=None):
         """Report the states."""
@@ -119,6 +123,14 @@ def async_enable_report_state(
                 )
 
         changed_entity = data["entity_id"]
+        if (
+            (serialized_state := serialized_states.get(changed_entity)) is not None
+            and serialized_state.state == new_state.state
+            and serialized_state.attributes == new_state.attributes
+        ):
+            return
+        serialized_states[changed_entity] = new_state
+
         try:
             entity_data = entity.query_serialize()
         except SmartHomeError as err:
@@ -167,6 +179,7 @@ def async_enable_report_state(
             if not entity.should_expose():
                 continue
 
+            serialized_states[entity.entity_id] = entity.state
             try:
                 entity_data = entity.query_serialize()
             except SmartHomeError:
@@ -201,5 +214,6 @@ def async_enable_report_state(
         unsub()
         if unsub_pending:
             unsub_pending()
+        serialized_states.clear()
 
     return unsub_all
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import timedelta
+from itertools import count
 import logging
+import math
+from operator import itemgetter
 from typing import Any
 
 import voluptuous as vol
@@ -18,6 +23,8 @@ from homeassistant.const import (
     CONF_FOR,
     CONF_PLATFORM,
     CONF_VALUE_TEMPLATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -40,6 +47,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 
 def validate_above_below[_T: dict[str, Any]](value: _T) -> _T:
@@ -82,6 +90,182 @@ _TRIGGER_SCHEMA = vol.All(
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_NUMERIC_STATE_INDEXES: HassKey[dict[tuple[str, str | None], NumericStateIndex]] = (
+    HassKey("numeric_state_trigger_indexes")
+)
+
+_THRESHOLD = itemgetter(0)
+
+
+@dataclass(slots=True)
+class IndexedTrigger:
+    """A numeric state trigger with fixed thresholds in an index."""
+
+    above: float | None
+    below: float | None
+    async_update: Callable[[str, State | None, State, bool], None]
+    async_error: Callable[[exceptions.ConditionError], None]
+
+    def matches(self, value: float) -> bool:
+        """Return if a value is within the thresholds."""
+        return not (
+            (self.below is not None and value >= self.below)
+            or (self.above is not None and value <= self.above)
+        )
+
+
+class NumericStateIndex:
+    """Numeric state triggers with fixed thresholds for an entity or attribute.
+
+    The new state is converted to a number once for all triggers. When both
+    the previous and the new value are numbers, only triggers with a threshold
+    between them are updated, the others can't have started or stopped
+    matching.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_id: str, attribute: str | None
+    ) -> None:
+        """Initialize the index."""
+        self.entity_id = entity_id
+        self.attribute = attribute
+        self.triggers: dict[int, IndexedTrigger] = {}
+        self._ids = count()
+        self._above: list[tuple[float, int]] = []
+        self._below: list[tuple[float, int]] = []
+        self._last_value: float | None = None
+        self._unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_changed
+        )
+
+    @callback
+    def async_add(self, trigger: IndexedTrigger) -> CALLBACK_TYPE:
+        """Add a trigger to the index."""
+        trigger_id = next(self._ids)
+        self.triggers[trigger_id] = trigger
+        if trigger.above is not None:
+            self._above.insert(
+                bisect_right(self._above, trigger.above, key=_THRESHOLD),
+                (trigger.above, trigger_id),
+            )
+        if trigger.below is not None:
+            self._below.insert(
+                bisect_right(self._below, trigger.below, key=_THRESHOLD),
+                (trigger.below, trigger_id),
+            )
+        # The trigger was armed against the current state, which may not have
+        # been seen by the index yet
+        self._last_value = None
+
+        @callback
+        def _async_remove() -> None:
+            del self.triggers[trigger_id]
+            if trigger.above is not None:
+                self._above.remove((trigger.above, trigger_id))
+            if trigger.below is not None:
+                self._below.remove((trigger.below, trigger_id))
+
+        return _async_remove
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop listening for state changes."""
+        self._unsub()
+
+    @callback
+    def _async_value(self, state: State) -> float | None:
+        """Return the numeric value of a state, None if it never matches."""
+        attribute = self.attribute
+        if attribute is not None and attribute not in state.attributes:
+            return None
+        value = state.state if attribute is None else state.attributes.get(attribute)
+        if value in (None, STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError) as ex:
+            raise exceptions.ConditionErrorMessage(
+                "numeric_state",
+                (
+                    f"entity {self.entity_id} state '{value}' cannot be processed"
+                    " as a number"
+                ),
+            ) from ex
+
+    @callback
+    def _async_crossed_triggers(self, last: float, value: float) -> list[int]:
+        """Return the triggers with a threshold between two values."""
+        low, high = (last, value) if last <= value else (value, last)
+        trigger_ids: set[int] = set()
+        for thresholds in (self._above, self._below):
+            start = bisect_left(thresholds, low, key=_THRESHOLD)
+            end = bisect_right(thresholds, high, key=_THRESHOLD)
+            trigger_ids.update(trigger_id for _, trigger_id in thresholds[start:end])
+        return sorted(trigger_ids)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the triggers which may have changed."""
+        if (to_s := event.data["new_state"]) is None:
+            self._last_value = None
+            return
+        from_s = event.data["old_state"]
+        try:
+            value = self._async_value(to_s)
+        except exceptions.ConditionError as ex:
+            self._last_value = None
+            for trigger in list(self.triggers.values()):
+                trigger.async_error(ex)
+            return
+
+        last = self._last_value
+        self._last_value = value
+        if value is None or last is None or math.isnan(value) or math.isnan(last):
+            trigger_ids = list(self.triggers)
+        else:
+            trigger_ids = self._async_crossed_triggers(last, value)
+
+        for trigger_id in trigger_ids:
+            # A trigger may be removed by the action of another one
+            if (trigger := self.triggers.get(trigger_id)) is None:
+                continue
+            trigger.async_update(
+                self.entity_id,
+                from_s,
+                to_s,
+                value is not None and trigger.matches(value),
+            )
+
+
+@callback
+def _async_index_trigger(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    attribute: str | None,
+    trigger: IndexedTrigger,
+) -> CALLBACK_TYPE:
+    """Add a trigger to the shared indexes of its entities."""
+    indexes = hass.data.setdefault(DATA_NUMERIC_STATE_INDEXES, {})
+    removers: list[CALLBACK_TYPE] = []
+    for entity_id in entity_ids:
+        if (index := indexes.get((entity_id, attribute))) is None:
+            index = indexes[entity_id, attribute] = NumericStateIndex(
+                hass, entity_id, attribute
+            )
+        removers.append(index.async_add(trigger))
+
+    @callback
+    def _async_remove() -> None:
+        for remove in removers:
+            remove()
+        for entity_id in entity_ids:
+            key = (entity_id, attribute)
+            if (index := indexes.get(key)) is not None and not index.triggers:
+                index.async_remove()
+                del indexes[key]
+
+    return _async_remove
+
 
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
@@ -157,14 +341,10 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
-        entity_id = event.data["entity_id"]
-        from_s = event.data["old_state"]
-        to_s = event.data["new_state"]
-
-        if to_s is None:
-            return
+    def async_numeric_state_changed(
+        entity_id: str, from_s: State | None, to_s: State, matching: bool
+    ) -> None:
+        """Arm the trigger or call the action when the state starts matching."""
 
         @callback
         def call_action() -> None:
@@ -197,15 +377,9 @@ async def async_attach_trigger(
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
+                # primary state change listener.
                 return False
 
-        try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
-        except exceptions.ConditionError as ex:
-            _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
-            return
-
         if not matching:
             armed_entities.add(entity_id)
         elif entity_id in armed_entities:
@@ -234,7 +408,49 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    @callback
+    def async_numeric_state_error(ex: exceptions.ConditionError) -> None:
+        """Log an error checking the state."""
+        _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
+
+    @callback
+    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
+        """Listen for state changes and calls action."""
+        entity_id = event.data["entity_id"]
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+
+        if to_s is None:
+            return
+
+        try:
+            matching = check_numeric_state(entity_id, from_s, to_s)
+        except exceptions.ConditionError as ex:
+            async_numeric_state_error(ex)
+            return
+
+        async_numeric_state_changed(entity_id, from_s, to_s, matching)
+
+    # Triggers with fixed thresholds share an index per entity, which checks
+    # the state once for all of them
+    if (
+        value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str)
+        and (attribute is None or isinstance(attribute, str))
+    ):
+        unsub = _async_index_trigger(
+            hass,
+            entity_ids,
+            attribute,
+            IndexedTrigger(
+                above, below, async_numeric_state_changed, async_numeric_state_error
+            ),
+        )
+    else:
+        unsub = async_track_state_change_event(
+            hass, entity_ids, state_automation_listener
+        )
 
     @callback
     def async_remove() -> None:
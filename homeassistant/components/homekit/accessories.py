@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any, cast
 from uuid import UUID
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
 from pyhap.characteristic import Characteristic
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import CATEGORY_OTHER, HAP_REPR_AID, HAP_REPR_IID, HAP_REPR_VALUE
 from pyhap.iid_manager import IIDManager
 from pyhap.service import Service
 from pyhap.util import callback as pyhap_callback
@@ -697,6 +698,86 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         self._bridge_name = bridge_name
         self._entry_title = entry_title
         self.iid_storage = iid_storage
+        self.sent_updates = 0
+        self.suppressed_updates = 0
+        self._pending_updates: dict[
+            str, tuple[dict[str, Any], tuple[str, int] | None]
+        ] = {}
+        self._sent_values: dict[str, Any] = {}
+        self._publish_scheduled = False
+
+    @pyhap_callback  # type: ignore[misc]
+    def publish(
+        self,
+        data: dict[str, Any],
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Queue a characteristic change to be sent to the controllers.
+
+        Changes are sent once per event loop iteration, only the last value
+        of each characteristic is sent and only if it differs from the value
+        sent before. Immediate changes, like button presses, are sent as is.
+        Changes of characteristics no controller is subscribed to are dropped.
+        """
+        topic = get_topic(data[HAP_REPR_AID], data[HAP_REPR_IID])
+        if topic not in self.topics:
+            return
+        if threading.current_thread() == self.tid:
+            self._async_queue_update(topic, data, sender_client_addr, immediate)
+            return
+        self.loop.call_soon_threadsafe(
+            self._async_queue_update, topic, data, sender_client_addr, immediate
+        )
+
+    @ha_callback
+    def _async_queue_update(
+        self,
+        key: str,
+        data: dict[str, Any],
+        sender_client_addr: tuple[str, int] | None,
+        immediate: bool,
+    ) -> None:
+        """Queue a characteristic change a controller is subscribed to."""
+        if immediate:
+            self._pending_updates.pop(key, None)
+            self._sent_values[key] = data[HAP_REPR_VALUE]
+            self.sent_updates += 1
+            super().publish(data, sender_client_addr, immediate)
+            return
+        if key in self._pending_updates:
+            self.suppressed_updates += 1
+        self._pending_updates[key] = (data, sender_client_addr)
+        if not self._publish_scheduled:
+            self._publish_scheduled = True
+            self.hass.loop.call_soon(self._async_publish_pending)
+
+    @ha_callback
+    def _async_publish_pending(self) -> None:
+        """Send the queued characteristic changes."""
+        self._publish_scheduled = False
+        pending = self._pending_updates
+        self._pending_updates = {}
+        sent_values = self._sent_values
+        for key, (data, sender_client_addr) in pending.items():
+            value = data[HAP_REPR_VALUE]
+            if key in sent_values and sent_values[key] == value:
+                self.suppressed_updates += 1
+                continue
+            sent_values[key] = value
+            self.sent_updates += 1
+            super().publish(data, sender_client_addr)
+
+    @ha_callback
+    def async_subscribe_client_topic(
+        self, client: tuple[str, int], topic: str, subscribe: bool = True
+    ) -> None:
+        """Override super function to send the next change to new subscribers."""
+        super().async_subscribe_client_topic(client, topic, subscribe)
+        if subscribe:
+            # Changes are dropped while nobody is subscribed, so the value
+            # sent before may not be what the controller reads now
+            self._sent_values.pop(topic, None)
 
     @pyhap_callback  # type: ignore[misc]
     def pair(
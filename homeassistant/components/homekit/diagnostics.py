@@ -4,14 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from pyhap.accessory_driver import AccessoryDriver
 from pyhap.state import State
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .accessories import HomeAccessory, HomeBridge
+from .accessories import HomeAccessory, HomeBridge, HomeDriver
 from .const import DOMAIN
 from .models import HomeKitEntryData
 
@@ -37,7 +36,7 @@ async def async_get_config_entry_diagnostics(
         data["iid_storage"] = homekit.iid_storage.allocations
     if not homekit.driver:  # not started yet or startup failed
         return data
-    driver: AccessoryDriver = homekit.driver
+    driver: HomeDriver = homekit.driver
     if driver.accessory:
         if isinstance(driver.accessory, HomeBridge):
             data["bridge"] = _get_bridge_diagnostics(hass, driver.accessory)
@@ -52,6 +51,10 @@ async def async_get_config_entry_diagnostics(
             },
             "config_version": state.config_version,
             "pairing_id": state.mac,
+            "updates": {
+                "sent": driver.sent_updates,
+                "suppressed": driver.suppressed_updates,
+            },
         }
     )
     return data
@@ -2,30 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.sensor import ATTR_STATE_CLASS
-from homeassistant.const import (
-    ATTR_DEVICE_ID,
-    ATTR_DOMAIN,
-    ATTR_ENTITY_ID,
-    ATTR_UNIT_OF_MEASUREMENT,
-    EVENT_LOGBOOK_ENTRY,
-    EVENT_STATE_CHANGED,
-)
-from homeassistant.core import (
-    CALLBACK_TYPE,
-    Event,
-    EventStateChangedData,
-    HomeAssistant,
-    State,
-    callback,
-    is_callback,
-    split_entity_id,
-)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, EVENT_LOGBOOK_ENTRY
+from homeassistant.core import HomeAssistant, State, callback, split_entity_id
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util.event_type import EventType
 
 from .const import ALWAYS_CONTINUOUS_DOMAINS, AUTOMATION_EVENTS, BUILT_IN_EVENTS, DOMAIN
@@ -104,116 +87,6 @@ def extract_attr(source: Mapping[str, Any], attr: str) -> list[str]:
     return str(value).split(",")
 
 
-@callback
-def event_forwarder_filtered(
-    target: Callable[[Event], None],
-    entities_filter: Callable[[str], bool] | None,
-    entity_ids: list[str] | None,
-    device_ids: list[str] | None,
-) -> Callable[[Event], None]:
-    """Make a callable to filter events."""
-    if not entities_filter and not entity_ids and not device_ids:
-        # No filter
-        # - Script Trace (context ids)
-        # - Automation Trace (context ids)
-        return target
-
-    if entities_filter:
-        # We have an entity filter:
-        # - Logbook panel
-
-        @callback
-        def _forward_events_filtered_by_entities_filter(event: Event) -> None:
-            assert entities_filter is not None
-            event_data = event.data
-            entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
-            if entity_ids and not any(
-                entities_filter(entity_id) for entity_id in entity_ids
-            ):
-                return
-            domain = event_data.get(ATTR_DOMAIN)
-            if domain and not entities_filter(f"{domain}._"):
-                return
-            target(event)
-
-        return _forward_events_filtered_by_entities_filter
-
-    # We are filtering on entity_ids and/or device_ids:
-    # - Areas
-    # - Devices
-    # - Logbook Card
-    entity_ids_set = set(entity_ids) if entity_ids else set()
-    device_ids_set = set(device_ids) if device_ids else set()
-
-    @callback
-    def _forward_events_filtered_by_device_entity_ids(event: Event) -> None:
-        event_data = event.data
-        if entity_ids_set.intersection(
-            extract_attr(event_data, ATTR_ENTITY_ID)
-        ) or device_ids_set.intersection(extract_attr(event_data, ATTR_DEVICE_ID)):
-            target(event)
-
-    return _forward_events_filtered_by_device_entity_ids
-
-
-@callback
-def async_subscribe_events(
-    hass: HomeAssistant,
-    subscriptions: list[CALLBACK_TYPE],
-    target: Callable[[Event[Any]], None],
-    event_types: tuple[EventType[Any] | str, ...],
-    entities_filter: Callable[[str], bool] | None,
-    entity_ids: list[str] | None,
-    device_ids: list[str] | None,
-) -> None:
-    """Subscribe to events for the entities and devices or all.
-
-    These are the events we need to listen for to do
-    the live logbook stream.
-    """
-    assert is_callback(target), "target must be a callback"
-    event_forwarder = event_forwarder_filtered(
-        target, entities_filter, entity_ids, device_ids
-    )
-    subscriptions.extend(
-        hass.bus.async_listen(event_type, event_forwarder) for event_type in event_types
-    )
-
-    if device_ids and not entity_ids:
-        # No entities to subscribe to but we are filtering
-        # on device ids so we do not want to get any state
-        # changed events
-        return
-
-    @callback
-    def _forward_state_events_filtered(event: Event[EventStateChangedData]) -> None:
-        if (old_state := event.data["old_state"]) is None or (
-            new_state := event.data["new_state"]
-        ) is None:
-            return
-        if _is_state_filtered(new_state, old_state) or (
-            entities_filter and not entities_filter(new_state.entity_id)
-        ):
-            return
-        target(event)
-
-    if entity_ids:
-        subscriptions.append(
-            async_track_state_change_event(
-                hass, entity_ids, _forward_state_events_filtered
-            )
-        )
-        return
-
-    # We want the firehose
-    subscriptions.append(
-        hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _forward_state_events_filtered,
-        )
-    )
-
-
 def is_sensor_continuous(
     hass: HomeAssistant, ent_reg: er.EntityRegistry, entity_id: str
 ) -> bool:
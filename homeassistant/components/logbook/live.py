@@ -0,0 +1,255 @@
+"""Shared live event hub for logbook streams."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.event_type import EventType
+
+from .const import DOMAIN
+from .helpers import _is_state_filtered, extract_attr
+from .models import LogbookConfig, async_event_to_row
+from .processor import EventProcessor
+
+type LiveTarget = Callable[[float, bytes], None]
+
+
+@dataclass(slots=True, eq=False)
+class LogbookLiveSubscriber:
+    """A logbook stream subscribed to the live hub."""
+
+    target: LiveTarget
+    event_types: frozenset[EventType[Any] | str]
+    entity_ids: frozenset[str]
+    device_ids: frozenset[str]
+
+    @property
+    def unfiltered(self) -> bool:
+        """Return True if the subscriber is not limited to entities or devices."""
+        return not self.entity_ids and not self.device_ids
+
+    @property
+    def wants_states(self) -> bool:
+        """Return True if the subscriber receives state changes."""
+        return bool(self.entity_ids or not self.device_ids)
+
+
+@callback
+def async_get_live_hub(hass: HomeAssistant) -> LogbookLiveHub:
+    """Return the shared live hub, creating it if needed."""
+    logbook_config: LogbookConfig = hass.data[DOMAIN]
+    if logbook_config.live_hub is None:
+        logbook_config.live_hub = LogbookLiveHub(hass, logbook_config)
+    return logbook_config.live_hub
+
+
+class LogbookLiveHub:
+    """Humanify live events once and fan them out to matching subscribers.
+
+    Subscribers are indexed by the entity ids and device ids they are limited
+    to, so the cost of an event does not scale with the number of open streams.
+    Each event is humanified and serialized to JSON once, and the resulting
+    bytes are handed to every matching subscriber.
+    """
+
+    def __init__(self, hass: HomeAssistant, logbook_config: LogbookConfig) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._entities_filter = logbook_config.entity_filter
+        self._event_processor: EventProcessor | None = None
+        self._unfiltered: set[LogbookLiveSubscriber] = set()
+        self._by_entity_id: defaultdict[str, set[LogbookLiveSubscriber]] = defaultdict(
+            set
+        )
+        self._by_device_id: defaultdict[str, set[LogbookLiveSubscriber]] = defaultdict(
+            set
+        )
+        self._event_type_refs: dict[EventType[Any] | str, int] = {}
+        self._event_type_unsubs: dict[EventType[Any] | str, CALLBACK_TYPE] = {}
+        self._state_refs = 0
+        self._state_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        target: LiveTarget,
+        event_types: tuple[EventType[Any] | str, ...],
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a stream to the hub and return a callback to unsubscribe."""
+        subscriber = LogbookLiveSubscriber(
+            target,
+            frozenset(event_types),
+            frozenset(entity_ids or ()),
+            frozenset(device_ids or ()),
+        )
+        if subscriber.unfiltered:
+            self._unfiltered.add(subscriber)
+        for entity_id in subscriber.entity_ids:
+            self._by_entity_id[entity_id].add(subscriber)
+        for device_id in subscriber.device_ids:
+            self._by_device_id[device_id].add(subscriber)
+        for event_type in subscriber.event_types:
+            self._async_ref_event_type(event_type)
+        if subscriber.wants_states:
+            self._state_refs += 1
+            if self._state_unsub is None:
+                self._state_unsub = self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, self._async_handle_state_event
+                )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            self._async_unsubscribe(subscriber)
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_unsubscribe(self, subscriber: LogbookLiveSubscriber) -> None:
+        """Remove a subscriber and any listeners no longer needed."""
+        self._unfiltered.discard(subscriber)
+        for index, keys in (
+            (self._by_entity_id, subscriber.entity_ids),
+            (self._by_device_id, subscriber.device_ids),
+        ):
+            for key in keys:
+                index[key].discard(subscriber)
+                if not index[key]:
+                    del index[key]
+        for event_type in subscriber.event_types:
+            self._async_unref_event_type(event_type)
+        if subscriber.wants_states:
+            self._state_refs -= 1
+            if not self._state_refs and self._state_unsub:
+                self._state_unsub()
+                self._state_unsub = None
+        if not self._event_type_unsubs and self._state_unsub is None:
+            # Release the caches of the processor when nobody is listening
+            self._event_processor = None
+
+    @callback
+    def _async_ref_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Listen to an event type while any subscriber needs it."""
+        self._event_type_refs[event_type] = self._event_type_refs.get(event_type, 0) + 1
+        if event_type not in self._event_type_unsubs:
+            self._event_type_unsubs[event_type] = self.hass.bus.async_listen(
+                event_type, self._async_handle_event
+            )
+
+    @callback
+    def _async_unref_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Stop listening to an event type once no subscriber needs it."""
+        self._event_type_refs[event_type] -= 1
+        if not self._event_type_refs[event_type]:
+            del self._event_type_refs[event_type]
+            self._event_type_unsubs.pop(event_type)()
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Dispatch a non state event to matching subscribers."""
+        event_type = event.event_type
+        event_data = event.data
+        entity_ids = extract_attr(event_data, ATTR_ENTITY_ID)
+        targets: set[LogbookLiveSubscriber] = set()
+
+        if self._unfiltered and self._passes_entities_filter(event_data, entity_ids):
+            targets.update(self._unfiltered)
+        for entity_id in entity_ids:
+            if subscribers := self._by_entity_id.get(entity_id):
+                targets.update(subscribers)
+        if self._by_device_id:
+            for device_id in extract_attr(event_data, ATTR_DEVICE_ID):
+                if subscribers := self._by_device_id.get(device_id):
+                    targets.update(subscribers)
+
+        self._async_dispatch(
+            event,
+            [
+                subscriber
+                for subscriber in targets
+                if event_type in subscriber.event_types
+            ],
+        )
+
+    def _passes_entities_filter(
+        self, event_data: dict[str, Any], entity_ids: list[str]
+    ) -> bool:
+        """Check the logbook entity filter the same way as unfiltered streams."""
+        if (entities_filter := self._entities_filter) is None:
+            return True
+        if entity_ids and not any(
+            entities_filter(entity_id) for entity_id in entity_ids
+        ):
+            return False
+        domain = event_data.get(ATTR_DOMAIN)
+        return not domain or entities_filter(f"{domain}._")
+
+    @callback
+    def _async_handle_state_event(self, event: Event[EventStateChangedData]) -> None:
+        """Dispatch a state change to matching subscribers."""
+        entity_id = event.data["entity_id"]
+        entity_subscribers = self._by_entity_id.get(entity_id)
+        if not self._unfiltered and not entity_subscribers:
+            return
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if _is_state_filtered(new_state, old_state):
+            return
+
+        targets: set[LogbookLiveSubscriber] = set()
+        if self._unfiltered and (
+            self._entities_filter is None or self._entities_filter(entity_id)
+        ):
+            targets.update(self._unfiltered)
+        if entity_subscribers:
+            # Device subscribers only get state changes if they also track entities
+            targets.update(
+                subscriber
+                for subscriber in entity_subscribers
+                if subscriber.wants_states
+            )
+        self._async_dispatch(event, targets)
+
+    @callback
+    def _async_dispatch(
+        self,
+        event: Event[Any],
+        targets: list[LogbookLiveSubscriber] | set[LogbookLiveSubscriber],
+    ) -> None:
+        """Humanify and serialize an event once and hand it to the targets."""
+        if not targets:
+            return
+        if self._event_processor is None:
+            self._event_processor = EventProcessor(
+                self.hass,
+                (),
+                timestamp=True,
+                include_entity_name=False,
+            )
+            self._event_processor.switch_to_live()
+        entries = self._event_processor.humanify((async_event_to_row(event),))
+        time_fired_timestamp = event.time_fired_timestamp
+        for entry in entries:
+            entry_bytes = json_bytes(entry)
+            for subscriber in targets:
+                subscriber.target(time_fired_timestamp, entry_bytes)
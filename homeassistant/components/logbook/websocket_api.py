@@ -15,19 +15,14 @@ from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
-from .helpers import (
-    async_determine_event_types,
-    async_filter_entities,
-    async_subscribe_events,
-)
-from .models import LogbookConfig, async_event_to_row
+from .helpers import async_determine_event_types, async_filter_entities
+from .live import async_get_live_hub
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -44,7 +39,7 @@ _LOGGER = logging.getLogger(__name__)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_queue: asyncio.Queue[tuple[float, bytes]]
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
@@ -218,38 +213,34 @@ async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    event_processor: EventProcessor,
+    stream_queue: asyncio.Queue[tuple[float, bytes]],
 ) -> None:
-    """Stream events from the queue."""
+    """Stream events from the queue.
+
+    The queue holds logbook entries that were already humanified and
+    serialized by the live hub, so they only need to be joined into
+    the event message.
+    """
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
+    message_prefix = b'{"id":%d,"type":"event","event":{"events":[' % msg_id
     while True:
-        events: list[Event] = [await stream_queue.get()]
+        time_fired_timestamp, entry = await stream_queue.get()
         # If the event is older than the last db
         # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
+        if time_fired_timestamp <= subscriptions_setup_complete_timestamp:
             continue
+        entries: list[bytes] = [entry]
         # We sleep for the EVENT_COALESCE_TIME so
         # we can group events together to minimize
         # the number of websocket messages when the
         # system is overloaded with an event storm
         await asyncio.sleep(EVENT_COALESCE_TIME)
         while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
-                    )
-                )
-            )
+            entries.append(stream_queue.get_nowait()[1])
+
+        connection.send_message(b"".join((message_prefix, b",".join(entries), b"]}}")))
 
 
 @websocket_api.websocket_command(
@@ -325,7 +316,9 @@ async def ws_event_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
+    stream_queue: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue(
+        MAX_PENDING_LOGBOOK_EVENTS
+    )
     live_stream = LogbookLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -350,10 +343,10 @@ async def ws_event_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
+    def _queue_or_cancel(time_fired_timestamp: float, entry: bytes) -> None:
+        """Queue a logbook entry to be sent or cancel."""
         try:
-            stream_queue.put_nowait(event)
+            stream_queue.put_nowait((time_fired_timestamp, entry))
         except asyncio.QueueFull:
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
@@ -361,19 +354,10 @@ async def ws_event_stream(
             )
             _unsub()
 
-    entities_filter: Callable[[str], bool] | None = None
-    if not event_processor.limited_select:
-        logbook_config: LogbookConfig = hass.data[DOMAIN]
-        entities_filter = logbook_config.entity_filter
-
-    async_subscribe_events(
-        hass,
-        subscriptions,
-        _queue_or_cancel,
-        event_types,
-        entities_filter,
-        entity_ids,
-        device_ids,
+    subscriptions.append(
+        async_get_live_hub(hass).async_subscribe(
+            _queue_or_cancel, event_types, entity_ids, device_ids
+        )
     )
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
@@ -405,7 +389,6 @@ async def ws_event_stream(
             connection,
             msg_id,
             stream_queue,
-            event_processor,
         )
     )
 
@@ -11,6 +11,7 @@ import time
 import voluptuous as vol
 
 from homeassistant.components.frontend import DATA_PANELS
+from homeassistant.config import DATA_YAML_CACHE
 from homeassistant.const import CONF_FILENAME
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
@@ -204,7 +205,9 @@ class LovelaceYAML(LovelaceConfig):
 
         try:
             config = load_yaml_dict(
-                self.path, Secrets(Path(self.hass.config.config_dir))
+                self.path,
+                Secrets(Path(self.hass.config.config_dir)),
+                cache=self.hass.data.get(DATA_YAML_CACHE),
             )
         except FileNotFoundError:
             raise ConfigNotFound from None
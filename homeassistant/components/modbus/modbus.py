@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import namedtuple
 from collections.abc import Callable
+from dataclasses import dataclass, field
 import logging
 from typing import Any
 
@@ -14,7 +15,7 @@ from pymodbus.client import (
     AsyncModbusUdpClient,
 )
 from pymodbus.exceptions import ModbusException
-from pymodbus.pdu import ModbusResponse
+from pymodbus.pdu import ExceptionResponse, ModbusResponse
 from pymodbus.transaction import ModbusAsciiFramer, ModbusRtuFramer, ModbusSocketFramer
 import voluptuous as vol
 
@@ -78,6 +79,75 @@ _LOGGER = logging.getLogger(__name__)
 
 ConfEntry = namedtuple("ConfEntry", "call_type attr func_name")
 RunEntry = namedtuple("RunEntry", "attr func")
+
+# Largest number of registers or bits in a single read request and largest
+# number of unused registers or bits read to merge two requests into one block
+READ_BLOCK_LIMITS: dict[str, tuple[int, int]] = {
+    CALL_TYPE_COIL: (2000, 16),
+    CALL_TYPE_DISCRETE: (2000, 16),
+    CALL_TYPE_REGISTER_HOLDING: (125, 4),
+    CALL_TYPE_REGISTER_INPUT: (125, 4),
+}
+
+
+@dataclass(slots=True)
+class ModbusReadResult:
+    """Part of a block read, with the values of one read request."""
+
+    registers: list[int]
+    bits: list[bool]
+
+
+@dataclass(slots=True)
+class PendingRead:
+    """Read request waiting for the hub."""
+
+    slave: int | None
+    use_call: str
+    address: int
+    count: int
+    future: asyncio.Future[ModbusResponse | ModbusReadResult | None]
+
+
+@dataclass(slots=True)
+class ReadBlock:
+    """Read requests served by reading one block of registers or bits."""
+
+    slave: int | None
+    use_call: str
+    address: int
+    count: int
+    reads: list[PendingRead] = field(default_factory=list)
+
+
+def plan_read_blocks(
+    reads: list[PendingRead], no_merge: set[tuple[int | None, str]]
+) -> list[ReadBlock]:
+    """Merge adjacent and overlapping read requests of a device into blocks."""
+    groups: dict[tuple[int | None, str], list[PendingRead]] = {}
+    for read in reads:
+        groups.setdefault((read.slave, read.use_call), []).append(read)
+    blocks: list[ReadBlock] = []
+    for (slave, use_call), group in groups.items():
+        max_count, max_gap = READ_BLOCK_LIMITS[use_call]
+        merge = (slave, use_call) not in no_merge
+        block: ReadBlock | None = None
+        for read in sorted(group, key=lambda read: read.address):
+            end = read.address + read.count
+            if (
+                merge
+                and block is not None
+                and read.address <= block.address + block.count + max_gap
+                and max(end - block.address, block.count) <= max_count
+            ):
+                block.count = max(end - block.address, block.count)
+            else:
+                block = ReadBlock(slave, use_call, read.address, read.count)
+                blocks.append(block)
+            block.reads.append(read)
+    return blocks
+
+
 PB_CALL = [
     ConfEntry(
         CALL_TYPE_COIL,
@@ -277,6 +347,8 @@ class ModbusHub:
         self._async_cancel_listener: Callable[[], None] | None = None
         self._in_error = False
         self._lock = asyncio.Lock()
+        self._pending_reads: list[PendingRead] = []
+        self._no_merge: set[tuple[int | None, str]] = set()
         self.hass = hass
         self.name = client_config[CONF_NAME]
         self._config_type = client_config[CONF_TYPE]
@@ -430,10 +502,12 @@ class ModbusHub:
         address: int,
         value: int | list[int],
         use_call: str,
-    ) -> ModbusResponse | None:
+    ) -> ModbusResponse | ModbusReadResult | None:
         """Convert async to sync pymodbus call."""
         if self._config_delay:
             return None
+        if use_call in READ_BLOCK_LIMITS and isinstance(value, int):
+            return await self._async_pb_read(unit, address, value, use_call)
         async with self._lock:
             if not self._client:
                 return None
@@ -442,3 +516,96 @@ class ModbusHub:
                 # small delay until next request/response
                 await asyncio.sleep(self._msg_wait)
             return result
+
+    async def _async_pb_read(
+        self, unit: int | None, address: int, count: int, use_call: str
+    ) -> ModbusResponse | ModbusReadResult | None:
+        """Read registers or bits, merged with other reads waiting for the hub.
+
+        Reads requested while the hub is busy are queued, the first of them
+        to get the lock reads all queued requests in as few blocks as possible.
+        """
+        read = PendingRead(
+            unit, use_call, address, count, self.hass.loop.create_future()
+        )
+        self._pending_reads.append(read)
+        async with self._lock:
+            if not read.future.done():
+                await self._async_process_reads()
+        return read.future.result()
+
+    async def _async_process_reads(self) -> None:
+        """Read all queued requests and hand out the results."""
+        reads, self._pending_reads = self._pending_reads, []
+        try:
+            for block in plan_read_blocks(reads, self._no_merge):
+                if not self._client:
+                    for read in block.reads:
+                        read.future.set_result(None)
+                    continue
+                if len(block.reads) == 1:
+                    await self._async_read_single(block.reads[0])
+                else:
+                    await self._async_read_block(block)
+        finally:
+            # Requeue the requests not served when cancelled
+            self._pending_reads[:0] = [read for read in reads if not read.future.done()]
+
+    async def _async_read_single(self, read: PendingRead) -> ModbusResponse | None:
+        """Read a single request."""
+        result = await self.low_level_pb_call(
+            read.slave, read.address, read.count, read.use_call
+        )
+        if self._msg_wait:
+            # small delay until next request/response
+            await asyncio.sleep(self._msg_wait)
+        read.future.set_result(result)
+        return result
+
+    async def _async_read_block(self, block: ReadBlock) -> None:
+        """Read a block and split it into the results of its requests."""
+        entry = self._pb_request[block.use_call]
+        kwargs = {"slave": block.slave} if block.slave else {}
+        result: ModbusResponse | ModbusException | None
+        try:
+            result = await entry.func(block.address, block.count, **kwargs)
+        except ModbusException as exception_error:
+            # Timeouts and connection errors are not a reason to stop merging
+            result = exception_error
+        if self._msg_wait:
+            await asyncio.sleep(self._msg_wait)
+        if isinstance(result, ExceptionResponse):
+            # The device may not allow reading the unused addresses or the
+            # block size, read the requests one by one and stop merging
+            # them if that works
+            _LOGGER.debug(
+                "Pymodbus: %s: device %s: reading %s block of %s at %s failed with"
+                " %s, reading requests separately",
+                self.name,
+                block.slave,
+                block.use_call,
+                block.count,
+                block.address,
+                result,
+            )
+            served = False
+            for read in block.reads:
+                served |= await self._async_read_single(read) is not None
+            if served:
+                self._no_merge.add((block.slave, block.use_call))
+            return
+        values = getattr(result, entry.attr, None)
+        if values is None or len(values) < block.count:
+            error = f"Error: device: {block.slave} address: {block.address} -> {result!s}"
+            self._log_error(error)
+            for read in block.reads:
+                read.future.set_result(None)
+            return
+        self._in_error = False
+        for read in block.reads:
+            offset = read.address - block.address
+            part = list(values[offset : offset + read.count])
+            if entry.attr == "bits":
+                read.future.set_result(ModbusReadResult([], part))
+            else:
+                read.future.set_result(ModbusReadResult(part, []))
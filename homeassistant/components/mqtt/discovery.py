@@ -84,7 +84,7 @@ SUPPORTED_COMPONENTS = {
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_NEW_COMPONENT = "mqtt_discovery_new_component"
@@ -152,6 +152,53 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = get_mqtt_data(hass)
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    new_discovered: dict[str, list[MQTTDiscoveryPayload]] = {}
+    batch_task: asyncio.Task[None] | None = None
+
+    @callback
+    def _async_add_new_discovered(
+        component: str, discovery_payload: MQTTDiscoveryPayload
+    ) -> None:
+        """Set up a new item, batch the items discovered right after it."""
+        nonlocal batch_task
+        if batch_task is None:
+            batch_task = config_entry.async_create_task(
+                hass,
+                _async_setup_new_discovered(),
+                "mqtt discovery batch",
+                eager_start=False,
+            )
+            _async_dispatch_new_discovered(component, [discovery_payload])
+            return
+        new_discovered.setdefault(component, []).append(discovery_payload)
+        mqtt_data.discovery_pending_new += 1
+
+    async def _async_setup_new_discovered() -> None:
+        """Set up the queued new items, one batch per platform."""
+        nonlocal batch_task
+        batch_task = None
+        batches = new_discovered.copy()
+        new_discovered.clear()
+        for component, discovery_payloads in batches.items():
+            mqtt_data.discovery_pending_new -= len(discovery_payloads)
+            _async_dispatch_new_discovered(component, discovery_payloads)
+
+    @callback
+    def _async_dispatch_new_discovered(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Dispatch a batch of new items to their platform."""
+        mqtt_data.discovery_batches += 1
+        mqtt_data.discovery_batched_items += len(discovery_payloads)
+        _LOGGER.debug(
+            "Setting up %s discovered %s items, %s items pending",
+            len(discovery_payloads),
+            component,
+            mqtt_data.discovery_pending_new,
+        )
+        async_dispatcher_send(
+            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
+        )
 
     async def _async_component_setup(discovery_payload: MQTTDiscoveryPayload) -> None:
         """Perform component set up."""
@@ -167,9 +214,7 @@ async def async_start(  # noqa: C901
         message = f"Found new component: {component} {discovery_id}"
         async_log_discovery_origin_info(message, discovery_payload)
         mqtt_data.discovery_already_discovered.add(discovery_hash)
-        async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
-        )
+        _async_add_new_discovered(component, discovery_payload)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -353,9 +398,7 @@ async def async_start(  # noqa: C901
             message = f"Found new component: {component} {discovery_id}"
             async_log_discovery_origin_info(message, payload)
             mqtt_data.discovery_already_discovered.add(discovery_hash)
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
-            )
+            _async_add_new_discovered(component, payload)
         else:
             # Unhandled discovery message
             async_dispatcher_send(
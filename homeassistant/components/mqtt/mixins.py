@@ -278,40 +278,55 @@ def async_handle_schema_error(
 async def _async_discover(
     hass: HomeAssistant,
     domain: str,
-    setup: Callable[[MQTTDiscoveryPayload], None] | None,
+    setup: Callable[[MQTTDiscoveryPayload], Entity] | None,
     async_setup: Callable[[MQTTDiscoveryPayload], Coroutine[Any, Any, None]] | None,
-    discovery_payload: MQTTDiscoveryPayload,
+    async_add_entities: AddEntitiesCallback | None,
+    discovery_payloads: list[MQTTDiscoveryPayload],
 ) -> None:
-    """Discover and add an MQTT entity, automation or tag.
+    """Discover and add a batch of MQTT entities, automations or tags.
 
-    setup is to be run in the event loop when there is nothing to be awaited.
+    setup is to be run in the event loop when there is nothing to be awaited,
+    it returns the entity to add. The entities of the batch are added at once.
     """
     if not mqtt_config_entry_enabled(hass):
-        _LOGGER.warning(
-            (
-                "MQTT integration is disabled, skipping setup of discovered item "
-                "MQTT %s, payload %s"
-            ),
-            domain,
-            discovery_payload,
-        )
+        for discovery_payload in discovery_payloads:
+            _LOGGER.warning(
+                (
+                    "MQTT integration is disabled, skipping setup of discovered item "
+                    "MQTT %s, payload %s"
+                ),
+                domain,
+                discovery_payload,
+            )
         return
-    discovery_data = discovery_payload.discovery_data
-    try:
-        if setup is not None:
-            setup(discovery_payload)
-        elif async_setup is not None:
-            await async_setup(discovery_payload)
-    except vol.Invalid as err:
-        discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
-        clear_discovery_hash(hass, discovery_hash)
-        async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None)
-        async_handle_schema_error(discovery_payload, err)
-    except Exception:
-        discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+
+    @callback
+    def _async_discovery_failed(discovery_payload: MQTTDiscoveryPayload) -> None:
+        """Clear the discovery hash of an item that could not be set up."""
+        discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
         clear_discovery_hash(hass, discovery_hash)
         async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None)
-        raise
+
+    entities: list[Entity] = []
+    try:
+        for index, discovery_payload in enumerate(discovery_payloads):
+            try:
+                if setup is not None:
+                    entities.append(setup(discovery_payload))
+                elif async_setup is not None:
+                    await async_setup(discovery_payload)
+            except vol.Invalid as err:
+                _async_discovery_failed(discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                # Give up on the rest of the batch, the entities
+                # created so far are still added
+                for failed_payload in discovery_payloads[index:]:
+                    _async_discovery_failed(failed_payload)
+                raise
+    finally:
+        if entities and async_add_entities is not None:
+            async_add_entities(entities)
 
 
 class _SetupNonEntityHelperCallbackProtocol(Protocol):  # pragma: no cover
@@ -343,7 +358,7 @@ async def async_setup_non_entity_entry_helper(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
             functools.partial(
-                _async_discover, hass, domain, None, async_setup_from_discovery
+                _async_discover, hass, domain, None, async_setup_from_discovery, None
             ),
         )
     )
@@ -365,24 +380,27 @@ async def async_setup_entity_entry_helper(
     @callback
     def async_setup_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
-    ) -> None:
-        """Set up an MQTT entity from discovery."""
+    ) -> Entity:
+        """Create an MQTT entity from discovery."""
         nonlocal entity_class
         config: DiscoveryInfoType = discovery_schema(discovery_payload)
         if schema_class_mapping is not None:
             entity_class = schema_class_mapping[config[CONF_SCHEMA]]
         if TYPE_CHECKING:
             assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-        )
+        return entity_class(hass, config, entry, discovery_payload.discovery_data)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
             functools.partial(
-                _async_discover, hass, domain, async_setup_from_discovery, None
+                _async_discover,
+                hass,
+                domain,
+                async_setup_from_discovery,
+                None,
+                async_add_entities,
             ),
         )
     )
@@ -18,6 +18,8 @@ from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.start import async_at_start
 from homeassistant.helpers.typing import ConfigType
 
+from .publisher import StateStreamPublisher
+
 CONF_BASE_TOPIC = "base_topic"
 CONF_PUBLISH_ATTRIBUTES = "publish_attributes"
 CONF_PUBLISH_TIMESTAMPS = "publish_timestamps"
@@ -55,38 +57,31 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if not base_topic.endswith("/"):
         base_topic = f"{base_topic}/"
 
-    async def _state_publisher(evt: Event[EventStateChangedData]) -> None:
+    publisher = StateStreamPublisher(hass)
+
+    @callback
+    def _state_publisher(evt: Event[EventStateChangedData]) -> None:
         entity_id = evt.data["entity_id"]
         new_state = evt.data["new_state"]
         assert new_state
 
-        payload = new_state.state
-
         mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
-        await mqtt.async_publish(hass, f"{mybase}state", payload, 1, True)
+        publisher.async_queue(f"{mybase}state", new_state.state, False)
 
         if publish_timestamps:
             if new_state.last_updated:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_updated",
-                    new_state.last_updated.isoformat(),
-                    1,
-                    True,
+                publisher.async_queue(
+                    f"{mybase}last_updated", new_state.last_updated.isoformat(), False
                 )
             if new_state.last_changed:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_changed",
-                    new_state.last_changed.isoformat(),
-                    1,
-                    True,
+                publisher.async_queue(
+                    f"{mybase}last_changed", new_state.last_changed.isoformat(), False
                 )
 
         if publish_attributes:
             for key, val in new_state.attributes.items():
                 encoded_val = json.dumps(val, cls=JSONEncoder)
-                await mqtt.async_publish(hass, mybase + key, encoded_val, 1, True)
+                publisher.async_queue(mybase + key, encoded_val, True)
 
     @callback
     def _ha_started(hass: HomeAssistant) -> None:
@@ -100,6 +95,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 return False
             return True
 
+        publisher.async_start()
         callback_handler = hass.bus.async_listen(
             EVENT_STATE_CHANGED, _state_publisher, _event_filter
         )
@@ -107,6 +103,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         @callback
         def _ha_stopping(_: Event) -> None:
             callback_handler()
+            publisher.async_stop()
 
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _ha_stopping)
 
@@ -0,0 +1,151 @@
+"""Coalesce and batch the messages published by the MQTT state feed."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.components import mqtt
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of messages handed to the MQTT client per second, messages
+# above the limit stay queued and are coalesced with newer values
+MAX_PUBLISHES_PER_SECOND = 1000
+
+
+class StateStreamPublisher:
+    """Queue of retained messages, published in batches.
+
+    Messages queued in the same event loop iteration are published together,
+    a newer payload for a topic replaces a queued one. Attribute topics are
+    skipped when the payload is the same as the last published one, until
+    the connection to the broker is lost.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the publisher."""
+        self.hass = hass
+        self.published = 0
+        self.coalesced = 0
+        self.unchanged = 0
+        self._pending: dict[str, str] = {}
+        self._last_published: dict[str, str] = {}
+        self._flush_scheduled = False
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._window_start = 0.0
+        self._window_count = 0
+        self._unsub_connection_status: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking the connection to the broker."""
+        self._unsub_connection_status = mqtt.async_subscribe_connection_status(
+            self.hass, self._async_connection_status
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Publish all queued messages and stop."""
+        if self._unsub_connection_status:
+            self._unsub_connection_status()
+            self._unsub_connection_status = None
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+            self._flush_scheduled = False
+        self._async_publish_pending(len(self._pending))
+
+    @callback
+    def _async_connection_status(self, connected: bool) -> None:
+        """Forget published payloads, the broker may have lost them."""
+        if not connected:
+            self._last_published.clear()
+
+    @callback
+    def async_queue(self, topic: str, payload: str, skip_unchanged: bool) -> None:
+        """Queue a retained message."""
+        if skip_unchanged and self._last_published.get(topic) == payload:
+            self.unchanged += 1
+            return
+        if topic in self._pending:
+            self.coalesced += 1
+        self._pending[topic] = payload
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.hass.async_create_task(
+                self._async_flush(), "mqtt_statestream flush", eager_start=False
+            )
+
+    async def _async_flush(self) -> None:
+        """Publish queued messages within the rate limit."""
+        now = self.hass.loop.time()
+        if now - self._window_start >= 1:
+            self._async_start_window(now)
+        self._async_publish_window()
+
+    @callback
+    def _async_flush_delayed(self) -> None:
+        """Publish messages delayed by the rate limit in a new window."""
+        self._flush_timer = None
+        self._async_start_window(self.hass.loop.time())
+        self._async_publish_window()
+
+    @callback
+    def _async_start_window(self, now: float) -> None:
+        """Start a new rate limit window."""
+        self._window_start = now
+        self._window_count = 0
+
+    @callback
+    def _async_publish_window(self) -> None:
+        """Publish as many queued messages as the current window allows."""
+        count = min(
+            len(self._pending), max(MAX_PUBLISHES_PER_SECOND - self._window_count, 0)
+        )
+        self._window_count += count
+        self._async_publish_pending(count)
+        if not self._pending:
+            self._flush_scheduled = False
+            return
+        _LOGGER.debug("Rate limit reached, delaying %s messages", len(self._pending))
+        self._flush_timer = self.hass.loop.call_at(
+            self._window_start + 1, self._async_flush_delayed
+        )
+
+    @callback
+    def _async_publish_pending(self, count: int) -> None:
+        """Publish the oldest queued messages."""
+        if not count:
+            return
+        pending = self._pending
+        batch = [(topic, pending.pop(topic)) for topic in list(pending)[:count]]
+        self._last_published.update(batch)
+        self.published += count
+        self.hass.async_create_task(
+            self._async_publish_batch(batch), "mqtt_statestream publish"
+        )
+
+    async def _async_publish_batch(self, batch: list[tuple[str, str]]) -> None:
+        """Hand a batch of messages to the MQTT client at once."""
+        results = await asyncio.gather(
+            *(
+                mqtt.async_publish(self.hass, topic, payload, 1, True)
+                for topic, payload in batch
+            ),
+            return_exceptions=True,
+        )
+        for (topic, _), result in zip(batch, results, strict=True):
+            if isinstance(result, HomeAssistantError):
+                self._last_published.pop(topic, None)
+                _LOGGER.error("Failed to publish to %s: %s", topic, result)
+            elif isinstance(result, BaseException):
+                raise result
+        _LOGGER.debug(
+            "Published %s messages, %s coalesced and %s unchanged so far",
+            len(batch),
+            self.coalesced,
+            self.unchanged,
+        )
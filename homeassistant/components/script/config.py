@@ -39,6 +39,10 @@ from homeassistant.helpers.script import (
 )
 from homeassistant.helpers.selector import validate_selector
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config_cache import (
+    ValidatedConfigCache,
+    async_get_validated_config_cache,
+)
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -110,8 +114,12 @@ async def _async_validate_config_item(
     config: ConfigType,
     raise_on_errors: bool,
     warn_on_errors: bool,
+    validated_config_cache: ValidatedConfigCache[ScriptConfig] | None = None,
 ) -> ScriptConfig:
-    """Validate config item."""
+    """Validate config item.
+
+    If a cache is passed, configs which were validated before are taken from it.
+    """
     raw_config = None
     raw_blueprint_inputs = None
     uses_blueprint = False
@@ -196,6 +204,16 @@ async def _async_validate_config_item(
     except vol.Invalid as err:
         _log_invalid_script(err, script_name, "has invalid object id", object_id)
         raise
+
+    cache_key = None
+    if validated_config_cache is not None:
+        cache_key = validated_config_cache.async_key(config)
+        if (cached_config := validated_config_cache.async_get(cache_key)) is not None:
+            script_config = ScriptConfig(cached_config)
+            script_config.raw_blueprint_inputs = raw_blueprint_inputs
+            script_config.raw_config = raw_config
+            return script_config
+
     try:
         validated_config = SCRIPT_ENTITY_SCHEMA(config)
     except vol.Invalid as err:
@@ -224,6 +242,8 @@ async def _async_validate_config_item(
         script_config.validation_failed = True
         return script_config
 
+    if validated_config_cache is not None:
+        validated_config_cache.async_set(cache_key, script_config)
     return script_config
 
 
@@ -239,10 +259,13 @@ async def _try_async_validate_config_item(
     hass: HomeAssistant,
     object_id: str,
     config: ConfigType,
+    validated_config_cache: ValidatedConfigCache[ScriptConfig] | None = None,
 ) -> ScriptConfig | None:
     """Validate config item."""
     try:
-        return await _async_validate_config_item(hass, object_id, config, False, True)
+        return await _async_validate_config_item(
+            hass, object_id, config, False, True, validated_config_cache
+        )
     except (vol.Invalid, HomeAssistantError):
         return None
 
@@ -257,16 +280,24 @@ async def async_validate_config_item(
 
 
 async def async_validate_config(hass, config):
-    """Validate config."""
+    """Validate config.
+
+    Scripts which did not change since the previous validation are taken from
+    the validated config cache.
+    """
+    validated_config_cache = async_get_validated_config_cache(hass, DOMAIN)
     scripts = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
+            cfg = await _try_async_validate_config_item(
+                hass, object_id, cfg, validated_config_cache
+            )
             if cfg is not None:
                 scripts[object_id] = cfg
+    validated_config_cache.async_prune()
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
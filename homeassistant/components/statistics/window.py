@@ -0,0 +1,235 @@
+"""Rolling window of samples with incrementally maintained aggregates."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+import math
+
+# Rebuild the running sums from scratch after this many removals (or the
+# window size if larger) to keep floating point drift bounded
+MIN_REMOVALS_BEFORE_RESYNC = 1000
+
+
+class SampleWindow:
+    """Samples in the statistics window and aggregates over them.
+
+    Samples are appended to the end and removed from the front, so sums are
+    kept up to date on every change, minimum and maximum are tracked with
+    monotonic queues and a sorted copy of the values is kept for order
+    statistics. Adding or removing a sample does not iterate the window.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the window."""
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque(maxlen=max_size)
+        self.ages: deque[datetime] = deque(maxlen=max_size)
+        self.sorted_states: list[float | bool] = []
+        self.count_true = 0
+        self.area_linear = 0.0
+        self.area_step = 0.0
+        self.sum_differences = 0.0
+        self.sum_differences_nonnegative = 0.0
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+        # Mean and sum of squared differences from the mean (Welford)
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Monotonic queues of (sequence, value), the front holds the oldest
+        # occurrence of the maximum or minimum value in the window
+        self._max_queue: deque[tuple[int, float | bool]] = deque()
+        self._min_queue: deque[tuple[int, float | bool]] = deque()
+        self._first_seq = 0
+        self._removals = 0
+        self._deferred = False
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    @contextmanager
+    def defer_aggregates(self) -> Generator[None, None, None]:
+        """Only store samples while active and calculate aggregates at the end.
+
+        Used when loading many samples at once, e.g. from the database.
+        """
+        self._deferred = True
+        try:
+            yield
+        finally:
+            self._deferred = False
+            self._rebuild()
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the end of the window."""
+        if self._deferred:
+            if self.max_size is not None and len(self.states) == self.max_size:
+                self._first_seq += 1
+            self.states.append(value)
+            self.ages.append(age)
+            return
+        if self.max_size is not None and len(self.states) == self.max_size:
+            self.popleft()
+        if self.states:
+            self._add_pair(self.states[-1], self.ages[-1], value, age, 1)
+        seq = self._first_seq + len(self.states)
+        self.states.append(value)
+        self.ages.append(age)
+        delta = value - self._mean
+        self._mean += delta / len(self.states)
+        self._m2 += delta * (value - self._mean)
+        self._add_value(value, 1)
+        insort(self.sorted_states, value)
+        max_queue = self._max_queue
+        while max_queue and max_queue[-1][1] < value:
+            max_queue.pop()
+        max_queue.append((seq, value))
+        min_queue = self._min_queue
+        while min_queue and min_queue[-1][1] > value:
+            min_queue.pop()
+        min_queue.append((seq, value))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        if len(self.states) >= 2:
+            self._add_pair(
+                self.states[0], self.ages[0], self.states[1], self.ages[1], -1
+            )
+        value = self.states.popleft()
+        self.ages.popleft()
+        if self._max_queue[0][0] == self._first_seq:
+            self._max_queue.popleft()
+        if self._min_queue[0][0] == self._first_seq:
+            self._min_queue.popleft()
+        self._first_seq += 1
+        del self.sorted_states[bisect_left(self.sorted_states, value)]
+        if self.states:
+            delta = value - self._mean
+            self._mean -= delta / len(self.states)
+            self._m2 -= delta * (value - self._mean)
+        self._add_value(value, -1)
+        self._removals += 1
+        if not self.states or self._removals > max(
+            len(self.states), MIN_REMOVALS_BEFORE_RESYNC
+        ):
+            self._rebuild()
+
+    def _add_value(self, value: float | bool, sign: int) -> None:
+        """Add or remove a value from the running sums."""
+        self.count_true += sign * (value is True)
+        radians = math.radians(value)
+        self.sin_sum += sign * math.sin(radians)
+        self.cos_sum += sign * math.cos(radians)
+
+    def _add_pair(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+        sign: int,
+    ) -> None:
+        """Add or remove the contribution of two consecutive samples."""
+        seconds = (next_age - age).total_seconds()
+        self.area_linear += sign * 0.5 * (value + next_value) * seconds
+        self.area_step += sign * value * seconds
+        self.sum_differences += sign * abs(next_value - value)
+        self.sum_differences_nonnegative += sign * (
+            next_value - value if next_value >= value else next_value
+        )
+
+    def _rebuild(self) -> None:
+        """Calculate all aggregates from the samples."""
+        states = self.states
+        ages = self.ages
+        self._removals = 0
+        self.sorted_states = sorted(states)
+        self.count_true = sum(1 for value in states if value is True)
+        self._mean = math.fsum(states) / len(states) if states else 0.0
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in states)
+        radians = [math.radians(value) for value in states]
+        self.sin_sum = math.fsum(math.sin(value) for value in radians)
+        self.cos_sum = math.fsum(math.cos(value) for value in radians)
+        pairs = list(zip(states, list(states)[1:], strict=False))
+        seconds = [(ages[i] - ages[i - 1]).total_seconds() for i in range(1, len(ages))]
+        self.area_linear = math.fsum(
+            0.5 * (value + next_value) * delta
+            for (value, next_value), delta in zip(pairs, seconds, strict=True)
+        )
+        self.area_step = math.fsum(
+            value * delta for (value, _), delta in zip(pairs, seconds, strict=True)
+        )
+        self.sum_differences = math.fsum(
+            abs(next_value - value) for value, next_value in pairs
+        )
+        self.sum_differences_nonnegative = math.fsum(
+            next_value - value if next_value >= value else next_value
+            for value, next_value in pairs
+        )
+        self._max_queue.clear()
+        self._min_queue.clear()
+        for seq, value in enumerate(states, self._first_seq):
+            while self._max_queue and self._max_queue[-1][1] < value:
+                self._max_queue.pop()
+            self._max_queue.append((seq, value))
+            while self._min_queue and self._min_queue[-1][1] > value:
+                self._min_queue.pop()
+            self._min_queue.append((seq, value))
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        return self._mean * len(self.states)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two values."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def max_value(self) -> float | bool:
+        """Return the largest value."""
+        return self._max_queue[0][1]
+
+    @property
+    def min_value(self) -> float | bool:
+        """Return the smallest value."""
+        return self._min_queue[0][1]
+
+    @property
+    def max_age(self) -> datetime:
+        """Return the age of the oldest sample holding the largest value."""
+        return self.ages[self._max_queue[0][0] - self._first_seq]
+
+    @property
+    def min_age(self) -> datetime:
+        """Return the age of the oldest sample holding the smallest value."""
+        return self.ages[self._min_queue[0][0] - self._first_seq]
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values."""
+        data = self.sorted_states
+        count = len(data)
+        if count % 2:
+            return data[count // 2]
+        return (data[count // 2 - 1] + data[count // 2]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, matching statistics.quantiles exclusive method."""
+        data = self.sorted_states
+        count = len(data)
+        m = count + 1
+        j = percentile * m // 100
+        j = 1 if j < 1 else count - 1 if j > count - 1 else j
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
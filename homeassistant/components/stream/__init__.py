@@ -18,7 +18,7 @@ to always keep workers active.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Generator, Mapping
 import copy
 import logging
 import secrets
@@ -42,15 +42,20 @@ from .const import (
     ATTR_ENDPOINTS,
     ATTR_SETTINGS,
     ATTR_STREAMS,
+    ATTR_WORKER_POOL,
     CONF_EXTRA_PART_WAIT_TIME,
     CONF_LL_HLS,
+    CONF_LOOKBACK_BUFFER,
     CONF_PART_DURATION,
     CONF_RTSP_TRANSPORT,
     CONF_SEGMENT_DURATION,
     CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
+    CONF_WORKER_POOL_SIZE,
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    LOOKBACK_PROVIDER,
+    MAX_LOOKBACK_BUFFER,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
     OUTPUT_IDLE_TIMEOUT,
@@ -72,6 +77,8 @@ from .core import (
 )
 from .diagnostics import Diagnostics
 from .hls import HlsStreamOutput, async_setup_hls
+from .lookback import LookbackOutput
+from .pool import StreamWorkerJob, StreamWorkerPool
 
 if TYPE_CHECKING:
     from homeassistant.components.camera import DynamicStreamSettings
@@ -79,6 +86,7 @@ if TYPE_CHECKING:
 __all__ = [
     "ATTR_SETTINGS",
     "CONF_EXTRA_PART_WAIT_TIME",
+    "CONF_LOOKBACK_BUFFER",
     "CONF_RTSP_TRANSPORT",
     "CONF_USE_WALLCLOCK_AS_TIMESTAMPS",
     "DOMAIN",
@@ -166,6 +174,8 @@ def create_stream(
         stream_settings=stream_settings,
         dynamic_stream_settings=dynamic_stream_settings,
         stream_label=stream_label,
+        worker_pool=hass.data[DOMAIN].get(ATTR_WORKER_POOL),
+        lookback_buffer=float(options.get(CONF_LOOKBACK_BUFFER, 0)),
     )
     hass.data[DOMAIN][ATTR_STREAMS].append(stream)
     return stream
@@ -180,6 +190,7 @@ DOMAIN_SCHEMA = vol.Schema(
         vol.Optional(CONF_PART_DURATION, default=1): vol.All(
             cv.positive_float, vol.Range(min=0.2, max=1.5)
         ),
+        vol.Optional(CONF_WORKER_POOL_SIZE, default=0): cv.positive_int,
     }
 )
 
@@ -247,6 +258,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     else:
         hass.data[DOMAIN][ATTR_SETTINGS] = STREAM_SETTINGS_NON_LL_HLS
 
+    # Share a fixed number of worker threads between streams when configured,
+    # otherwise each stream runs its worker on a dedicated thread
+    worker_pool: StreamWorkerPool | None = None
+    if conf[CONF_WORKER_POOL_SIZE]:
+        worker_pool = StreamWorkerPool(conf[CONF_WORKER_POOL_SIZE])
+        worker_pool.start()
+        hass.data[DOMAIN][ATTR_WORKER_POOL] = worker_pool
+
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
     hass.data[DOMAIN][ATTR_ENDPOINTS][HLS_PROVIDER] = hls_endpoint
@@ -263,6 +282,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             for stream in hass.data[DOMAIN][ATTR_STREAMS]
         ]:
             await asyncio.wait(awaitables)
+        if worker_pool:
+            await hass.async_add_executor_job(worker_pool.shutdown)
         _LOGGER.debug("Stopped stream workers")
         cancel_logging_listener()
 
@@ -282,6 +303,8 @@ class Stream:
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
         stream_label: str | None = None,
+        worker_pool: StreamWorkerPool | None = None,
+        lookback_buffer: float = 0,
     ) -> None:
         """Initialize a stream."""
         self.hass = hass
@@ -292,8 +315,10 @@ class Stream:
         self.dynamic_stream_settings = dynamic_stream_settings
         self.access_token: str | None = None
         self._start_stop_lock = asyncio.Lock()
-        self._thread: threading.Thread | None = None
+        self._thread: threading.Thread | StreamWorkerJob | None = None
         self._thread_quit = threading.Event()
+        self._worker_pool = worker_pool
+        self._lookback_buffer = lookback_buffer
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
         self._keyframe_converter = KeyFrameConverter(
@@ -331,9 +356,14 @@ class Stream:
 
             async def idle_callback() -> None:
                 if (
-                    not self.dynamic_stream_settings.preload_stream
-                    or fmt == RECORDER_PROVIDER
-                ) and fmt in self._outputs:
+                    (
+                        not self.dynamic_stream_settings.preload_stream
+                        or fmt == RECORDER_PROVIDER
+                    )
+                    # The lookback buffer lives as long as the worker
+                    and fmt != LOOKBACK_PROVIDER
+                    and fmt in self._outputs
+                ):
                     await self.remove_provider(self._outputs[fmt])
                 self.check_idle()
 
@@ -383,6 +413,9 @@ class Stream:
         Uses an asyncio.Lock to avoid conflicts with _stop().
         """
         async with self._start_stop_lock:
+            if self._lookback_buffer and LOOKBACK_PROVIDER not in self._outputs:
+                lookback = cast(LookbackOutput, self.add_provider(LOOKBACK_PROVIDER))
+                lookback.ring.duration = self._lookback_buffer
             if self._thread and self._thread.is_alive():
                 return
             if self._thread is not None:
@@ -390,11 +423,18 @@ class Stream:
                 # previous thread.
                 self._thread.join(timeout=0)
             self._thread_quit.clear()
-            self._thread = threading.Thread(
-                name="stream_worker",
-                target=self._run_worker,
+            job = StreamWorkerJob(
+                "stream_worker",
+                self._iter_worker(),
+                self._thread_quit,
+                self._diagnostics,
             )
-            self._thread.start()
+            if self._worker_pool:
+                self._thread = job
+                self._worker_pool.submit(job)
+            else:
+                self._thread = threading.Thread(name="stream_worker", target=job.run)
+                self._thread.start()
             self._logger.debug(
                 "Started stream: %s", redact_credentials(str(self.source))
             )
@@ -407,7 +447,13 @@ class Stream:
         )
         self.source = new_source
         self._fast_restart_once = True
+        self._signal_quit()
+
+    def _signal_quit(self) -> None:
+        """Ask the worker to quit, waking the worker pool if needed."""
         self._thread_quit.set()
+        if self._worker_pool:
+            self._worker_pool.wake()
 
     def _set_state(self, available: bool) -> None:
         """Set the stream state by updating the callback."""
@@ -416,15 +462,22 @@ class Stream:
         # it out each time
         self.hass.loop.call_soon_threadsafe(self._async_update_state, available)
 
-    def _run_worker(self) -> None:
-        """Handle consuming streams and restart keepalive streams."""
+    def _iter_worker(self) -> Generator[float, None, None]:
+        """Handle consuming streams and restart keepalive streams.
+
+        Yields the number of seconds to wait before resuming, see StreamWorkerJob.
+        """
         # Keep import here so that we can import stream integration without installing reqs
         # pylint: disable-next=import-outside-toplevel
-        from .worker import StreamState, StreamWorkerError, stream_worker
+        from .worker import StreamState, StreamWorkerError, iter_stream_worker
 
         stream_state = StreamState(self.hass, self.outputs, self._diagnostics)
         wait_timeout = 0
-        while not self._thread_quit.wait(timeout=wait_timeout):
+        while True:
+            if wait_timeout:
+                yield wait_timeout
+            if self._thread_quit.is_set():
+                break
             start_time = time.time()
             self._set_state(True)
             self._diagnostics.set_value(
@@ -435,14 +488,15 @@ class Stream:
             )
             self._diagnostics.increment("start_worker")
             try:
-                stream_worker(
+                for _ in iter_stream_worker(
                     self.source,
                     self.pyav_options,
                     self._stream_settings,
                     stream_state,
                     self._keyframe_converter,
                     self._thread_quit,
-                )
+                ):
+                    yield 0
             except StreamWorkerError as err:
                 self._diagnostics.increment("worker_error")
                 self._logger.error("Error from stream worker: %s", str(err))
@@ -488,6 +542,8 @@ class Stream:
 
     async def stop(self) -> None:
         """Remove outputs and access token."""
+        if lookback := self._outputs.get(LOOKBACK_PROVIDER):
+            await cast(LookbackOutput, lookback).async_close()
         self._outputs = {}
         self.access_token = None
 
@@ -502,7 +558,7 @@ class Stream:
         async with self._start_stop_lock:
             if self._thread is None:
                 return
-            self._thread_quit.set()
+            self._signal_quit()
             await self.hass.async_add_executor_job(self._thread.join)
             self._thread = None
             self._logger.debug(
@@ -537,9 +593,16 @@ class Stream:
 
         self._logger.debug("Started a stream recording of %s seconds", duration)
 
-        # Take advantage of lookback
+        # Take advantage of lookback, preferring the continuous lookback buffer
+        lookback_output = cast(
+            LookbackOutput | None, self.outputs().get(LOOKBACK_PROVIDER)
+        )
         hls: HlsStreamOutput = cast(HlsStreamOutput, self.outputs().get(HLS_PROVIDER))
-        if hls:
+        if lookback_output and lookback > 0:
+            # Wait for the latest segment so the previous one is in the buffer
+            await lookback_output.recv()
+            recorder.prepend(await lookback_output.async_get_segments(lookback))
+        elif hls:
             num_segments = min(int(lookback / hls.target_duration) + 1, MAX_SEGMENTS)
             # Wait for latest segment, then add the lookback
             await hls.recv()
@@ -583,5 +646,8 @@ STREAM_OPTIONS_SCHEMA: Final = vol.Schema(
         vol.Optional(CONF_RTSP_TRANSPORT): vol.In(RTSP_TRANSPORTS),
         vol.Optional(CONF_USE_WALLCLOCK_AS_TIMESTAMPS): bool,
         vol.Optional(CONF_EXTRA_PART_WAIT_TIME): cv.positive_float,
+        vol.Optional(CONF_LOOKBACK_BUFFER): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_LOOKBACK_BUFFER)
+        ),
     }
 )
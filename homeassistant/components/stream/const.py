@@ -5,9 +5,11 @@ DOMAIN = "stream"
 ATTR_ENDPOINTS = "endpoints"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
+ATTR_WORKER_POOL = "worker_pool"
 
 HLS_PROVIDER = "hls"
 RECORDER_PROVIDER = "recorder"
+LOOKBACK_PROVIDER = "lookback"
 
 OUTPUT_FORMATS = [HLS_PROVIDER]
 
@@ -43,6 +45,7 @@ STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
 CONF_LL_HLS = "ll_hls"
 CONF_PART_DURATION = "part_duration"
 CONF_SEGMENT_DURATION = "segment_duration"
+CONF_WORKER_POOL_SIZE = "worker_pool_size"
 
 CONF_PREFER_TCP = "prefer_tcp"
 CONF_RTSP_TRANSPORT = "rtsp_transport"
@@ -55,3 +58,5 @@ RTSP_TRANSPORTS = {
 }
 CONF_USE_WALLCLOCK_AS_TIMESTAMPS = "use_wallclock_as_timestamps"
 CONF_EXTRA_PART_WAIT_TIME = "extra_part_wait_time"
+CONF_LOOKBACK_BUFFER = "lookback_buffer"
+MAX_LOOKBACK_BUFFER = 120  # seconds
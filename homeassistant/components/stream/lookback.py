@@ -0,0 +1,225 @@
+"""Provide a continuous lookback buffer for stream recordings."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import datetime
+import os
+import tempfile
+import threading
+from typing import IO, TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOOKBACK_PROVIDER
+from .core import PROVIDERS, IdleTimer, Part, Segment, StreamOutput, StreamSettings
+
+if TYPE_CHECKING:
+    from homeassistant.components.camera import DynamicStreamSettings
+
+
+@dataclass(slots=True)
+class _RingEntry:
+    """Metadata of a segment stored in the ring file."""
+
+    sequence: int
+    stream_id: int
+    start_time: datetime.datetime
+    duration: float
+    init: bytes
+    offset: int
+    length: int
+
+
+class SegmentRing:
+    """Store recent completed segments in an anonymous temporary file.
+
+    Only segment metadata is held in memory. The file grows until it is large
+    enough to hold the configured duration, after which space of segments that
+    fell out of the window is reused. The fragments are stored as produced by
+    the stream worker, so reading them back does not require remuxing.
+    """
+
+    def __init__(self, duration: float) -> None:
+        """Initialize SegmentRing."""
+        self.duration = duration
+        self._file: IO[bytes] | None = None
+        self._entries: deque[_RingEntry] = deque()
+        self._capacity = 0
+        self._write_pos = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def stored_duration(self) -> float:
+        """Return the duration of the stored segments."""
+        return sum(entry.duration for entry in self._entries)
+
+    def append(self, segment: Segment) -> None:
+        """Store a completed segment, evicting segments outside the window."""
+        data = segment.get_data()
+        with self._lock:
+            if self._closed:
+                return
+            if self._file is None:
+                self._file = tempfile.TemporaryFile()
+            self._evict()
+            offset = self._allocate(len(data))
+            os.pwrite(self._file.fileno(), data, offset)
+            self._entries.append(
+                _RingEntry(
+                    sequence=segment.sequence,
+                    stream_id=segment.stream_id,
+                    start_time=segment.start_time,
+                    duration=segment.duration,
+                    init=segment.init,
+                    offset=offset,
+                    length=len(data),
+                )
+            )
+
+    def _evict(self) -> None:
+        """Drop the oldest segments not needed to cover the window."""
+        total = self.stored_duration
+        while self._entries and total - self._entries[0].duration >= self.duration:
+            total -= self._entries.popleft().duration
+
+    def _overlaps(self, offset: int, length: int) -> bool:
+        """Return True if the range overlaps a stored segment."""
+        end = offset + length
+        return any(
+            entry.offset < end and offset < entry.offset + entry.length
+            for entry in self._entries
+        )
+
+    def _allocate(self, length: int) -> int:
+        """Return the offset to store data of the given length at."""
+        offset = self._write_pos
+        # Wrap to the start of the file once the end is reached, unless the
+        # start is still in use, in which case the file grows instead
+        if offset + length > self._capacity and not self._overlaps(0, length):
+            offset = 0
+        if self._overlaps(offset, length):
+            offset = self._capacity
+        self._capacity = max(self._capacity, offset + length)
+        self._write_pos = offset + length
+        return offset
+
+    def get_segments(self, duration: float) -> list[Segment]:
+        """Return the stored segments covering the last duration seconds."""
+        with self._lock:
+            if self._file is None:
+                return []
+            selected: list[_RingEntry] = []
+            total = 0.0
+            for entry in reversed(self._entries):
+                if total >= duration:
+                    break
+                selected.append(entry)
+                total += entry.duration
+            fileno = self._file.fileno()
+            return [
+                Segment(
+                    sequence=entry.sequence,
+                    init=entry.init,
+                    stream_id=entry.stream_id,
+                    start_time=entry.start_time,
+                    _stream_outputs=(),
+                    duration=entry.duration,
+                    parts=[
+                        Part(
+                            duration=entry.duration,
+                            has_keyframe=True,
+                            data=os.pread(fileno, entry.length, entry.offset),
+                        )
+                    ],
+                )
+                for entry in reversed(selected)
+            ]
+
+    def close(self) -> None:
+        """Close and remove the ring file."""
+        with self._lock:
+            self._closed = True
+            self._entries.clear()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+@PROVIDERS.register(LOOKBACK_PROVIDER)
+class LookbackOutput(StreamOutput):
+    """Represents the continuous lookback buffer output."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        idle_timer: IdleTimer,
+        stream_settings: StreamSettings,
+        dynamic_stream_settings: DynamicStreamSettings,
+    ) -> None:
+        """Initialize lookback output."""
+        # Only the segment in progress and the last completed segment are
+        # kept in memory, older segments live in the ring file
+        super().__init__(
+            hass, idle_timer, stream_settings, dynamic_stream_settings, deque_maxlen=2
+        )
+        self.ring = SegmentRing(0)
+        self._pending_write: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return LOOKBACK_PROVIDER
+
+    @property
+    def idle(self) -> bool:
+        """Return True as the lookback buffer does not keep the stream in use."""
+        return True
+
+    @callback
+    def _async_put(self, segment: Segment) -> None:
+        """Store the previous segment in the ring once it is complete."""
+        super()._async_put(segment)
+        if len(self._segments) == 2 and (previous := self._segments[0]).complete:
+            self._pending_write = self._hass.async_create_task(
+                self._async_append(self._pending_write, previous),
+                "stream lookback write",
+            )
+
+    async def _async_append(
+        self, previous_write: asyncio.Task[None] | None, segment: Segment
+    ) -> None:
+        """Store a segment after the previous write, keeping the ring in order."""
+        if previous_write:
+            await previous_write
+        await self._hass.async_add_executor_job(self.ring.append, segment)
+
+    async def async_get_segments(self, duration: float) -> list[Segment]:
+        """Return completed segments covering the last duration seconds."""
+        if self._pending_write:
+            await self._pending_write
+        return await self._hass.async_add_executor_job(self.ring.get_segments, duration)
+
+    def cleanup(self) -> None:
+        """Handle cleanup."""
+        super().cleanup()
+        if self._close_task is None:
+            self._close_task = self._hass.async_create_task(
+                self._async_close_ring(), "stream lookback close"
+            )
+
+    async def _async_close_ring(self) -> None:
+        """Close the ring file once the pending writes are done."""
+        if self._pending_write:
+            await self._pending_write
+        await self._hass.async_add_executor_job(self.ring.close)
+
+    async def async_close(self) -> None:
+        """Clean up and wait for the ring file to be closed."""
+        self.cleanup()
+        assert self._close_task
+        await self._close_task
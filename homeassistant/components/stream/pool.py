@@ -0,0 +1,194 @@
+"""Run stream workers on dedicated threads or on a shared pool of threads.
+
+By default each stream runs its worker on a dedicated thread. When a worker
+pool is configured, a fixed number of threads services all streams instead,
+interleaving packet reads between the streams assigned to each thread. This
+bounds the number of threads contending for the GIL on installs with many
+cameras, at the cost of a slow source delaying other streams on the same
+pool thread while it blocks on a read.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import logging
+import threading
+import time
+
+from .diagnostics import Diagnostics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Measure the CPU time of one in this many steps and extrapolate, reading the
+# thread CPU clock for every muxed packet is a syscall in the hot loop
+CPU_TIME_SAMPLE_INTERVAL = 32
+
+
+class StreamWorkerJob:
+    """A stream worker split into resumable steps.
+
+    Each step yields the number of seconds to wait before the next step is
+    run, or 0 when the next step may run immediately. The job exposes the
+    subset of the threading.Thread interface used to manage workers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        steps: Generator[float, None, None],
+        quit_event: threading.Event,
+        diagnostics: Diagnostics,
+    ) -> None:
+        """Initialize StreamWorkerJob."""
+        self.name = name
+        self.resume_at = 0.0
+        self.quit_event = quit_event
+        self._steps = steps
+        self._diagnostics = diagnostics
+        self._cpu_time = 0.0
+        self._step_count = 0
+        self._done = threading.Event()
+
+    def step(self) -> float | None:
+        """Run a single step and return the delay, or None when finished."""
+        sample = not self._step_count % CPU_TIME_SAMPLE_INTERVAL
+        self._step_count += 1
+        start = time.thread_time() if sample else 0.0
+        try:
+            delay: float | None = next(self._steps)
+        except StopIteration:
+            delay = None
+        except BaseException:
+            self._done.set()
+            raise
+        finally:
+            if sample:
+                self._cpu_time += (
+                    time.thread_time() - start
+                ) * CPU_TIME_SAMPLE_INTERVAL
+                self._diagnostics.set_value("worker_cpu_time", self._cpu_time)
+        if delay is None:
+            self._done.set()
+        return delay
+
+    def run(self) -> None:
+        """Run all steps in the calling thread."""
+        while (delay := self.step()) is not None:
+            if delay:
+                self.quit_event.wait(timeout=delay)
+
+    def close(self) -> None:
+        """Abandon the remaining steps, releasing stream resources.
+
+        A job that never ran a step has not acquired any resources yet.
+        """
+        self._steps.close()
+        self._done.set()
+
+    def is_alive(self) -> bool:
+        """Return True if the job has not finished."""
+        return not self._done.is_set()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the job to finish."""
+        self._done.wait(timeout)
+
+
+class _StreamWorkerPoolThread(threading.Thread):
+    """A thread that round-robins between the steps of several jobs."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize _StreamWorkerPoolThread."""
+        super().__init__(name=name, daemon=True)
+        self._jobs: list[StreamWorkerJob] = []
+        self._pending: list[StreamWorkerJob] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+
+    @property
+    def load(self) -> int:
+        """Return the number of jobs assigned to this thread."""
+        return len(self._jobs) + len(self._pending)
+
+    def add_job(self, job: StreamWorkerJob) -> None:
+        """Assign a job to this thread."""
+        with self._lock:
+            self._pending.append(job)
+        self._wakeup.set()
+
+    def wake(self) -> None:
+        """Wake the thread so it can react to a stream quit request."""
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Ask the thread to exit."""
+        self._stopped = True
+        self._wakeup.set()
+
+    def run(self) -> None:
+        """Interleave the steps of all jobs assigned to this thread."""
+        while not self._stopped:
+            self._wakeup.clear()
+            with self._lock:
+                self._jobs.extend(self._pending)
+                self._pending.clear()
+            next_resume: float | None = None
+            now = time.monotonic()
+            for job in self._jobs.copy():
+                if job.resume_at > now and not job.quit_event.is_set():
+                    if next_resume is None or job.resume_at < next_resume:
+                        next_resume = job.resume_at
+                    continue
+                try:
+                    delay = job.step()
+                except Exception:
+                    _LOGGER.exception("Unexpected error in stream worker %s", job.name)
+                    delay = None
+                if delay is None:
+                    self._jobs.remove(job)
+                    continue
+                job.resume_at = time.monotonic() + delay
+                if next_resume is None or job.resume_at < next_resume:
+                    next_resume = job.resume_at
+            if next_resume is None:
+                self._wakeup.wait()
+            elif (timeout := next_resume - time.monotonic()) > 0:
+                self._wakeup.wait(timeout)
+
+        with self._lock:
+            self._jobs.extend(self._pending)
+            self._pending.clear()
+        for job in self._jobs:
+            job.close()
+
+
+class StreamWorkerPool:
+    """A fixed size pool of threads shared by all stream workers."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize StreamWorkerPool."""
+        self._threads = [
+            _StreamWorkerPoolThread(f"stream_worker_pool_{idx}") for idx in range(size)
+        ]
+
+    def start(self) -> None:
+        """Start the pool threads."""
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, job: StreamWorkerJob) -> None:
+        """Assign a job to the least loaded pool thread."""
+        min(self._threads, key=lambda thread: thread.load).add_job(job)
+
+    def wake(self) -> None:
+        """Wake all pool threads, e.g. after a stream was asked to quit."""
+        for thread in self._threads:
+            thread.wake()
+
+    def shutdown(self) -> None:
+        """Stop all pool threads and close any remaining jobs."""
+        for thread in self._threads:
+            thread.stop()
+        for thread in self._threads:
+            thread.join()
@@ -507,6 +507,30 @@ def stream_worker(
     quit_event: Event,
 ) -> None:
     """Handle consuming streams."""
+    for _ in iter_stream_worker(
+        source,
+        pyav_options,
+        stream_settings,
+        stream_state,
+        keyframe_converter,
+        quit_event,
+    ):
+        pass
+
+
+def iter_stream_worker(
+    source: str,
+    pyav_options: dict[str, str],
+    stream_settings: StreamSettings,
+    stream_state: StreamState,
+    keyframe_converter: KeyFrameConverter,
+    quit_event: Event,
+) -> Generator[None, None, None]:
+    """Consume a stream, yielding after each muxed packet.
+
+    Yielding allows a single thread to interleave the work of several streams
+    (see StreamWorkerPool). Closing the generator closes the container and muxer.
+    """
 
     if av.library_versions["libavformat"][0] >= 59 and "stimeout" in pyav_options:
         # the stimeout option was renamed to timeout as of ffmpeg 5.0
@@ -623,3 +647,5 @@ def stream_worker(
 
             if packet.is_keyframe and is_video(packet):
                 keyframe_converter.stash_keyframe_packet(packet)
+
+            yield
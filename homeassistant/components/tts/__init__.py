@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -16,6 +17,7 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, Final, TypedDict, final
 
 from aiohttp import web
@@ -40,7 +42,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
@@ -57,18 +65,21 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_MEM_CACHE_MAX_BYTES,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_MEM_CACHE_MAX_BYTES,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
 from .legacy import PLATFORM_SCHEMA, PLATFORM_SCHEMA_BASE, Provider, async_setup_legacy
 from .media_source import generate_media_source_id, media_source_id_to_kwargs
-from .models import Voice
+from .models import EngineMetrics, Voice
 
 __all__ = [
     "async_default_engine",
@@ -85,6 +96,7 @@ __all__ = [
     "PLATFORM_SCHEMA",
     "SampleFormat",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -121,12 +133,149 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
+class TTSAudioStream:
+    """Audio chunks of a TTS result that is still being produced."""
+
+    def __init__(self) -> None:
+        """Initialize the audio stream."""
+        self.chunks: list[bytes] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self._event = asyncio.Event()
+
+    @callback
+    def async_add_chunk(self, chunk: bytes) -> None:
+        """Add a chunk and wake up readers."""
+        self.chunks.append(chunk)
+        self._event.set()
+        self._event.clear()
+
+    @callback
+    def async_finish(self, error: BaseException | None = None) -> None:
+        """Mark the stream as complete and wake up readers."""
+        self.done = True
+        self.error = error
+        self._event.set()
+
+    async def async_iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the chunks produced so far and then new chunks as they arrive."""
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise HomeAssistantError(str(self.error)) from self.error
+                return
+            await self._event.wait()
+
+
 class TTSCache(TypedDict):
     """Cached TTS file."""
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+    stream: TTSAudioStream | None
+
+
+class TTSMemCache:
+    """Memory cache of TTS audio with least recently used eviction.
+
+    The cache is bounded by the total size of the cached audio. Entries that
+    have not been used for max_idle seconds are dropped by a timer. Entries
+    that are still being produced are never evicted.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int, max_idle: float) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        self.size = 0
+        self._entries: OrderedDict[str, TTSCache] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._unsub_expire: CALLBACK_TYPE | None = None
+
+    def __contains__(self, cache_key: str) -> bool:
+        """Return True if the key is cached."""
+        return cache_key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __getitem__(self, cache_key: str) -> TTSCache:
+        """Return an entry and mark it as recently used."""
+        entry = self._entries[cache_key]
+        self._entries.move_to_end(cache_key)
+        self._last_used[cache_key] = self.hass.loop.time()
+        return entry
+
+    def __setitem__(self, cache_key: str, entry: TTSCache) -> None:
+        """Store an entry and evict entries over the budget."""
+        self.pop(cache_key)
+        self._entries[cache_key] = entry
+        self._last_used[cache_key] = self.hass.loop.time()
+        self.size += len(entry["voice"])
+        self._prune()
+        if self._unsub_expire is None:
+            self._schedule_expire()
+
+    def pop(self, cache_key: str) -> TTSCache | None:
+        """Remove an entry."""
+        if (entry := self._entries.pop(cache_key, None)) is not None:
+            del self._last_used[cache_key]
+            self.size -= len(entry["voice"])
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._last_used.clear()
+        self.size = 0
+        if self._unsub_expire:
+            self._unsub_expire()
+            self._unsub_expire = None
+
+    def _prune(self) -> None:
+        """Evict least recently used entries over the budget."""
+        # The newest entry is kept even if it exceeds the budget on its own
+        for cache_key in list(self._entries)[:-1]:
+            if self.size <= self.max_bytes:
+                break
+            if not self._entries[cache_key]["pending"]:
+                self.pop(cache_key)
+
+    def _schedule_expire(self) -> None:
+        """Schedule a timer for when the least recently used entry expires."""
+        for cache_key, entry in self._entries.items():
+            if entry["pending"]:
+                continue
+            expire_at = self._last_used[cache_key] + self.max_idle
+            self._unsub_expire = async_call_later(
+                self.hass,
+                max(expire_at - self.hass.loop.time(), 0),
+                HassJob(
+                    self._async_expire,
+                    name="tts expire mem cache",
+                    cancel_on_shutdown=True,
+                ),
+            )
+            return
+
+    @callback
+    def _async_expire(self, _: datetime) -> None:
+        """Drop entries that have not been used for max_idle seconds."""
+        self._unsub_expire = None
+        expire_before = self.hass.loop.time() - self.max_idle
+        for cache_key in list(self._entries):
+            if self._last_used[cache_key] >= expire_before:
+                break
+            if not self._entries[cache_key]["pending"]:
+                self.pop(cache_key)
+        self._schedule_expire()
 
 
 @callback
@@ -299,14 +448,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_list_engines)
     websocket_api.async_register_command(hass, websocket_get_engine)
     websocket_api.async_register_command(hass, websocket_list_engine_voices)
+    websocket_api.async_register_command(hass, websocket_get_engine_metrics)
 
     # Legacy config options
     conf = config[DOMAIN][0] if config.get(DOMAIN) else {}
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+    mem_cache_max_bytes: int = conf.get(
+        CONF_MEM_CACHE_MAX_BYTES, DEFAULT_MEM_CACHE_MAX_BYTES
+    )
 
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    tts = SpeechManager(hass, use_cache, cache_dir, time_memory, mem_cache_max_bytes)
 
     try:
         await tts.async_init_cache()
@@ -377,6 +530,7 @@ class TextToSpeechEntity(RestoreEntity):
     """Represent a single TTS engine."""
 
     _attr_should_poll = False
+    _attr_supports_streaming = False
     __last_tts_loaded: str | None = None
 
     @property
@@ -407,6 +561,11 @@ class TextToSpeechEntity(RestoreEntity):
         """Return a mapping with the default options."""
         return None
 
+    @property
+    def supports_streaming(self) -> bool:
+        """Return True if the engine implements async_stream_tts_audio."""
+        return self._attr_supports_streaming
+
     @callback
     def async_get_supported_voices(self, language: str) -> list[Voice] | None:
         """Return a list of supported voices for a language."""
@@ -466,12 +625,33 @@ class TextToSpeechEntity(RestoreEntity):
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Process a streamed audio response of the TTS service."""
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return await self.async_stream_tts_audio(
+            message=message, language=language, options=options
+        )
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
         """Load tts audio file from the engine."""
         raise NotImplementedError
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Stream tts audio from the engine while it is being produced.
+
+        Return a tuple of file extension and an async iterator of audio chunks.
+        Only used when supports_streaming is True.
+        """
+        raise NotImplementedError
+
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -503,6 +683,7 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        mem_cache_max_bytes: int = DEFAULT_MEM_CACHE_MAX_BYTES,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -512,7 +693,8 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.mem_cache = TTSMemCache(hass, mem_cache_max_bytes, time_memory)
+        self.engine_metrics: dict[str, EngineMetrics] = {}
 
     def _init_cache(self) -> dict[str, str]:
         """Init cache folder and fetch files."""
@@ -532,7 +714,7 @@ class SpeechManager:
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache.clear()
 
         def remove_files() -> None:
             """Remove files from filesystem."""
@@ -627,7 +809,13 @@ class SpeechManager:
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
-                engine_instance, cache_key, message, use_cache, language, options
+                engine,
+                engine_instance,
+                cache_key,
+                message,
+                use_cache,
+                language,
+                options,
             )
 
         return f"/api/tts_proxy/{filename}"
@@ -654,14 +842,19 @@ class SpeechManager:
                 await self._async_file_to_mem(cache_key)
             else:
                 await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
+                    engine,
+                    engine_instance,
+                    cache_key,
+                    message,
+                    use_cache,
+                    language,
+                    options,
                 )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        if pending := cached["pending"]:
+            return extension, await pending
         return extension, cached["voice"]
 
     @callback
@@ -681,6 +874,7 @@ class SpeechManager:
 
     async def _async_get_tts_audio(
         self,
+        engine: str,
         engine_instance: TextToSpeechEntity | Provider,
         cache_key: str,
         message: str,
@@ -718,15 +912,46 @@ class SpeechManager:
         else:
             sample_channels = options.pop(ATTR_PREFERRED_SAMPLE_CHANNELS, None)
 
-        async def get_tts_data() -> str:
+        # Engines that support streaming forward audio chunks to readers as
+        # they arrive instead of only once the full result is available.
+        audio_stream = (
+            TTSAudioStream()
+            if isinstance(engine_instance, TextToSpeechEntity)
+            and engine_instance.supports_streaming
+            else None
+        )
+
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
+            metrics = self.engine_metrics.setdefault(engine, EngineMetrics())
+            start = time.monotonic()
+            streamed = False
+            data: bytes | None
+
             if isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
+            elif audio_stream is not None:
+                stream_tts_audio = engine_instance.internal_async_stream_tts_audio
+                extension, chunks = await stream_tts_audio(message, language, options)
+                # Chunks can only be forwarded if they need no conversion
+                streamed = (
+                    final_extension == extension
+                    and sample_rate is None
+                    and sample_channels is None
+                )
+                received: list[bytes] = []
+                async for chunk in chunks:
+                    if not received:
+                        metrics.record(time.monotonic() - start, streamed)
+                    received.append(chunk)
+                    if streamed:
+                        audio_stream.async_add_chunk(chunk)
+                data = b"".join(received) if received else None
             else:
                 extension, data = await engine_instance.internal_async_get_tts_audio(
                     message, language, options
@@ -737,6 +962,9 @@ class SpeechManager:
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
+            if audio_stream is None:
+                metrics.record(time.monotonic() - start, streamed)
+
             # Only convert if we have a preferred format different than the
             # expected format from the TTS system, or if a specific sample
             # rate/format/channel count is requested.
@@ -767,12 +995,16 @@ class SpeechManager:
                     f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
                 )
 
-            # Save to memory
-            if final_extension == "mp3":
+            # Save to memory. Streamed audio was forwarded without tags, so it
+            # is cached without tags as well to serve the same bytes.
+            if final_extension == "mp3" and not streamed:
                 data = self.write_tags(
                     filename, data, engine_instance.name, message, language, options
                 )
 
+            if audio_stream is not None and not streamed:
+                audio_stream.async_add_chunk(data)
+
             self._async_store_to_memcache(cache_key, filename, data)
 
             if cache:
@@ -780,22 +1012,30 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
-        def handle_error(_future: asyncio.Future) -> None:
-            """Handle error."""
-            if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+        def handle_done(_future: asyncio.Future) -> None:
+            """Handle completion or error."""
+            error = (
+                asyncio.CancelledError()
+                if audio_task.cancelled()
+                else audio_task.exception()
+            )
+            if audio_stream is not None:
+                audio_stream.async_finish(error)
+            if error is not None:
+                self.mem_cache.pop(cache_key)
 
-        audio_task.add_done_callback(handle_error)
+        audio_task.add_done_callback(handle_done)
 
         filename = f"{cache_key}.{final_extension}".lower()
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": b"",
             "pending": audio_task,
+            "stream": audio_stream,
         }
         return filename
 
@@ -846,41 +1086,20 @@ class SpeechManager:
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
+        """Store data to the memcache, evicting least recently used entries."""
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
+            "stream": None,
         }
 
-        @callback
-        def async_remove_from_mem(_: datetime) -> None:
-            """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
-
-        async_call_later(
-            self.hass,
-            self.time_memory,
-            HassJob(
-                async_remove_from_mem,
-                name="tts remove_from_mem",
-                cancel_on_shutdown=True,
-            ),
-        )
-
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _filename_to_cache_key(filename)
 
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
@@ -888,13 +1107,29 @@ class SpeechManager:
             await self._async_file_to_mem(cache_key)
 
         cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-
         content, _ = mimetypes.guess_type(filename)
+        if pending := cached["pending"]:
+            return content, await pending
         return content, cached["voice"]
 
+    @callback
+    def async_read_tts_stream(
+        self, filename: str
+    ) -> tuple[str | None, AsyncIterator[bytes]] | None:
+        """Return the audio chunks of a voice file that is still being produced.
+
+        Returns None if the voice file is not being streamed.
+        """
+        cache_key = _filename_to_cache_key(filename)
+        if (
+            cache_key not in self.mem_cache
+            or (cached := self.mem_cache[cache_key])["pending"] is None
+            or (audio_stream := cached["stream"]) is None
+        ):
+            return None
+        content, _ = mimetypes.guess_type(filename)
+        return content, audio_stream.async_iter_chunks()
+
     @staticmethod
     def write_tags(
         filename: str,
@@ -948,6 +1183,18 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+def _filename_to_cache_key(filename: str) -> str:
+    """Return the cache key of a voice file name."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -1031,9 +1278,11 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if streamed := self.tts.async_read_tts_stream(filename):
+                return await self._async_stream(request, *streamed)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -1041,6 +1290,30 @@ class TextToSpeechView(HomeAssistantView):
 
         return web.Response(body=data, content_type=content)
 
+    async def _async_stream(
+        self,
+        request: web.Request,
+        content: str | None,
+        chunks: AsyncIterator[bytes],
+    ) -> web.StreamResponse:
+        """Forward audio chunks to the client as they are produced."""
+        # Wait for the first chunk so errors can still be reported as not found
+        first_chunk = await anext(chunks, b"")
+
+        response = web.StreamResponse()
+        if content:
+            response.content_type = content
+        await response.prepare(request)
+        await response.write(first_chunk)
+        try:
+            async for chunk in chunks:
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on stream tts: %s", err)
+            return response
+        await response.write_eof()
+        return response
+
 
 @websocket_api.websocket_command(
     {
@@ -1157,3 +1430,30 @@ def websocket_list_engine_voices(
     voices = {"voices": engine_instance.async_get_supported_voices(language)}
 
     connection.send_message(websocket_api.result_message(msg["id"], voices))
+
+
+@websocket_api.websocket_command({"type": "tts/engine/metrics"})
+@websocket_api.require_admin
+@callback
+def websocket_get_engine_metrics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Get time to first byte metrics of the text to speech engines."""
+    manager: SpeechManager = hass.data[DATA_TTS_MANAGER]
+
+    connection.send_message(
+        websocket_api.result_message(
+            msg["id"],
+            {
+                "engines": {
+                    engine_id: metrics.as_dict()
+                    for engine_id, metrics in manager.engine_metrics.items()
+                },
+                "mem_cache": {
+                    "entries": len(manager.mem_cache),
+                    "size": manager.mem_cache.size,
+                    "max_size": manager.mem_cache.max_bytes,
+                },
+            },
+        )
+    )
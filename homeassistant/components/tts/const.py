@@ -1,5 +1,7 @@
 """Text-to-speech constants."""
 
+from collections.abc import AsyncIterator
+
 ATTR_CACHE = "cache"
 ATTR_LANGUAGE = "language"
 ATTR_MESSAGE = "message"
@@ -8,14 +10,17 @@ ATTR_OPTIONS = "options"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
 CONF_FIELDS = "fields"
+CONF_MEM_CACHE_MAX_BYTES = "mem_cache_max_bytes"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
+DEFAULT_MEM_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
 DOMAIN = "tts"
 
 DATA_TTS_MANAGER = "tts_manager"
 
 type TtsAudioType = tuple[str | None, bytes | None]
+type TtsAudioStreamType = tuple[str, AsyncIterator[bytes]]
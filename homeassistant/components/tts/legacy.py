@@ -46,10 +46,12 @@ from .const import (
     CONF_CACHE,
     CONF_CACHE_DIR,
     CONF_FIELDS,
+    CONF_MEM_CACHE_MAX_BYTES,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_MEM_CACHE_MAX_BYTES,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
     TtsAudioType,
@@ -83,6 +85,9 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(
+            CONF_MEM_CACHE_MAX_BYTES, default=DEFAULT_MEM_CACHE_MAX_BYTES
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
         vol.Optional(CONF_SERVICE_NAME): cv.string,
     }
 )
@@ -9,3 +9,31 @@ class Voice:
 
     voice_id: str
     name: str
+
+
+@dataclass(slots=True)
+class EngineMetrics:
+    """Time to first byte metrics of a TTS engine."""
+
+    requests: int = 0
+    streamed: int = 0
+    last_time_to_first_byte: float | None = None
+    total_time_to_first_byte: float = 0
+
+    def record(self, time_to_first_byte: float, streamed: bool) -> None:
+        """Record the time to first byte of a request."""
+        self.requests += 1
+        self.streamed += streamed
+        self.last_time_to_first_byte = time_to_first_byte
+        self.total_time_to_first_byte += time_to_first_byte
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the metrics as a dictionary."""
+        return {
+            "requests": self.requests,
+            "streamed": self.streamed,
+            "last_time_to_first_byte": self.last_time_to_first_byte,
+            "average_time_to_first_byte": (
+                self.total_time_to_first_byte / self.requests if self.requests else None
+            ),
+        }
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections.abc import Coroutine
 import dataclasses
-import fnmatch
 import logging
 import os
 import sys
@@ -28,7 +27,7 @@ from homeassistant.data_entry_flow import BaseServiceInfo
 from homeassistant.helpers import config_validation as cv, discovery_flow, system_info
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import USBMatcher, async_get_usb
+from homeassistant.loader import USBMatcher, async_get_usb, compile_fnmatch
 
 from .const import DOMAIN
 from .models import USBDevice
@@ -162,7 +161,7 @@ def _fnmatch_lower(name: str | None, pattern: str) -> bool:
     """Match a lowercase version of the name."""
     if name is None:
         return False
-    return fnmatch.fnmatch(name.lower(), pattern)
+    return compile_fnmatch(pattern)(name.lower())
 
 
 def _is_matching(device: USBDevice, matcher: USBMatcher | USBCallbackMatcher) -> bool:
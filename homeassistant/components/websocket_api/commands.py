@@ -51,6 +51,7 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -81,6 +82,7 @@ def async_register_commands(
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
@@ -550,6 +552,27 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import info command."""
+    result: list[dict[str, Any]] = []
+    for name, timing in async_get_import_timings(hass).items():
+        domain, _, platform = name.partition(".")
+        result.append(
+            {
+                "domain": domain,
+                "platform": platform or None,
+                "seconds": timing.seconds,
+                "max_rss_delta": timing.max_rss_delta,
+                "packages": timing.packages,
+            }
+        )
+    connection.send_result(msg["id"], result)
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import contextlib
 from contextlib import suppress
 from dataclasses import dataclass
-from fnmatch import translate
-from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 import logging
-import re
 import sys
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -41,6 +39,7 @@ from homeassistant.loader import (
     async_get_homekit,
     async_get_zeroconf,
     bind_hass,
+    compile_fnmatch,
 )
 from homeassistant.setup import async_when_setup_or_start
 
@@ -256,15 +255,17 @@ def _build_homekit_model_lookups(
     homekit_models: dict[str, HomeKitDiscoveredIntegration],
 ) -> tuple[
     dict[str, HomeKitDiscoveredIntegration],
-    dict[re.Pattern, HomeKitDiscoveredIntegration],
+    dict[Callable[[str], bool], HomeKitDiscoveredIntegration],
 ]:
     """Build lookups for homekit models."""
     homekit_model_lookup: dict[str, HomeKitDiscoveredIntegration] = {}
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration] = {}
+    homekit_model_matchers: dict[
+        Callable[[str], bool], HomeKitDiscoveredIntegration
+    ] = {}
 
     for model, discovery in homekit_models.items():
         if "*" in model or "?" in model or "[" in model:
-            homekit_model_matchers[_compile_fnmatch(model)] = discovery
+            homekit_model_matchers[compile_fnmatch(model)] = discovery
         else:
             homekit_model_lookup[model] = discovery
 
@@ -328,7 +329,7 @@ def _match_against_props(matcher: dict[str, str], props: dict[str, str | None])
     """Check a matcher to ensure all values in props."""
     for key, value in matcher.items():
         prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
+        if prop_val is None or not compile_fnmatch(value)(prop_val.lower()):
             return False
     return True
 
@@ -353,7 +354,9 @@ class ZeroconfDiscovery:
         zeroconf: HaZeroconf,
         zeroconf_types: dict[str, list[ZeroconfMatcher]],
         homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-        homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+        homekit_model_matchers: dict[
+            Callable[[str], bool], HomeKitDiscoveredIntegration
+        ],
     ) -> None:
         """Init discovery."""
         self.hass = hass
@@ -492,8 +495,8 @@ class ZeroconfDiscovery:
         # so not all service type exist in zeroconf_types
         for matcher in matchers:
             if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
+                if ATTR_NAME in matcher and not compile_fnmatch(matcher[ATTR_NAME])(
+                    info.name.lower()
                 ):
                     continue
                 if ATTR_PROPERTIES in matcher and not _match_against_props(
@@ -520,7 +523,7 @@ class ZeroconfDiscovery:
 
 def async_get_homekit_discovery(
     homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+    homekit_model_matchers: dict[Callable[[str], bool], HomeKitDiscoveredIntegration],
     props: dict[str, Any],
 ) -> HomeKitDiscoveredIntegration | None:
     """Handle a HomeKit discovery.
@@ -537,8 +540,8 @@ def async_get_homekit_discovery(
         if discovery := homekit_model_lookups.get(key):
             return discovery
 
-    for pattern, discovery in homekit_model_matchers.items():
-        if pattern.match(model):
+    for matcher, discovery in homekit_model_matchers.items():
+        if matcher(model):
             return discovery
 
     return None
@@ -612,24 +615,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
         location_name,
     )
     return location_name.encode("utf-8")[:MAX_NAME_LEN].decode("utf-8", "ignore")
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
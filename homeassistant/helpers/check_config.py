@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import OrderedDict
 import logging
 import os
 from pathlib import Path
+import time
 from typing import NamedTuple, Self
 
 import voluptuous as vol
@@ -14,6 +16,7 @@ from homeassistant import loader
 from homeassistant.config import (  # type: ignore[attr-defined]
     CONF_PACKAGES,
     CORE_CONFIG_SCHEMA,
+    DATA_YAML_CACHE,
     YAML_CONFIG_FILE,
     config_per_platform,
     extract_domain_configs,
@@ -51,6 +54,7 @@ class HomeAssistantConfig(OrderedDict):
         super().__init__()
         self.errors: list[CheckConfigError] = []
         self.warnings: list[CheckConfigError] = []
+        self.timings: dict[str, float] = {}
 
     def add_error(
         self,
@@ -107,6 +111,7 @@ async def async_check_ha_config_file(  # noqa: C901
         result.add_warning(message, domain, pack_config)
 
     def _comp_error(
+        domain_result: HomeAssistantConfig,
         ex: vol.Invalid | HomeAssistantError,
         domain: str,
         component_config: ConfigType,
@@ -118,12 +123,12 @@ async def async_check_ha_config_file(  # noqa: C901
         else:
             message = format_homeassistant_error(hass, ex, domain, component_config)
         if domain in frontend_dependencies:
-            result.add_error(message, domain, config_to_attach)
+            domain_result.add_error(message, domain, config_to_attach)
         else:
-            result.add_warning(message, domain, config_to_attach)
+            domain_result.add_warning(message, domain, config_to_attach)
 
     async def _get_integration(
-        hass: HomeAssistant, domain: str
+        hass: HomeAssistant, domain: str, domain_result: HomeAssistantConfig
     ) -> loader.Integration | None:
         """Get an integration."""
         integration: loader.Integration | None = None
@@ -135,9 +140,9 @@ async def async_check_ha_config_file(  # noqa: C901
             # show errors for a missing integration in recovery mode or safe mode to
             # not confuse the user.
             if not hass.config.recovery_mode and not hass.config.safe_mode:
-                result.add_warning(f"Integration error: {domain} - {ex}")
+                domain_result.add_warning(f"Integration error: {domain} - {ex}")
         except RequirementsNotFound as ex:
-            result.add_warning(f"Integration error: {domain} - {ex}")
+            domain_result.add_warning(f"Integration error: {domain} - {ex}")
         return integration
 
     # Load configuration.yaml
@@ -150,6 +155,7 @@ async def async_check_ha_config_file(  # noqa: C901
             load_yaml_config_file,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            hass.data.get(DATA_YAML_CACHE),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
@@ -180,21 +186,23 @@ async def async_check_ha_config_file(  # noqa: C901
 
     frontend_dependencies: set[str] = set()
     if "frontend" in components or "default_config" in components:
-        frontend = await _get_integration(hass, "frontend")
+        frontend = await _get_integration(hass, "frontend", result)
         if frontend:
             await frontend.resolve_dependencies()
             frontend_dependencies = frontend.all_dependencies | {"frontend"}
 
-    # Process and validate config
-    for domain in components:
-        if not (integration := await _get_integration(hass, domain)):
-            continue
+    async def _async_validate_domain(
+        domain: str, domain_result: HomeAssistantConfig
+    ) -> None:
+        """Validate the config of a domain."""
+        if not (integration := await _get_integration(hass, domain, domain_result)):
+            return
 
         try:
             component = await integration.async_get_component()
         except ImportError as ex:
-            result.add_warning(f"Component error: {domain} - {ex}")
-            continue
+            domain_result.add_warning(f"Component error: {domain} - {ex}")
+            return
 
         # Check if the integration has a custom config validator
         config_validator = None
@@ -206,30 +214,33 @@ async def async_check_ha_config_file(  # noqa: C901
                 # If the config platform contains bad imports, make sure
                 # that still fails.
                 if err.name != f"{integration.pkg_path}.config":
-                    result.add_error(f"Error importing config platform {domain}: {err}")
-                    continue
+                    domain_result.add_error(
+                        f"Error importing config platform {domain}: {err}"
+                    )
+                    return
 
         if config_validator is not None and hasattr(
             config_validator, "async_validate_config"
         ):
             try:
-                result[domain] = (
+                domain_result[domain] = (
                     await config_validator.async_validate_config(hass, config)
                 )[domain]
-                continue
             except (vol.Invalid, HomeAssistantError) as ex:
-                _comp_error(ex, domain, config, config[domain])
-                continue
+                _comp_error(domain_result, ex, domain, config, config[domain])
+                return
             except Exception as err:  # noqa: BLE001
                 logging.getLogger(__name__).exception(
                     "Unexpected error validating config"
                 )
-                result.add_error(
+                domain_result.add_error(
                     f"Unexpected error calling config validator: {err}",
                     domain,
                     config.get(domain),
                 )
-                continue
+                return
+            else:
+                return
 
         config_schema = getattr(component, "CONFIG_SCHEMA", None)
         if config_schema is not None:
@@ -237,10 +248,10 @@ async def async_check_ha_config_file(  # noqa: C901
                 validated_config = config_schema(config)
                 # Don't fail if the validator removed the domain from the config
                 if domain in validated_config:
-                    result[domain] = validated_config[domain]
+                    domain_result[domain] = validated_config[domain]
             except vol.Invalid as ex:
-                _comp_error(ex, domain, config, config[domain])
-                continue
+                _comp_error(domain_result, ex, domain, config, config[domain])
+                return
 
         component_platform_schema = getattr(
             component,
@@ -249,7 +260,7 @@ async def async_check_ha_config_file(  # noqa: C901
         )
 
         if component_platform_schema is None:
-            continue
+            return
 
         platforms = []
         for p_name, p_config in config_per_platform(config, domain):
@@ -257,7 +268,7 @@ async def async_check_ha_config_file(  # noqa: C901
             try:
                 p_validated = component_platform_schema(p_config)
             except vol.Invalid as ex:
-                _comp_error(ex, domain, p_config, p_config)
+                _comp_error(domain_result, ex, domain, p_config, p_config)
                 continue
 
             # Not all platform components follow same pattern for platforms
@@ -278,7 +289,7 @@ async def async_check_ha_config_file(  # noqa: C901
                 # show errors for a missing integration in recovery mode or safe mode to
                 # not confuse the user.
                 if not hass.config.recovery_mode and not hass.config.safe_mode:
-                    result.add_warning(
+                    domain_result.add_warning(
                         f"Platform error '{domain}' from integration '{p_name}' - {ex}"
                     )
                 continue
@@ -286,7 +297,7 @@ async def async_check_ha_config_file(  # noqa: C901
                 RequirementsNotFound,
                 ImportError,
             ) as ex:
-                result.add_warning(
+                domain_result.add_warning(
                     f"Platform error '{domain}' from integration '{p_name}' - {ex}"
                 )
                 continue
@@ -297,14 +308,45 @@ async def async_check_ha_config_file(  # noqa: C901
                 try:
                     p_validated = platform_schema(p_validated)
                 except vol.Invalid as ex:
-                    _comp_error(ex, f"{domain}.{p_name}", p_config, p_config)
+                    _comp_error(
+                        domain_result, ex, f"{domain}.{p_name}", p_config, p_config
+                    )
                     continue
 
             platforms.append(p_validated)
 
-        # Remove config for current component and add validated config back in.
-        for filter_comp in extract_domain_configs(config, domain):
-            del config[filter_comp]
-        result[domain] = platforms
+        platform_domains.add(domain)
+        domain_result[domain] = platforms
+
+    async def _async_validate_domain_timed(
+        domain: str, domain_result: HomeAssistantConfig
+    ) -> None:
+        """Validate the config of a domain and record how long it took."""
+        start = time.monotonic()
+        try:
+            await _async_validate_domain(domain, domain_result)
+        finally:
+            domain_result.timings[domain] = time.monotonic() - start
+
+    # Process and validate config, domains are independent of each other
+    # so they are validated concurrently and merged in order afterwards
+    domain_results = {domain: HomeAssistantConfig() for domain in components}
+    platform_domains: set[str] = set()
+    await asyncio.gather(
+        *(
+            _async_validate_domain_timed(domain, domain_result)
+            for domain, domain_result in domain_results.items()
+        )
+    )
+
+    for domain, domain_result in domain_results.items():
+        result.errors.extend(domain_result.errors)
+        result.warnings.extend(domain_result.warnings)
+        result.timings.update(domain_result.timings)
+        result.update(domain_result)
+        if domain in platform_domains:
+            # Remove config for the component and add validated config back in
+            for filter_comp in extract_domain_configs(config, domain):
+                del config[filter_comp]
 
     return result
@@ -577,6 +577,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -1015,10 +1016,15 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of device registry to store in a file."""
         return {
-            "devices": [entry.as_storage_fragment for entry in self.devices.values()],
-            "deleted_devices": [
-                entry.as_storage_fragment for entry in self.deleted_devices.values()
-            ],
+            "devices": storage.JournalItems(
+                {entry.id: entry.as_storage_fragment for entry in self.devices.values()}
+            ),
+            "deleted_devices": storage.JournalItems(
+                {
+                    entry.id: entry.as_storage_fragment
+                    for entry in self.deleted_devices.values()
+                }
+            ),
         }
 
     @callback
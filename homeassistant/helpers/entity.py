@@ -39,6 +39,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    DOMAIN as HA_DOMAIN,
     Context,
     Event,
     HassJobType,
@@ -83,6 +84,13 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# Entity registry options of the homeassistant domain to limit how often the
+# state of an entity is written, the latest state is written at the end of
+# the interval
+OPTION_MIN_STATE_WRITE_INTERVAL = "min_state_write_interval"
+# Drop writes within the interval which would not change the state itself
+OPTION_DROP_ATTRIBUTE_ONLY_WRITES = "drop_attribute_only_writes"
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -518,6 +526,11 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # Rate limiting of state writes, set by the entity registry options
+    __last_state_write: float = 0.0
+    __state_write_handle: asyncio.TimerHandle | None = None
+    _suppressed_state_writes: int = 0
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1122,6 +1135,14 @@ class Entity(
                 )
             return
 
+        if (
+            entry
+            and (ha_options := entry.options.get(HA_DOMAIN))
+            and OPTION_MIN_STATE_WRITE_INTERVAL in ha_options
+            and self.__async_defer_state_write(ha_options)
+        ):
+            return
+
         state_calculate_start = timer()
         state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
         time_now = timer()
@@ -1212,6 +1233,42 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def __async_defer_state_write(self, options: Mapping[str, Any]) -> bool:
+        """Return True if the state write is deferred or dropped by the rate limit."""
+        loop = self.hass.loop
+        now = loop.time()
+        next_write = self.__last_state_write + options[OPTION_MIN_STATE_WRITE_INTERVAL]
+        if now >= next_write:
+            self.__last_state_write = now
+            return False
+        self._suppressed_state_writes += 1
+        if self.__state_write_handle is not None:
+            return True
+        if (
+            options.get(OPTION_DROP_ATTRIBUTE_ONLY_WRITES)
+            and (old_state := self.hass.states.get(self.entity_id)) is not None
+            and old_state.state == self._stringify_state(self.available)
+        ):
+            return True
+        self.__state_write_handle = loop.call_at(
+            next_write, self.__async_write_deferred_state
+        )
+        return True
+
+    @callback
+    def __async_write_deferred_state(self) -> None:
+        """Write the latest state at the end of the rate limit interval."""
+        self.__state_write_handle = None
+        # The timer may fire slightly early, make sure the write is not deferred
+        self.__last_state_write = -math.inf
+        _LOGGER.debug(
+            "Writing deferred state of %s, %s state writes suppressed",
+            self.entity_id,
+            self._suppressed_state_writes,
+        )
+        self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1476,6 +1533,9 @@ class Entity(
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
             entity_sources(self.hass).pop(self.entity_id)
+        if self.__state_write_handle is not None:
+            self.__state_write_handle.cancel()
+            self.__state_write_handle = None
 
     @callback
     def _async_registry_updated(
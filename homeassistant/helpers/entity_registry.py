@@ -678,6 +678,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1308,10 +1309,18 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "entities": storage.JournalItems(
+                {
+                    entry.id: entry.as_storage_fragment
+                    for entry in self.entities.values()
+                }
+            ),
+            "deleted_entities": storage.JournalItems(
+                {
+                    entry.id: entry.as_storage_fragment
+                    for entry in self.deleted_entities.values()
+                }
+            ),
         }
 
     @callback
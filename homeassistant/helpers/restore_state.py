@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -18,9 +19,9 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
-from .storage import Store
+from .storage import JournalItems, Store
 
 DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 
@@ -35,6 +36,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long to keep the saved last seen time of an entity which still exists
+# before saving it again, this bounds how early STATE_EXPIRATION can kick in
+LAST_SEEN_REFRESH = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -59,6 +64,16 @@ class RestoredExtraData(ExtraStoredData):
         return self.json_dict
 
 
+@dataclass(slots=True)
+class _DumpedState:
+    """A stored state as it was last saved."""
+
+    state: State
+    extra_data: bytes | None
+    last_seen: datetime
+    fragment: json_fragment
+
+
 class StoredState:
     """Object to represent a stored state."""
 
@@ -135,10 +150,15 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_collections={"": "state.entity_id"},
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -218,15 +238,70 @@ class RestoreStateData:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_get_dump())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def _async_get_dump(self) -> JournalItems:
+        """Return the serialized stored states by entity id.
+
+        Only stored states whose state object or extra data changed since the
+        last dump are serialized again, so the store only has to write those.
+        """
+        refresh_before = dt_util.utcnow() - LAST_SEEN_REFRESH
+        previous = self._dumped
+        dumped: dict[str, _DumpedState] = {}
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            last_seen = stored_state.last_seen
+            try:
+                extra_data = (
+                    json_bytes(stored_state.extra_data.as_dict())
+                    if stored_state.extra_data
+                    else None
+                )
+            except TypeError as exc:
+                _LOGGER.error(
+                    "Error serializing extra data of %s",
+                    state.entity_id,
+                    exc_info=exc,
+                )
+                continue
+            if (
+                (cached := previous.get(state.entity_id)) is not None
+                and cached.state is state
+                and cached.extra_data == extra_data
+                # Entities which still exist are seen now, keep the previous
+                # last seen time until it needs to be refreshed
+                and cached.last_seen >= min(last_seen, refresh_before)
+            ):
+                dumped[state.entity_id] = cached
+                continue
+            dumped[state.entity_id] = _DumpedState(
+                state,
+                extra_data,
+                last_seen,
+                json_fragment(
+                    json_bytes(
+                        {
+                            "state": state.json_fragment,
+                            "extra_data": json_fragment(extra_data)
+                            if extra_data
+                            else None,
+                            "last_seen": last_seen,
+                        }
+                    )
+                ),
+            )
+        self._dumped = dumped
+        return JournalItems(
+            {
+                entity_id: dumped_state.fragment
+                for entity_id, dumped_state in dumped.items()
+            }
+        )
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -6,13 +6,15 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 from functools import cached_property
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, cast
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -31,8 +33,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +51,16 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal into the snapshot once it is larger than this share
+# of the snapshot, and at least JOURNAL_MIN_COMPACT_SIZE bytes
+JOURNAL_COMPACT_RATIO = 0.25
+JOURNAL_MIN_COMPACT_SIZE = 256 * 1024
+# Compact the journal on the first write after this many seconds even if it
+# is small, which bounds how much an older core that ignores the journal
+# would miss after an unclean shutdown
+JOURNAL_COMPACT_INTERVAL = 3600
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +239,44 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class JournalItems(list[Any]):
+    """Items of a journaled collection along with the keys identifying them.
+
+    Allows a journaled Store to match items which are opaque, like json
+    fragments, without deserializing them.
+    """
+
+    def __init__(self, items: Mapping[str, Any]) -> None:
+        """Initialize from a mapping of keys to items."""
+        super().__init__(items.values())
+        self.keys = list(items)
+
+
+def _journal_item_key(item: Mapping[str, Any], field: str) -> str:
+    """Return the key identifying an item of a journaled collection."""
+    key: Any = item
+    for part in field.split("."):
+        key = key[part]
+    return cast(str, key)
+
+
+@dataclass(slots=True)
+class _JournalState:
+    """What the snapshot and the journal on disk add up to."""
+
+    generation: str
+    version: int
+    minor_version: int
+    # Serialized items of each collection by key
+    collections: dict[str, dict[str, bytes]]
+    # Serialized values of the keys which are not collections
+    values: dict[str, bytes]
+    snapshot_size: int
+    journal_size: int
+    # Monotonic time the snapshot was written or loaded
+    snapshot_time: float
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +292,24 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_collections: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_collections maps keys of the stored data which hold lists of
+        objects to the field identifying each object, using the key "" if the
+        stored data is a list itself and dots to separate nested fields. When
+        set, changes to these lists are appended to a journal instead of
+        rewriting the whole file, and the journal is compacted into the file
+        from time to time.
+
+        Cores without journal support load the file without the journal. The
+        journal is compacted on shutdown and at least every
+        JOURNAL_COMPACT_INTERVAL seconds while changes are written, so only
+        changes from after the last compaction are lost when downgrading
+        after an unclean shutdown. A journal left behind by such a core is
+        ignored, as it does not belong to the file it writes.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +325,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal_collections = journal_collections
+        self._journal_state: _JournalState | None = None
+        self._journal_compact = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def _journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -380,6 +455,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if "journal" in data:
+            data = await self.hass.async_add_executor_job(self._load_journal, data)
+            self._async_ensure_journal_compacted_on_final_write()
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -510,6 +589,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        # Leave a compacted file behind when shutting down
+        self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -521,6 +602,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if self._data is None:
                 # Another write already consumed the data
+                if self._journal_compact and not self._read_only:
+                    await self._async_compact_journal()
                 return
 
             data = self._data
@@ -533,6 +616,33 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            self._async_ensure_journal_compacted_on_final_write()
+
+    @callback
+    def _async_ensure_journal_compacted_on_final_write(self) -> None:
+        """Compact the journal when shutting down if it holds changes."""
+        if self._journal_state is not None and self._journal_state.journal_size:
+            self._async_ensure_final_write_listener()
+
+    async def _async_compact_journal(self) -> None:
+        """Write the changes in the journal to the file."""
+        try:
+            await self.hass.async_add_executor_job(self._compact_journal)
+        except WriteError as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    def _compact_journal(self) -> None:
+        """Write the changes in the journal to the file."""
+        self._journal_compact = False
+        if (state := self._journal_state) is None or not state.journal_size:
+            return
+        data = {
+            "version": state.version,
+            "minor_version": state.minor_version,
+            "key": self.key,
+            "data": dict.fromkeys((*state.collections, *state.values)),
+        }
+        self._write_snapshot(self.path, data, state.collections, state.values)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -544,6 +654,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal_collections is not None:
+            self._write_journaled(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -553,6 +667,235 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journaled(self, path: str, data: dict) -> None:
+        """Append the changes since the last write to the journal.
+
+        Each write appends one line to the journal and is flushed to disk
+        before returning. A line left incomplete by an interrupted write is
+        ignored when loading, so a write is applied completely or not at all.
+        """
+        assert self._journal_collections is not None
+        stored: dict[str, Any] = data["data"]
+        if isinstance(stored, list):
+            stored = {"": stored}
+        collections: dict[str, dict[str, bytes]] = {}
+        try:
+            for name, field in self._journal_collections.items():
+                items = stored[name]
+                if isinstance(items, JournalItems):
+                    keys = items.keys
+                else:
+                    keys = [_journal_item_key(item, field) for item in items]
+                collections[name] = {
+                    key: json_helper.json_bytes(item)
+                    for key, item in zip(keys, items, strict=True)
+                }
+            values = {
+                key: json_helper.json_bytes(value)
+                for key, value in stored.items()
+                if key not in self._journal_collections
+            }
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}"
+            ) from err
+
+        state = self._journal_state
+        compact = self._journal_compact
+        self._journal_compact = False
+        if (
+            state is None
+            or state.version != data["version"]
+            or state.minor_version != data["minor_version"]
+            or state.values.keys() != values.keys()
+        ):
+            self._write_snapshot(path, data, collections, values)
+            return
+
+        changed = {
+            name: {
+                key: json_helper.json_fragment(item)
+                for key, item in items.items()
+                if state.collections[name].get(key) != item
+            }
+            for name, items in collections.items()
+        }
+        removed = {
+            name: [key for key in state.collections[name] if key not in items]
+            for name, items in collections.items()
+        }
+        changed_values = {
+            key: json_helper.json_fragment(value)
+            for key, value in values.items()
+            if state.values[key] != value
+        }
+        if not changed_values and not any((*changed.values(), *removed.values())):
+            if compact and state.journal_size:
+                self._write_snapshot(path, data, collections, values)
+            return
+        if (
+            compact
+            or state.journal_size
+            > max(JOURNAL_MIN_COMPACT_SIZE, state.snapshot_size * JOURNAL_COMPACT_RATIO)
+            or time.monotonic() - state.snapshot_time > JOURNAL_COMPACT_INTERVAL
+        ):
+            self._write_snapshot(path, data, collections, values)
+            return
+
+        record = (
+            json_helper.json_bytes(
+                {
+                    "generation": state.generation,
+                    "set": {name: items for name, items in changed.items() if items},
+                    "remove": {name: keys for name, keys in removed.items() if keys},
+                    "values": changed_values,
+                }
+            )
+            + b"\n"
+        )
+        _LOGGER.debug("Appending data for %s to %s", self.key, self._journal_path)
+        try:
+            fd = os.open(
+                self._journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                view = memoryview(record)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", self._journal_path)
+            # The journal may now end with an incomplete line, start over
+            # with a new snapshot on the next write
+            self._journal_state = None
+            raise WriteError(error) from error
+
+        state.collections = collections
+        state.values = values
+        state.journal_size += len(record)
+
+    def _write_snapshot(
+        self,
+        path: str,
+        data: dict,
+        collections: dict[str, dict[str, bytes]],
+        values: dict[str, bytes],
+    ) -> None:
+        """Write all data to the file and start a new journal."""
+        assert self._journal_collections is not None
+        # Records in the journal belong to a generation of the snapshot, so
+        # records of an older generation are ignored if the journal could
+        # not be removed after writing the snapshot
+        generation = ulid_now()
+        stored: dict[str, Any] = {
+            key: [json_helper.json_fragment(item) for item in collections[key].values()]
+            if key in collections
+            else json_helper.json_fragment(values[key])
+            for key in (collections if "" in collections else data["data"])
+        }
+        snapshot = json_helper.json_bytes(
+            {
+                "version": data["version"],
+                "minor_version": data["minor_version"],
+                "key": data["key"],
+                "journal": {
+                    "generation": generation,
+                    "collections": dict(self._journal_collections),
+                },
+                "data": stored[""] if "" in collections else stored,
+            }
+        )
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        self._journal_state = None
+        write_utf8_file_atomic(path, snapshot, self._private, mode="wb")
+        with suppress(FileNotFoundError):
+            os.unlink(self._journal_path)
+        self._journal_state = _JournalState(
+            generation,
+            data["version"],
+            data["minor_version"],
+            collections,
+            values,
+            len(snapshot),
+            0,
+            time.monotonic(),
+        )
+
+    def _load_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the changes recorded in the journal to the loaded data."""
+        journal = data.pop("journal")
+        generation = journal["generation"]
+        stored: dict[str, Any] = data["data"]
+        if is_list := isinstance(stored, list):
+            stored = {"": stored}
+        collections: dict[str, dict[str, Any]] = {
+            name: {_journal_item_key(item, field): item for item in stored[name]}
+            for name, field in journal["collections"].items()
+        }
+        journal_size = 0
+        # Only continue the journal if it was read completely
+        complete = True
+        try:
+            with open(self._journal_path, "rb") as journal_file:
+                for line in journal_file:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("Incomplete line")
+                        record = json_util.json_loads_object(line)
+                    except (ValueError, *json_util.JSON_DECODE_EXCEPTIONS):
+                        _LOGGER.warning(
+                            "Ignoring incomplete record in %s", self._journal_path
+                        )
+                        complete = False
+                        break
+                    if record["generation"] != generation:
+                        complete = False
+                        break
+                    for name, items in record["set"].items():
+                        collections[name].update(items)
+                    for name, keys in record["remove"].items():
+                        for key in keys:
+                            collections[name].pop(key, None)
+                    stored.update(record["values"])
+                    journal_size += len(line)
+        except FileNotFoundError:
+            pass
+
+        for name, items in collections.items():
+            stored[name] = list(items.values())
+        if is_list:
+            data["data"] = stored[""]
+
+        if (
+            complete
+            and self._journal_collections is not None
+            and self._journal_collections.keys() == collections.keys()
+        ):
+            self._journal_state = _JournalState(
+                generation,
+                data["version"],
+                data.get("minor_version", 1),
+                {
+                    name: {
+                        key: json_helper.json_bytes(item) for key, item in items.items()
+                    }
+                    for name, items in collections.items()
+                },
+                {
+                    key: json_helper.json_bytes(value)
+                    for key, value in stored.items()
+                    if key not in collections
+                },
+                os.path.getsize(self.path),
+                journal_size,
+                time.monotonic(),
+            )
+        return data
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -565,3 +908,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_collections is not None:
+            self._journal_state = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal_path)
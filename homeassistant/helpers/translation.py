@@ -7,14 +7,17 @@ from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
+import os
 import pathlib
 import string
 from typing import Any
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    __version__,
 )
 from homeassistant.core import Event, HomeAssistant, async_get_hass, callback
 from homeassistant.loader import (
@@ -25,13 +28,16 @@ from homeassistant.loader import (
 )
 from homeassistant.util.json import load_json
 
-from . import singleton
+from . import singleton, storage
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+TRANSLATION_BUNDLE_STORAGE_KEY = "core.translations"
+TRANSLATION_BUNDLE_STORAGE_VERSION = 1
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -141,6 +147,129 @@ async def _async_get_component_strings(
     return translations_by_language
 
 
+def _translation_fingerprints(
+    languages: Iterable[str], integrations: dict[str, Integration]
+) -> dict[str, list[Any]]:
+    """Return fingerprints of the translation files of integrations.
+
+    Integrations are left out if their files can't be checked.
+    """
+    fingerprints: dict[str, list[Any]] = {}
+    for domain, integration in integrations.items():
+        # The title is taken from the name in the manifest
+        paths = [integration.file_path / "manifest.json"]
+        if integration.has_translations:
+            paths.extend(
+                component_translation_path(language, integration)
+                for language in languages
+            )
+        fingerprint: list[Any] = []
+        try:
+            for path in paths:
+                try:
+                    stat_result = os.stat(path)
+                except FileNotFoundError:
+                    fingerprint.append(None)
+                else:
+                    fingerprint.append([stat_result.st_mtime_ns, stat_result.st_size])
+        except OSError:
+            continue
+        fingerprints[domain] = fingerprint
+    return fingerprints
+
+
+class _TranslationBundle:
+    """Cached translations of a language, persisted between runs.
+
+    The strings of each integration are stored the way they are cached,
+    flattened and with the English fallback merged in, so they can be
+    served without reading, flattening and validating translation files.
+    Built-in integrations are valid for the running Home Assistant version,
+    unless it is a development version. Other integrations are checked
+    against the modification time and size of their manifest and
+    translation files. Changes are saved when Home Assistant stops.
+    """
+
+    __slots__ = (
+        "hass",
+        "language",
+        "_store",
+        "_domains",
+        "_trust_built_in",
+        "_save_scheduled",
+    )
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the bundle."""
+        self.hass = hass
+        self.language = language
+        self._store = storage.Store[dict[str, Any]](
+            hass,
+            TRANSLATION_BUNDLE_STORAGE_VERSION,
+            f"{TRANSLATION_BUNDLE_STORAGE_KEY}.{language}",
+        )
+        self._domains: dict[str, dict[str, Any]] = {}
+        self._trust_built_in = "dev" not in __version__
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the bundle, ignoring it if it was made by another version."""
+        if (data := await self._store.async_load()) and data.get(
+            "ha_version"
+        ) == __version__:
+            self._domains = data["domains"]
+
+    async def async_get_fingerprints(
+        self, languages: list[str], integrations: dict[str, Integration]
+    ) -> dict[str, list[Any]]:
+        """Return fingerprints of the translations of integrations."""
+        fingerprints: dict[str, list[Any]] = {}
+        to_check: dict[str, Integration] = {}
+        for domain, integration in integrations.items():
+            if self._trust_built_in and integration.is_built_in:
+                fingerprints[domain] = []
+            else:
+                to_check[domain] = integration
+        if to_check:
+            fingerprints.update(
+                await self.hass.async_add_executor_job(
+                    _translation_fingerprints, languages, to_check
+                )
+            )
+        return fingerprints
+
+    @callback
+    def async_get(
+        self, domain: str, fingerprint: list[Any]
+    ) -> dict[str, dict[str, str]] | None:
+        """Return the cached strings of an integration by category."""
+        if (entry := self._domains.get(domain)) and entry["fingerprint"] == fingerprint:
+            return entry["categories"]
+        return None
+
+    @callback
+    def async_set(
+        self,
+        domain: str,
+        fingerprint: list[Any],
+        categories: dict[str, dict[str, str]],
+    ) -> None:
+        """Remember the cached strings of an integration by category."""
+        self._domains[domain] = {"fingerprint": fingerprint, "categories": categories}
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_save
+            )
+
+    async def _async_save(self, _event: Event) -> None:
+        """Save the bundle."""
+        self._save_scheduled = False
+        await self._store.async_save(
+            {"ha_version": __version__, "domains": self._domains}
+        )
+
+
 @dataclass(slots=True)
 class _TranslationsCacheData:
     """Data for the translation cache.
@@ -157,13 +286,14 @@ class _TranslationsCacheData:
 class _TranslationCache:
     """Cache for flattened translations."""
 
-    __slots__ = ("hass", "cache_data", "lock")
+    __slots__ = ("hass", "cache_data", "lock", "bundles")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.cache_data = _TranslationsCacheData({}, {})
         self.lock = asyncio.Lock()
+        self.bundles: dict[str, _TranslationBundle] = {}
 
     @callback
     def async_is_loaded(self, language: str, components: set[str]) -> bool:
@@ -239,6 +369,42 @@ class _TranslationCache:
                 continue
             integrations[domain] = int_or_exc
 
+        # Serve what we can from the bundle of the previous run
+        bundle = await self._async_get_bundle(language)
+        fingerprints = await bundle.async_get_fingerprints(languages, integrations)
+        cached = self.cache_data.cache.setdefault(language, {})
+        components_to_build = set(components)
+        for domain, fingerprint in fingerprints.items():
+            if (categories := bundle.async_get(domain, fingerprint)) is not None:
+                for category, strings in categories.items():
+                    cached.setdefault(category, {})[domain] = strings
+                components_to_build.discard(domain)
+
+        if components_to_build:
+            await self._async_build(
+                language, components_to_build, languages, integrations
+            )
+            for domain in components_to_build.intersection(fingerprints):
+                bundle.async_set(
+                    domain,
+                    fingerprints[domain],
+                    {
+                        category: category_cache[domain]
+                        for category, category_cache in cached.items()
+                        if domain in category_cache
+                    },
+                )
+
+        loaded[language].update(components)
+
+    async def _async_build(
+        self,
+        language: str,
+        components: set[str],
+        languages: list[str],
+        integrations: dict[str, Integration],
+    ) -> None:
+        """Load and flatten the translation files of a set of components."""
         translation_by_language_strings = await _async_get_component_strings(
             self.hass, languages, components, integrations
         )
@@ -254,7 +420,9 @@ class _TranslationCache:
                 language, components, translation_by_language_strings[language]
             )
 
-            loaded_english_components = loaded.setdefault(LOCALE_EN, set())
+            loaded_english_components = self.cache_data.loaded.setdefault(
+                LOCALE_EN, set()
+            )
             # Since we just loaded english anyway we can avoid loading
             # again if they switch back to english.
             if loaded_english_components.isdisjoint(components):
@@ -263,7 +431,13 @@ class _TranslationCache:
                 )
                 loaded_english_components.update(components)
 
-        loaded[language].update(components)
+    async def _async_get_bundle(self, language: str) -> _TranslationBundle:
+        """Return the loaded translation bundle of a language."""
+        if (bundle := self.bundles.get(language)) is None:
+            bundle = _TranslationBundle(self.hass, language)
+            await bundle.async_load()
+            self.bundles[language] = bundle
+        return bundle
 
     def _validate_placeholders(
         self,
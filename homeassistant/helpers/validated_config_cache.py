@@ -0,0 +1,119 @@
+"""Cache validated config items of an integration between reloads."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import device_registry as dr, entity_registry as er
+from .dispatcher import async_dispatcher_connect
+
+DATA_VALIDATED_CONFIG_CACHES: HassKey[dict[str, ValidatedConfigCache[Any]]] = HassKey(
+    "validated_config_caches"
+)
+
+
+class ValidatedConfigCache[_T]:
+    """Validated config items keyed by the exact config they were validated from.
+
+    Only items which passed validation should be cached. Trigger, condition
+    and action platforms may validate against config entries and the device
+    and entity registries, so all items are dropped when entries in them are
+    updated or removed. Items which were not looked up or set since the
+    previous prune are dropped by async_prune.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._items: dict[bytes, _T] = {}
+        self._used: set[bytes] = set()
+
+    @callback
+    def async_key(self, config: Any) -> bytes | None:
+        """Return the cache key of a config, None if it can't be cached."""
+        try:
+            return orjson.dumps(
+                config,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            return None
+
+    @callback
+    def async_get(self, key: bytes | None) -> _T | None:
+        """Return the validated item for a key."""
+        if key is None or (item := self._items.get(key)) is None:
+            return None
+        self._used.add(key)
+        return item
+
+    @callback
+    def async_set(self, key: bytes | None, item: _T) -> None:
+        """Remember the validated item for a key."""
+        if key is None:
+            return
+        self._items[key] = item
+        self._used.add(key)
+
+    @callback
+    def async_prune(self) -> None:
+        """Drop items which were not used since the previous prune."""
+        self._items = {key: self._items[key] for key in self._used}
+        self._used = set()
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all items."""
+        self._items.clear()
+        self._used.clear()
+
+
+@callback
+def async_get_validated_config_cache(
+    hass: HomeAssistant, domain: str
+) -> ValidatedConfigCache[Any]:
+    """Return the validated config cache of an integration."""
+    if (caches := hass.data.get(DATA_VALIDATED_CONFIG_CACHES)) is None:
+        caches = hass.data[DATA_VALIDATED_CONFIG_CACHES] = {}
+
+        @callback
+        def _async_clear_caches() -> None:
+            for cache in caches.values():
+                cache.async_clear()
+
+        @callback
+        def _async_registry_updated(
+            event: Event[
+                er.EventEntityRegistryUpdatedData | dr.EventDeviceRegistryUpdatedData
+            ],
+        ) -> None:
+            # Only valid items are cached, new entries can't make them invalid
+            if event.data["action"] != "create":
+                _async_clear_caches()
+
+        @callback
+        def _async_config_entry_changed(
+            change: ConfigEntryChange, entry: ConfigEntry
+        ) -> None:
+            if change is not ConfigEntryChange.ADDED:
+                _async_clear_caches()
+
+        hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_registry_updated)
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated)
+        async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_ENTRY_CHANGED, _async_config_entry_changed
+        )
+
+    if (cache := caches.get(domain)) is None:
+        cache = caches[domain] = ValidatedConfigCache()
+    return cache
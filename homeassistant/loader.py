@@ -10,13 +10,17 @@ import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
+from fnmatch import translate
 import functools as ft
 from functools import cached_property
 import importlib
 import logging
 import os
 import pathlib
+import re
+import resource
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -26,10 +30,11 @@ from awesomeversion import (
     AwesomeVersionException,
     AwesomeVersionStrategy,
 )
+import orjson
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import EVENT_HOMEASSISTANT_STARTED, Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -39,6 +44,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
@@ -113,6 +119,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_SNAPSHOT: HassKey[ManifestSnapshot] = HassKey("manifest_snapshot")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, ImportTiming]] = HassKey("import_timings")
+MANIFEST_SNAPSHOT_FILE = "core.manifest_snapshot"
+MANIFEST_SNAPSHOT_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -209,6 +219,33 @@ class ZeroconfMatcher(TypedDict, total=False):
     properties: dict[str, str]
 
 
+_FNMATCH_SPECIAL_CHARS = frozenset("*?[")
+
+
+@ft.lru_cache(maxsize=4096)
+def compile_fnmatch(pattern: str) -> Callable[[str], bool]:
+    """Compile an fnmatch pattern of a discovery matcher into a match function.
+
+    Most patterns in manifests are literal names or only have a leading and/or
+    trailing *, these are matched with string comparisons instead of a regular
+    expression. Matching is case sensitive, discovery integrations lowercase
+    the names when the patterns are lowercase.
+    """
+    if not _FNMATCH_SPECIAL_CHARS.intersection(pattern):
+        return lambda name: name == pattern
+    starts = pattern.startswith("*")
+    ends = pattern.endswith("*") and len(pattern) > 1
+    literal = pattern[starts : len(pattern) - ends]
+    if not _FNMATCH_SPECIAL_CHARS.intersection(literal):
+        if starts and ends:
+            return lambda name: literal in name
+        if starts:
+            return lambda name: name.endswith(literal)
+        return lambda name: name.startswith(literal)
+    regex = re.compile(translate(pattern))
+    return lambda name: regex.match(name) is not None
+
+
 class Manifest(TypedDict, total=False):
     """Integration manifest.
 
@@ -253,6 +290,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -278,24 +316,31 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
+    snapshot = hass.data.get(DATA_MANIFEST_SNAPSHOT)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if snapshot and (names := snapshot.get_sub_directories(paths)) is not None:
+            return names
+        names = [
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
         ]
+        if snapshot:
+            snapshot.set_sub_directories(paths, names)
+        return names
 
     dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+        get_sub_directories, list(custom_components.__path__)
     )
 
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
     return {
         integration.domain: integration
@@ -635,6 +680,65 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@dataclass(slots=True, frozen=True)
+class ImportTiming:
+    """Cost of importing the component or a platform of an integration.
+
+    Imports done by other threads at the same time are counted as well,
+    so the numbers are an upper bound.
+    """
+
+    seconds: float
+    max_rss_delta: int
+    """Growth of the peak resident memory of the process, in bytes."""
+    packages: list[str]
+    """Third-party packages which were imported for the first time."""
+
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_MAX_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+_FIRST_PARTY_PACKAGES = {"homeassistant", PACKAGE_CUSTOM_COMPONENTS}
+
+
+def _import_module_timed(
+    import_timings: dict[str, ImportTiming], name: str, module_path: str
+) -> ModuleType:
+    """Import a module and record what it cost if it was not imported before.
+
+    This method must be thread-safe as it's called from the executor
+    and the event loop.
+    """
+    if module_path in sys.modules:
+        return importlib.import_module(module_path)
+    modules_before = len(sys.modules)
+    max_rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    module = importlib.import_module(module_path)
+    seconds = time.perf_counter() - start
+    max_rss_delta = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - max_rss_before
+    stdlib = sys.stdlib_module_names
+    packages = {
+        package
+        for module_name in list(sys.modules)[modules_before:]
+        if (package := module_name.partition(".")[0]) not in stdlib
+        and package not in _FIRST_PARTY_PACKAGES
+        and not package.startswith("_")
+    }
+    import_timings[name] = ImportTiming(
+        seconds, max_rss_delta * _MAX_RSS_UNIT, sorted(packages)
+    )
+    return module
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, ImportTiming]:
+    """Return what importing components and platforms cost.
+
+    Components are keyed by domain and platforms by domain.platform.
+    """
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -643,30 +747,41 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        snapshot = hass.data.get(DATA_MANIFEST_SNAPSHOT)
+        is_built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
-                continue
+            if snapshot and (
+                cached := snapshot.get_manifest(manifest_path, is_built_in)
+            ):
+                manifest, top_level_files = cached
+            else:
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if snapshot:
+                    snapshot.set_manifest(manifest_path, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -759,6 +874,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -919,6 +1035,11 @@ class Integration:
             return self._all_dependencies_resolved
 
         self._all_dependencies_resolved = False
+        snapshot = self.hass.data.get(DATA_MANIFEST_SNAPSHOT)
+        if snapshot and (hint := snapshot.get_dependencies(self.domain)):
+            # Load the manifests of the dependencies known from the last run
+            # in a single batch instead of one level of the tree at a time
+            await async_get_integrations(self.hass, hint)
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
         except IntegrationNotFound as err:
@@ -944,6 +1065,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if snapshot:
+                snapshot.set_dependencies(self.domain, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -1043,7 +1166,8 @@ class Integration:
         domain = self.domain
         try:
             cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol,
+                _import_module_timed(self._import_timings, domain, self.pkg_path),
             )
         except ImportError:
             raise
@@ -1272,7 +1396,11 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module_timed(
+            self._import_timings,
+            f"{self.domain}.{platform_name}",
+            f"{self.pkg_path}.{platform_name}",
+        )
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -1309,6 +1437,181 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+class ManifestSnapshot:
+    """On-disk snapshot of integration manifests from the previous run.
+
+    Reading hundreds of manifest.json files and listing integration
+    directories is slow on SD cards and network storage. The snapshot
+    remembers the parsed manifests, the top level files of each integration
+    (used by platforms_exists) and the dependency closure of each domain.
+
+    Built-in integrations are trusted as long as the Home Assistant version
+    matches, unless it is a development version. Custom integrations are
+    validated by comparing the modification times of their directory and
+    manifest, and the list of custom integrations by the modification time
+    of the custom_components directories. The snapshot is only a cache,
+    anything that fails validation is read from disk as before.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the snapshot."""
+        self.path = path
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._trust_built_in = "dev" not in __version__
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._sub_directories: dict[str, dict[str, Any]] = {}
+        self._dependencies: dict[str, list[str]] = {}
+
+    def load(self) -> None:
+        """Load the snapshot from disk, ignoring it if it is outdated.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        try:
+            data = json_loads(pathlib.Path(self.path).read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+            _LOGGER.debug("Ignoring unreadable manifest snapshot: %s", err)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_SNAPSHOT_VERSION
+            or data.get("ha_version") != __version__
+        ):
+            return
+        self._manifests = data["manifests"]
+        self._sub_directories = data["sub_directories"]
+        self._dependencies = data["dependencies"]
+
+    def save(self) -> None:
+        """Write the snapshot to disk if it changed.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            data = orjson.dumps(
+                {
+                    "version": MANIFEST_SNAPSHOT_VERSION,
+                    "ha_version": __version__,
+                    "manifests": self._manifests,
+                    "sub_directories": self._sub_directories,
+                    "dependencies": self._dependencies,
+                }
+            )
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_utf8_file(self.path, data, mode="wb")
+        except WriteError as err:
+            _LOGGER.debug("Unable to write manifest snapshot: %s", err)
+
+    def get_manifest(
+        self, manifest_path: pathlib.Path, is_built_in: bool
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files if still valid.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        if not (entry := self._manifests.get(str(manifest_path))):
+            return None
+        if not (is_built_in and self._trust_built_in):
+            try:
+                dir_mtime = manifest_path.parent.stat().st_mtime_ns
+                manifest_mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                return None
+            if entry["mtime"] != [dir_mtime, manifest_mtime]:
+                return None
+        files = entry["files"]
+        return entry["manifest"], None if files is None else set(files)
+
+    def set_manifest(
+        self,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Remember a manifest read from disk.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        try:
+            mtime = [
+                manifest_path.parent.stat().st_mtime_ns,
+                manifest_path.stat().st_mtime_ns,
+            ]
+        except OSError:
+            return
+        with self._lock:
+            self._manifests[str(manifest_path)] = {
+                "manifest": dict(manifest),
+                "files": None if top_level_files is None else sorted(top_level_files),
+                "mtime": mtime,
+            }
+            self.dirty = True
+
+    def _mtimes(self, paths: list[str]) -> dict[str, int] | None:
+        """Return the modification times of the paths."""
+        try:
+            return {path: os.stat(path).st_mtime_ns for path in paths}
+        except OSError:
+            return None
+
+    def get_sub_directories(self, paths: list[str]) -> list[str] | None:
+        """Return the sub directories of the paths if they did not change.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        key = os.pathsep.join(paths)
+        if not (entry := self._sub_directories.get(key)):
+            return None
+        if entry["mtime"] != self._mtimes(paths):
+            return None
+        return entry["names"]
+
+    def set_sub_directories(self, paths: list[str], names: list[str]) -> None:
+        """Remember the sub directories of the paths.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        if (mtimes := self._mtimes(paths)) is None:
+            return
+        with self._lock:
+            self._sub_directories[os.pathsep.join(paths)] = {
+                "names": names,
+                "mtime": mtimes,
+            }
+            self.dirty = True
+
+    def get_dependencies(self, domain: str) -> list[str] | None:
+        """Return the dependency closure of a domain from the last run."""
+        return self._dependencies.get(domain)
+
+    def set_dependencies(self, domain: str, dependencies: set[str]) -> None:
+        """Remember the dependency closure of a domain."""
+        if self._dependencies.get(domain) == (deps := sorted(dependencies)):
+            return
+        with self._lock:
+            self._dependencies[domain] = deps
+            self.dirty = True
+
+
+async def async_load_manifest_snapshot(hass: HomeAssistant) -> None:
+    """Load the manifest snapshot and save it again once started."""
+    snapshot = ManifestSnapshot(hass.config.path(".storage", MANIFEST_SNAPSHOT_FILE))
+    await hass.async_add_executor_job(snapshot.load)
+    hass.data[DATA_MANIFEST_SNAPSHOT] = snapshot
+
+    async def _async_save_snapshot(_: Any) -> None:
+        await hass.async_add_executor_job(snapshot.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_snapshot)
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -56,6 +56,7 @@ class RuntimeConfig:
     open_ui: bool = False
 
     safe_mode: bool = False
+    startup_trace: bool = False
 
 
 def can_use_pidfd() -> bool:
@@ -7,12 +7,19 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+import copy
 import json
 import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
 from timeit import default_timer as timer
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.generated.dhcp import DHCP
+from homeassistant.helpers import condition
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -312,6 +319,407 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def discovery_matchers(hass):
+    """Match 100k synthetic DHCP hostnames against the manifest matchers."""
+    patterns = [matcher["hostname"] for matcher in DHCP if "hostname" in matcher]
+    prefixes = ["esp_", "shelly", "tasmota-", "android-", "iphone", "lutron-", "x"]
+    hostnames = [f"{prefixes[i % len(prefixes)]}{i:06x}".lower() for i in range(10**5)]
+    matched = 0
+
+    start = timer()
+    for hostname in hostnames:
+        for pattern in patterns:
+            if loader.compile_fnmatch(pattern)(hostname):
+                matched += 1
+    return timer() - start
+
+
+@benchmark
+async def condition_trees(hass):
+    """Evaluate an or of 20 ands of 10 conditions each 10k times without trace."""
+    for idx in range(200):
+        hass.states.async_set(f"sensor.benchmark_{idx}", idx)
+    config = await condition.async_validate_condition_config(
+        hass,
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": [f"sensor.benchmark_{branch * 5 + idx}"],
+                            "state": str(branch * 5 + idx),
+                        }
+                        if idx % 2
+                        else {
+                            "condition": "numeric_state",
+                            "entity_id": [f"sensor.benchmark_{branch * 5 + idx}"],
+                            "above": branch * 5 + idx - 1,
+                            # Only the last branch matches, the others fail
+                            # on their last numeric state condition
+                            "below": branch * 5 + idx + (branch == 19 or idx != 8),
+                        }
+                        for idx in range(10)
+                    ],
+                }
+                for branch in range(20)
+            ],
+        },
+    )
+    check = await condition.async_from_config(hass, config)
+
+    start = timer()
+    for _ in range(10**4):
+        if not check(hass, {}):
+            raise RuntimeError("Condition tree did not match")
+    return timer() - start
+
+
+STREAM_BENCHMARK_STREAMS = 24
+STREAM_BENCHMARK_POOL_SIZE = 4
+
+
+class _NullKeyFrameConverter:
+    """Key frame converter that discards key frames."""
+
+    def create_codec_context(self, codec_context):
+        """Ignore the codec context."""
+
+    def stash_keyframe_packet(self, packet):
+        """Ignore the key frame."""
+
+
+def _generate_stream_source(path, duration=10):
+    """Write a h264 test video used as a stand-in for an RTSP source."""
+    # pylint: disable-next=import-outside-toplevel
+    import av
+
+    fps = 24
+    source = os.path.join(path, "source.mp4")
+    with av.open(source, mode="w") as container:
+        stream = container.add_stream("libx264", rate=fps)
+        stream.width = 640
+        stream.height = 360
+        stream.pix_fmt = "yuv420p"
+        stream.options.update({"g": str(fps), "keyint_min": str(fps)})
+        for frame_i in range(duration * fps):
+            frame = av.VideoFrame(stream.width, stream.height, "yuv420p")
+            for plane in frame.planes:
+                plane.update(bytes([frame_i % 256]) * plane.buffer_size)
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return source
+
+
+async def _run_stream_workers(hass, pool_size):
+    """Run stream workers over local media files and return the runtime."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.stream.core import STREAM_SETTINGS_NON_LL_HLS
+    from homeassistant.components.stream.diagnostics import Diagnostics
+    from homeassistant.components.stream.pool import StreamWorkerJob, StreamWorkerPool
+    from homeassistant.components.stream.worker import (
+        StreamState,
+        StreamWorkerError,
+        iter_stream_worker,
+    )
+
+    def consume(steps):
+        """Consume the stream until the end of the media file."""
+        with suppress(StreamWorkerError):
+            for _ in steps:
+                yield 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = await hass.async_add_executor_job(_generate_stream_source, tmp_dir)
+        jobs = []
+        all_diagnostics = []
+        for idx in range(STREAM_BENCHMARK_STREAMS):
+            diagnostics = Diagnostics()
+            all_diagnostics.append(diagnostics)
+            quit_event = threading.Event()
+            steps = iter_stream_worker(
+                source,
+                {},
+                copy.copy(STREAM_SETTINGS_NON_LL_HLS),
+                StreamState(hass, dict, diagnostics),
+                _NullKeyFrameConverter(),
+                quit_event,
+            )
+            jobs.append(
+                StreamWorkerJob(
+                    f"stream_{idx}", consume(steps), quit_event, diagnostics
+                )
+            )
+
+        pool = None
+        start = timer()
+        if pool_size:
+            pool = StreamWorkerPool(pool_size)
+            pool.start()
+            for job in jobs:
+                pool.submit(job)
+        else:
+            for job in jobs:
+                threading.Thread(name="stream_worker", target=job.run).start()
+        for job in jobs:
+            await hass.async_add_executor_job(job.join)
+        runtime = timer() - start
+        if pool:
+            await hass.async_add_executor_job(pool.shutdown)
+
+    cpu_time = sum(
+        diagnostics.as_dict().get("worker_cpu_time", 0)
+        for diagnostics in all_diagnostics
+    )
+    print(f"Stream worker cpu time: {cpu_time:.3f}s")
+    return runtime
+
+
+@benchmark
+async def stream_worker_threads(hass):
+    """Mux 24 local media files with a thread per stream."""
+    return await _run_stream_workers(hass, 0)
+
+
+@benchmark
+async def stream_worker_pool(hass):
+    """Mux 24 local media files with a pool of 4 stream worker threads."""
+    return await _run_stream_workers(hass, STREAM_BENCHMARK_POOL_SIZE)
+
+
+async def _resolve_builtin_integrations(hass, use_snapshot):
+    """Resolve all built-in integrations and their dependencies."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components, loader
+
+    domains = [
+        entry.name
+        for entry in os.scandir(components.__path__[0])
+        if entry.is_dir() and not entry.name.startswith("_")
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        if use_snapshot:
+            # Prime the snapshot like a previous run would have done
+            loader.async_setup(hass)
+            await loader.async_load_manifest_snapshot(hass)
+            integrations = await loader.async_get_integrations(hass, domains)
+            for integration in integrations.values():
+                if isinstance(integration, loader.Integration):
+                    await integration.resolve_dependencies()
+            await hass.async_add_executor_job(
+                hass.data[loader.DATA_MANIFEST_SNAPSHOT].save
+            )
+
+        start = timer()
+        loader.async_setup(hass)
+        if use_snapshot:
+            await loader.async_load_manifest_snapshot(hass)
+        integrations = await loader.async_get_integrations(hass, domains)
+        for integration in integrations.values():
+            if isinstance(integration, loader.Integration):
+                await integration.resolve_dependencies()
+        return timer() - start
+
+
+@benchmark
+async def resolve_integrations(hass):
+    """Resolve all built-in integration manifests and dependencies from disk."""
+    return await _resolve_builtin_integrations(hass, False)
+
+
+@benchmark
+async def resolve_integrations_snapshot(hass):
+    """Resolve all built-in integration manifests and dependencies from a snapshot."""
+    return await _resolve_builtin_integrations(hass, True)
+
+
+REGISTRY_BENCHMARK_ENTRIES = 50000
+REGISTRY_BENCHMARK_UPDATES = 100
+
+
+async def _registry_store_writes(hass, journaled):
+    """Update single registry entries and report bytes written and load time."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import storage
+
+    entries = {
+        f"{idx:032x}": {
+            "aliases": [],
+            "area_id": None,
+            "config_entry_id": f"{idx % 100:032x}",
+            "device_id": f"{idx // 4:032x}",
+            "entity_id": f"sensor.benchmark_{idx}",
+            "id": f"{idx:032x}",
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "original_name": f"Benchmark sensor {idx}",
+            "platform": "benchmark",
+            "unique_id": f"benchmark-{idx}",
+        }
+        for idx in range(REGISTRY_BENCHMARK_ENTRIES)
+    }
+
+    def data_to_save():
+        return {"entities": storage.JournalItems(entries)}
+
+    last_inode = None
+    last_journal_size = 0
+
+    def written_size(store):
+        """Return the size of the file if it was replaced, plus the journal."""
+        nonlocal last_inode, last_journal_size
+        size = 0
+        snapshot = os.stat(store.path)
+        if snapshot.st_ino != last_inode:
+            last_inode = snapshot.st_ino
+            size += snapshot.st_size
+        journal_size = 0
+        with suppress(FileNotFoundError):
+            journal_size = os.path.getsize(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        size += max(journal_size - last_journal_size, 0)
+        last_journal_size = journal_size
+        return size
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        journal_collections = {"entities": "id"} if journaled else None
+        store = storage.Store(
+            hass,
+            1,
+            "benchmark.registry",
+            atomic_writes=True,
+            journal_collections=journal_collections,
+        )
+        await store.async_save(data_to_save())
+        written_size(store)
+
+        written = 0
+        start = timer()
+        for idx in range(REGISTRY_BENCHMARK_UPDATES):
+            key = f"{idx * 7:032x}"
+            entries[key] = {**entries[key], "name": f"Renamed {idx}"}
+            await store.async_save(data_to_save())
+            written += written_size(store)
+        runtime = timer() - start
+
+        load_start = timer()
+        await storage.Store(
+            hass, 1, "benchmark.registry", journal_collections=journal_collections
+        ).async_load()
+        load_time = timer() - load_start
+
+    print(f"Bytes written per update: {written / REGISTRY_BENCHMARK_UPDATES:.0f}")
+    print(f"Load time: {load_time:.3f}s")
+    return runtime
+
+
+@benchmark
+async def registry_store_writes(hass):
+    """Update 100 entries of a 50k entry registry rewriting the file each time."""
+    return await _registry_store_writes(hass, False)
+
+
+@benchmark
+async def registry_store_writes_journaled(hass):
+    """Update 100 entries of a 50k entry registry with a journaled store."""
+    return await _registry_store_writes(hass, True)
+
+
+YAML_BENCHMARK_FILES = 1000
+YAML_BENCHMARK_RELOADS = 10
+
+
+def _write_yaml_benchmark_config(config_dir):
+    """Write a configuration split over many included files."""
+    os.makedirs(os.path.join(config_dir, "automations"))
+    os.makedirs(os.path.join(config_dir, "packages"))
+    with open(os.path.join(config_dir, "configuration.yaml"), "w") as fil:
+        fil.write(
+            "homeassistant:\n"
+            "  name: !secret name\n"
+            "  packages: !include_dir_named packages\n"
+            "automation: !include_dir_merge_list automations\n"
+        )
+    with open(os.path.join(config_dir, "secrets.yaml"), "w") as fil:
+        fil.write("name: Benchmark\npassword: secret\n")
+    for idx in range(YAML_BENCHMARK_FILES):
+        with open(
+            os.path.join(config_dir, "automations", f"automation_{idx}.yaml"), "w"
+        ) as fil:
+            fil.write(
+                f"- id: '{idx}'\n"
+                f"  alias: Automation {idx}\n"
+                "  trigger:\n"
+                "    - platform: state\n"
+                f"      entity_id: binary_sensor.motion_{idx}\n"
+                "      to: 'on'\n"
+                "  condition:\n"
+                "    - condition: time\n"
+                "      after: '08:00:00'\n"
+                "  action:\n"
+                "    - service: light.turn_on\n"
+                f"      target:\n        entity_id: light.room_{idx}\n"
+                "      data:\n        brightness_pct: 80\n"
+            )
+        if idx % 10 == 0:
+            with open(
+                os.path.join(config_dir, "packages", f"package_{idx}.yaml"), "w"
+            ) as fil:
+                fil.write(
+                    "rest_command:\n"
+                    f"  command_{idx}:\n"
+                    f"    url: http://example.com/{idx}\n"
+                    "    password: !secret password\n"
+                )
+
+
+async def _yaml_config_reload(hass, cached):
+    """Load a large split configuration again and again."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import config as conf_util
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.yaml import Secrets
+
+    def load_config():
+        return conf_util.load_yaml_config_file(
+            hass.config.path(conf_util.YAML_CONFIG_FILE),
+            Secrets(Path(hass.config.config_dir)),
+            hass.data.get(conf_util.DATA_YAML_CACHE),
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await hass.async_add_executor_job(_write_yaml_benchmark_config, tmp_dir)
+        if cached:
+            conf_util.async_enable_yaml_cache(hass)
+            # Prime the cache like a previous run would have done
+            await hass.async_add_executor_job(load_config)
+
+        start = timer()
+        for _ in range(YAML_BENCHMARK_RELOADS):
+            await hass.async_add_executor_job(load_config)
+        return timer() - start
+
+
+@benchmark
+async def yaml_config_reload(hass):
+    """Load a configuration of 1000 included files 10 times."""
+    return await _yaml_config_reload(hass, False)
+
+
+@benchmark
+async def yaml_config_reload_cached(hass):
+    """Load a configuration of 1000 included files 10 times with the YAML cache."""
+    return await _yaml_config_reload(hass, True)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
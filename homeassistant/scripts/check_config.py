@@ -7,6 +7,7 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Callable, Mapping, Sequence
 from glob import glob
+import json
 import logging
 import os
 from typing import Any
@@ -82,6 +83,11 @@ def run(script_args: list) -> int:
     parser.add_argument(
         "-s", "--secrets", action="store_true", help="Show secret information"
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print errors, warnings and validation time per domain as JSON",
+    )
 
     args, unknown = parser.parse_known_args()
     if unknown:
@@ -89,6 +95,23 @@ def run(script_args: list) -> int:
 
     config_dir = os.path.join(os.getcwd(), args.config)
 
+    if args.json:
+        res = check(config_dir)
+        components = res.get("components")
+        print(
+            json.dumps(
+                {
+                    "valid": not res["except"],
+                    "errors": res["except"],
+                    "warnings": res["warn"],
+                    "timings": components.timings if components is not None else {},
+                },
+                default=str,
+                indent=2,
+            )
+        )
+        return len(res["except"])
+
     print(color("bold", "Testing configuration at", config_dir))
 
     res = check(config_dir, args.secrets)
@@ -181,10 +204,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable-next=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, *, cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
-        return MOCKS["load"][1](filename, secrets)
+        return MOCKS["load"][1](filename, secrets, cache=cache)
 
     # pylint: disable-next=possibly-unused-variable
     def mock_secrets(ldr, node):
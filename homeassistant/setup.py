@@ -72,6 +72,11 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TRACE is a list of Chrome trace events recording when each
+# setup phase started and how long it took. It is only present when
+# tracing was enabled with async_enable_setup_trace.
+DATA_SETUP_TRACE: HassKey[list[dict[str, Any]]] = HassKey("setup_trace")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -701,6 +706,10 @@ def async_pause_setup(
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        if (trace := hass.data.get(DATA_SETUP_TRACE)) is not None:
+            _async_add_trace_event(
+                trace, integration, group, phase, started, time_taken
+            )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -764,6 +773,10 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        if (trace := hass.data.get(DATA_SETUP_TRACE)) is not None:
+            _async_add_trace_event(
+                trace, integration, group, phase, started, time_taken
+            )
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -782,6 +795,89 @@ def async_start_setup(
             )
 
 
+def _async_add_trace_event(
+    trace: list[dict[str, Any]],
+    integration: str,
+    group: str | None,
+    phase: SetupPhases,
+    started: float,
+    time_taken: float,
+) -> None:
+    """Record a setup phase as a Chrome trace complete event."""
+    trace.append(
+        {
+            "name": integration if group is None else f"{integration} ({group})",
+            "cat": str(phase),
+            "ph": "X",
+            "ts": round(started * 1_000_000),
+            "dur": round(time_taken * 1_000_000),
+            "pid": 0,
+            # Each integration gets its own row in the timeline
+            "tid": integration,
+        }
+    )
+
+
+@contextlib.contextmanager
+def async_trace_setup_stage(
+    hass: core.HomeAssistant, stage: str
+) -> Generator[None, None, None]:
+    """Record a bootstrap stage in the setup trace, if enabled."""
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.append(
+            {
+                "name": stage,
+                "cat": "stage",
+                "ph": "X",
+                "ts": round(started * 1_000_000),
+                "dur": round((time.monotonic() - started) * 1_000_000),
+                "pid": 0,
+                "tid": "bootstrap",
+            }
+        )
+
+
+@callback
+def async_enable_setup_trace(hass: core.HomeAssistant) -> None:
+    """Start recording setup phases for async_get_setup_trace."""
+    hass.data.setdefault(DATA_SETUP_TRACE, [])
+
+
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> dict[str, Any] | None:
+    """Return the recorded setup phases in the Chrome trace event format.
+
+    The result can be loaded in chrome://tracing or https://ui.perfetto.dev
+    to see which setups were running in parallel and which were waiting.
+    Returns None if tracing was not enabled.
+    """
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is None:
+        return None
+    thread_ids: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+    for event in trace:
+        integration = event["tid"]
+        if (thread_id := thread_ids.get(integration)) is None:
+            thread_id = thread_ids[integration] = len(thread_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 0,
+                    "tid": thread_id,
+                    "args": {"name": integration},
+                }
+            )
+        events.append({**event, "tid": thread_id})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
 @callback
 def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     """Return timing data for each integration."""
@@ -1,5 +1,6 @@
 """YAML utility functions."""
 
+from .cache import YamlCache
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
@@ -19,6 +20,7 @@ __all__ = [
     "dump",
     "save_yaml",
     "Secrets",
+    "YamlCache",
     "YamlTypeError",
     "load_yaml",
     "load_yaml_dict",
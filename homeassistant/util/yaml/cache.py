@@ -0,0 +1,121 @@
+"""Cache of parsed YAML files."""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import sys
+import threading
+from typing import Any
+
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+YAML_CACHE_VERSION = 1
+
+type YamlCacheKey = tuple[int, int]
+
+
+def yaml_cache_key(stat_result: os.stat_result) -> YamlCacheKey:
+    """Return the cache key of a file from its modification time and size."""
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class YamlCache:
+    """Parsed YAML files keyed by path, modification time and size.
+
+    The cached trees are encoded by the loader and keep includes, secrets
+    and environment variables unresolved, so they only depend on the
+    content of the file itself and are resolved again on every load.
+    The cache is stored with marshal, which is specific to the Python
+    version, so it is discarded when Python is upgraded.
+    """
+
+    def __init__(self, path: str | None) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.dirty = False
+        self._loaded = path is None
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[YamlCacheKey, Any]] = {}
+        self._skipped: set[str] = set()
+
+    def _load(self) -> None:
+        """Load the cache from disk, ignoring it if it is outdated."""
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "rb") as cache_file:
+                data = marshal.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring unreadable YAML cache: %s", err)
+            return
+        if (
+            not isinstance(data, tuple)
+            or len(data) != 3
+            or data[0] != YAML_CACHE_VERSION
+            or data[1] != sys.version_info[:2]
+            or not isinstance(data[2], dict)
+        ):
+            return
+        self._entries = data[2]
+
+    def get(self, name: str, key: YamlCacheKey) -> Any | None:
+        """Return the encoded tree of a file if it did not change.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+        if (entry := self._entries.get(name)) is None or entry[0] != key:
+            return None
+        return entry[1]
+
+    def set(self, name: str, key: YamlCacheKey, tree: Any) -> None:
+        """Remember the encoded tree of a file."""
+        with self._lock:
+            if name in self._skipped:
+                self._skipped.discard(name)
+                self._entries.pop(name, None)
+            else:
+                self._entries[name] = (key, tree)
+            self.dirty = True
+
+    def skip(self, name: str) -> None:
+        """Do not cache the file currently being parsed.
+
+        Used when parsing the file has side effects, like logging a warning,
+        which would be lost if the file was loaded from the cache.
+        """
+        with self._lock:
+            self._skipped.add(name)
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed, dropping removed files.
+
+        This method does blocking I/O and must run in the executor.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            entries = self._entries = {
+                name: entry
+                for name, entry in self._entries.items()
+                if os.path.exists(name)
+            }
+            data = marshal.dumps((YAML_CACHE_VERSION, sys.version_info[:2], entries))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_utf8_file(self.path, data, private=True, mode="wb")
+        except WriteError as err:
+            _LOGGER.debug("Unable to write YAML cache: %s", err)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
@@ -27,6 +29,7 @@ from functools import cached_property
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.frame import report
 
+from .cache import YamlCache, yaml_cache_key
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -128,7 +131,12 @@ class _LoaderMixin:
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
     """The fastest available safe loader, either C or Python."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
 
@@ -142,6 +150,7 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
 
 class SafeLoader(FastSafeLoader):
@@ -178,10 +187,16 @@ class SafeLoader(FastSafeLoader):
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     """Python safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
 
 class SafeLineLoader(PythonSafeLoader):
@@ -218,11 +233,45 @@ class SafeLineLoader(PythonSafeLoader):
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
+@dataclass(slots=True, frozen=True)
+class _DynamicNode:
+    """A node whose value depends on other files, secrets or the environment.
+
+    When parsing for the cache these nodes are kept unresolved, so the
+    cached tree only depends on the content of the parsed file.
+    """
+
+    tag: str
+    value: Any
+    line: int
+    mark: str
+
+
+type _DynamicResolver = Callable[
+    [_DynamicNode, str, Secrets | None, YamlCache | None], Any
+]
+
+
+class _UncacheableError(Exception):
+    """Raised when a parsed tree can not be stored in the cache."""
+
+
+_SCALAR_TYPES = {bool, bytes, float, int, str, type(None)}
+
+
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    *,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    If a cache is passed, unchanged files are not parsed again.
+    """
     try:
+        if cache is not None:
+            return _load_yaml_cached(os.fspath(fname), secrets, cache)
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
@@ -230,15 +279,36 @@ def load_yaml(
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_cached(
+    fname: str, secrets: Secrets | None, cache: YamlCache
+) -> JSON_TYPE | None:
+    """Load a YAML file, taking its parse tree from the cache if unchanged."""
+    key = yaml_cache_key(os.stat(fname))
+    if (tree := cache.get(fname, key)) is None:
+        with open(fname, encoding="utf-8") as conf_file:
+            loaded_yaml = parse_yaml(conf_file, secrets, cache=cache)
+        try:
+            tree = _encode_tree(loaded_yaml)
+        except _UncacheableError:
+            # Rare tags we can't encode, parse again resolving everything
+            with open(fname, encoding="utf-8") as conf_file:
+                return parse_yaml(conf_file, secrets)
+        cache.set(fname, key, tree)
+    return _decode_tree(tree, fname, secrets, cache)
+
+
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    *,
+    cache: YamlCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache=cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -247,28 +317,37 @@ def load_yaml_dict(
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    *,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
-    """Parse YAML with the fastest available loader."""
+    """Parse YAML with the fastest available loader.
+
+    If a cache is passed, includes, secrets and environment variables are
+    left unresolved so the result can be encoded for the cache.
+    """
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content, secrets, cache)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(PythonSafeLoader, content, secrets, cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -278,33 +357,119 @@ def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    return yaml.load(content, Loader=lambda stream: loader(stream, secrets, cache))  # type: ignore[arg-type]
+
+
+def _encode_tree(obj: Any) -> Any:
+    """Encode a parse tree with unresolved dynamic nodes for the cache.
+
+    Node classes are encoded as tuples, which never occur in parsed YAML.
+    Their file name is not stored as it is always the parsed file.
+    """
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
+        return obj
+    if obj_type is NodeStrClass:
+        return ("s", str(obj), getattr(obj, "__line__", None))
+    if obj_type is NodeDictClass:
+        return (
+            "d",
+            getattr(obj, "__line__", None),
+            tuple(
+                item
+                for key, value in obj.items()
+                for item in (_encode_tree(key), _encode_tree(value))
+            ),
+        )
+    if obj_type is NodeListClass:
+        return (
+            "l",
+            getattr(obj, "__line__", None),
+            tuple(_encode_tree(item) for item in obj),
+        )
+    if obj_type is _DynamicNode and isinstance(obj.value, str):
+        return ("x", obj.tag, str(obj.value), obj.line, obj.mark)
+    if obj_type is datetime:
+        return ("t", obj.isoformat())
+    if obj_type is date:
+        return ("D", obj.isoformat())
+    if obj_type is Input:
+        return ("i", obj.name)
+    raise _UncacheableError(obj_type)
+
+
+def _decode_tree(
+    tree: Any, name: str, secrets: Secrets | None, cache: YamlCache
+) -> Any:
+    """Decode a cached parse tree and resolve its dynamic nodes."""
+    if type(tree) is not tuple:
+        return tree
+    kind = tree[0]
+    obj: NodeDictClass | NodeListClass | NodeStrClass
+    if kind == "s":
+        obj = NodeStrClass(tree[1])
+        line = tree[2]
+    elif kind == "d":
+        items = [
+            _decode_tree(item, name, secrets, cache) if type(item) is tuple else item
+            for item in tree[2]
+        ]
+        obj = NodeDictClass(zip(items[::2], items[1::2], strict=True))
+        line = tree[1]
+    elif kind == "l":
+        obj = NodeListClass(
+            _decode_tree(item, name, secrets, cache) if type(item) is tuple else item
+            for item in tree[2]
+        )
+        line = tree[1]
+    elif kind == "x":
+        node = _DynamicNode(*tree[1:])
+        return _DYNAMIC_RESOLVERS[node.tag](node, name, secrets, cache)
+    elif kind == "t":
+        return datetime.fromisoformat(tree[1])
+    elif kind == "D":
+        return date.fromisoformat(tree[1])
+    else:
+        return Input(tree[1])
+    obj.__config_file__ = name
+    if line is not None:
+        obj.__line__ = line
+    return obj
+
+
+def _construct_dynamic(loader: LoaderType, node: yaml.nodes.Node) -> Any:
+    """Resolve a dynamic node, or keep it unresolved when parsing for the cache."""
+    dynamic = _DynamicNode(
+        node.tag, node.value, node.start_mark.line + 1, str(node.start_mark)
+    )
+    if loader.cache is not None:
+        return dynamic
+    return _DYNAMIC_RESOLVERS[node.tag](dynamic, loader.get_name, loader.secrets, None)
 
 
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
+    obj: list | NodeListClass, name: str, line: int
 ) -> NodeListClass: ...
 
 
 @overload
-def _add_reference(
-    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
-) -> NodeStrClass: ...
+def _add_reference(obj: str | NodeStrClass, name: str, line: int) -> NodeStrClass: ...
 
 
 @overload
 def _add_reference(
-    obj: dict | NodeDictClass, loader: LoaderType, node: yaml.nodes.Node
+    obj: dict | NodeDictClass, name: str, line: int
 ) -> NodeDictClass: ...
 
 
 def _add_reference(
     obj: dict | list | str | NodeDictClass | NodeListClass | NodeStrClass,
-    loader: LoaderType,
-    node: yaml.nodes.Node,
+    name: str,
+    line: int,
 ) -> NodeDictClass | NodeListClass | NodeStrClass:
     """Add file reference information to an object."""
     if isinstance(obj, list):
@@ -313,36 +478,36 @@ def _add_reference(
         obj = NodeStrClass(obj)
     elif isinstance(obj, dict):
         obj = NodeDictClass(obj)
-    return _add_reference_to_node_class(obj, loader, node)
+    return _add_reference_to_node_class(obj, name, line)
 
 
 @overload
 def _add_reference_to_node_class(
-    obj: NodeListClass, loader: LoaderType, node: yaml.nodes.Node
+    obj: NodeListClass, name: str, line: int
 ) -> NodeListClass: ...
 
 
 @overload
 def _add_reference_to_node_class(
-    obj: NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
+    obj: NodeStrClass, name: str, line: int
 ) -> NodeStrClass: ...
 
 
 @overload
 def _add_reference_to_node_class(
-    obj: NodeDictClass, loader: LoaderType, node: yaml.nodes.Node
+    obj: NodeDictClass, name: str, line: int
 ) -> NodeDictClass: ...
 
 
 def _add_reference_to_node_class(
     obj: NodeDictClass | NodeListClass | NodeStrClass,
-    loader: LoaderType,
-    node: yaml.nodes.Node,
+    name: str,
+    line: int,
 ) -> NodeDictClass | NodeListClass | NodeStrClass:
     """Add file reference information to a node class object."""
     try:  # suppress is much slower
-        obj.__config_file__ = loader.get_name
-        obj.__line__ = node.start_mark.line + 1
+        obj.__config_file__ = name
+        obj.__line__ = line
     except AttributeError:
         pass
     return obj
@@ -355,16 +520,21 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
-    fname = os.path.join(os.path.dirname(loader.get_name), node.value)
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_include(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> JSON_TYPE:
+    """Resolve the !include tag."""
+    fname = os.path.join(os.path.dirname(name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache=cache)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
-        return _add_reference(loaded_yaml, loader, node)
+        return _add_reference(loaded_yaml, name, node.line)
     except FileNotFoundError as exc:
-        raise HomeAssistantError(
-            f"{node.start_mark}: Unable to read file {fname}."
-        ) from exc
+        raise HomeAssistantError(f"{node.mark}: Unable to read file {fname}.") from exc
 
 
 def _is_file_valid(name: str) -> bool:
@@ -384,46 +554,67 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
 
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_include_dir_named(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> NodeDictClass:
+    """Resolve the !include_dir_named tag."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(os.path.dirname(name), node.value)
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache=cache)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
             loaded_yaml = NodeDictClass()
         mapping[filename] = loaded_yaml
-    return _add_reference_to_node_class(mapping, loader, node)
+    return _add_reference_to_node_class(mapping, name, node.line)
 
 
 def _include_dir_merge_named_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeDictClass:
     """Load multiple files from directory as a merged dictionary."""
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_include_dir_merge_named(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> NodeDictClass:
+    """Resolve the !include_dir_merge_named tag."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(os.path.dirname(name), node.value)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache=cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
-    return _add_reference_to_node_class(mapping, loader, node)
+    return _add_reference_to_node_class(mapping, name, node.line)
 
 
 def _include_dir_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_include_dir_list(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> list[JSON_TYPE]:
+    """Resolve the !include_dir_list tag."""
+    loc = os.path.join(os.path.dirname(name), node.value)
     return [
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, secrets, cache=cache)) is not None
     ]
 
 
@@ -431,15 +622,22 @@ def _include_dir_merge_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_include_dir_merge_list(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> JSON_TYPE:
+    """Resolve the !include_dir_merge_list tag."""
+    loc: str = os.path.join(os.path.dirname(name), node.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache=cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
-    return _add_reference(merged_list, loader, node)
+    return _add_reference(merged_list, name, node.line)
 
 
 def _handle_mapping_tag(
@@ -478,15 +676,20 @@ def _handle_mapping_tag(
                 seen[key],
                 line,
             )
+            if loader.cache is not None:
+                # Keep warning about it on every load
+                loader.cache.skip(loader.get_name)
         seen[key] = line
 
-    return _add_reference_to_node_class(NodeDictClass(nodes), loader, node)
+    return _add_reference_to_node_class(
+        NodeDictClass(nodes), loader.get_name, node.start_mark.line + 1
+    )
 
 
 def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
-    return _add_reference(obj, loader, node)
+    return _add_reference(obj, loader.get_name, node.start_mark.line + 1)
 
 
 def _handle_scalar_tag(
@@ -496,11 +699,20 @@ def _handle_scalar_tag(
     obj = node.value
     if not isinstance(obj, str):
         return obj
-    return _add_reference_to_node_class(NodeStrClass(obj), loader, node)
+    return _add_reference_to_node_class(
+        NodeStrClass(obj), loader.get_name, node.start_mark.line + 1
+    )
 
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_env_var(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> str:
+    """Resolve the !env_var tag."""
     args = node.value.split()
 
     # Check for a default value
@@ -514,10 +726,28 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
-    if loader.secrets is None:
+    return _construct_dynamic(loader, node)
+
+
+def _resolve_secret(
+    node: _DynamicNode, name: str, secrets: Secrets | None, cache: YamlCache | None
+) -> JSON_TYPE:
+    """Resolve the !secret tag."""
+    if secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    return secrets.get(name, node.value)
+
+
+_DYNAMIC_RESOLVERS: dict[str, _DynamicResolver] = {
+    "!include": _resolve_include,
+    "!include_dir_list": _resolve_include_dir_list,
+    "!include_dir_merge_list": _resolve_include_dir_merge_list,
+    "!include_dir_named": _resolve_include_dir_named,
+    "!include_dir_merge_named": _resolve_include_dir_merge_named,
+    "!env_var": _resolve_env_var,
+    "!secret": _resolve_secret,
+}
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
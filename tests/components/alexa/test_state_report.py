@@ -1,9 +1,11 @@
 """Test report state."""
 
+from datetime import timedelta
 import json
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
@@ -794,3 +796,45 @@ async def test_proactive_mode_filter_states(
 
         await hass.async_block_till_done()
     assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_skips_unchanged_properties(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test unchanged states and properties are not reported again."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    await state_report.async_enable_proactive_mode(hass, get_default_config(hass))
+
+    hass.states.async_set("input_boolean.test", "on", {"friendly_name": "Test"})
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Only the time of the properties differs
+    freezer.tick(timedelta(seconds=5))
+    hass.states.async_set(
+        "input_boolean.test", "on", {"friendly_name": "Test", "icon": "mdi:test"}
+    )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # The same state and attributes are not serialized again
+    with patch(
+        "homeassistant.components.alexa.entities.AlexaEntity.serialize_properties"
+    ) as mock_serialize:
+        hass.states.async_set(
+            "input_boolean.test",
+            "on",
+            {"friendly_name": "Test", "icon": "mdi:test"},
+            force_update=True,
+        )
+        await hass.async_block_till_done()
+    mock_serialize.assert_not_called()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    hass.states.async_set(
+        "input_boolean.test", "off", {"friendly_name": "Test", "icon": "mdi:test"}
+    )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 2
@@ -819,6 +819,60 @@ async def test_reload_unchanged_does_not_stop(
     assert len(calls) == 1
 
 
+async def test_reload_only_validates_changed_automations(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test automations which did not change are not validated again on reload."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "sun",
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "moon",
+                "alias": "bye",
+                "trigger": {"platform": "event", "event_type": "test_event2"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    new_config = {
+        automation.DOMAIN: [
+            config[automation.DOMAIN][0],
+            {**config[automation.DOMAIN][1], "alias": "good night"},
+        ]
+    }
+    with (
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=new_config,
+        ),
+        patch(
+            "homeassistant.components.automation.config.async_validate_trigger_config",
+            wraps=automation.config.async_validate_trigger_config,
+        ) as validate_mock,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert validate_mock.call_count == 1
+    assert hass.states.get("automation.hello") is not None
+    # The entity id of the automation with a unique id is kept
+    assert hass.states.get("automation.good_night") is None
+    state = hass.states.get("automation.bye")
+    assert state is not None
+    assert state.attributes["friendly_name"] == "good night"
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_reload_single_unchanged_does_not_stop(
     hass: HomeAssistant, calls
 ) -> None:
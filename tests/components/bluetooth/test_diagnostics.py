@@ -227,6 +227,7 @@ async def test_diagnostics(
                     "manager": False,
                 },
             },
+            "passive_update_processors": {},
         }
         diag_scanners = diag["manager"].pop("scanners")
         expected_scanners = expected["manager"].pop("scanners")
@@ -410,6 +411,7 @@ async def test_diagnostics_macos(
                     "manager": False,
                 },
             },
+            "passive_update_processors": {},
         }
 
 
@@ -624,6 +626,7 @@ async def test_diagnostics_remote_adapter(
                     "manager": False,
                 },
             },
+            "passive_update_processors": {},
         }
 
         diag_scanners = diag["manager"].pop("scanners")
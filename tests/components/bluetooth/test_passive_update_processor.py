@@ -31,6 +31,7 @@ from homeassistant.components.bluetooth.passive_update_processor import (
     PassiveBluetoothEntityKey,
     PassiveBluetoothProcessorCoordinator,
     PassiveBluetoothProcessorEntity,
+    async_get_advertisement_stats,
 )
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
@@ -398,6 +399,52 @@ async def test_entity_key_is_dispatched_on_entity_key_change(
     cancel_coordinator()
 
 
+async def test_advertisement_stats(
+    hass: HomeAssistant,
+    mock_bleak_scanner_start: MagicMock,
+    mock_bluetooth_adapters: None,
+) -> None:
+    """Test advertisements parsing to the same data are counted."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        return {"test": "data"}
+
+    @callback
+    def _async_generate_mock_data(
+        data: dict[str, str],
+    ) -> PassiveBluetoothDataUpdate:
+        """Generate mock data."""
+        return GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    processor = PassiveBluetoothDataProcessor(_async_generate_mock_data)
+    unregister_processor = coordinator.async_register_processor(processor)
+    cancel_coordinator = coordinator.async_start()
+    assert async_get_advertisement_stats(hass) == {
+        "aa:bb:cc:dd:ee:ff": {"received": 0, "unchanged": 0, "unchanged_ratio": 0.0}
+    }
+
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO)
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO_2)
+    assert async_get_advertisement_stats(hass) == {
+        "aa:bb:cc:dd:ee:ff": {"received": 2, "unchanged": 1, "unchanged_ratio": 0.5}
+    }
+
+    unregister_processor()
+    cancel_coordinator()
+    assert async_get_advertisement_stats(hass) == {}
+
+
 async def test_unavailable_after_no_data(
     hass: HomeAssistant,
     mock_bleak_scanner_start: MagicMock,
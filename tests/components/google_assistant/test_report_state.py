@@ -292,3 +292,54 @@ async def test_report_notifications(
             "Unable to send notification with result code: 404, check log for more info"
             in caplog.text
         )
+
+
+async def test_report_state_skips_unchanged_states(hass: HomeAssistant) -> None:
+    """Test forced updates with the same state are not serialized again."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with (
+        patch.object(
+            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        ) as mock_report,
+        patch.object(report_state, "INITIAL_REPORT_DELAY", 0),
+    ):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+
+    with (
+        patch(
+            "homeassistant.components.google_assistant.helpers.GoogleEntity.query_serialize",
+            return_value={"on": True, "online": True},
+        ) as mock_serialize,
+        patch.object(
+            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        ) as mock_report,
+    ):
+        hass.states.async_set("light.ceiling", "on")
+        await hass.async_block_till_done()
+        assert len(mock_serialize.mock_calls) == 1
+
+        hass.states.async_set("light.ceiling", "on", force_update=True)
+        await hass.async_block_till_done()
+        assert len(mock_serialize.mock_calls) == 1
+
+        hass.states.async_set("light.ceiling", "on", {"brightness": 10})
+        await hass.async_block_till_done()
+        assert len(mock_serialize.mock_calls) == 2
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.ceiling": {"on": True, "online": True}}}
+    }
+
+    unsub()
@@ -1938,3 +1938,70 @@ async def test_template_variable(hass: HomeAssistant, calls, multiplier) -> None
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_triggers_share_index(hass: HomeAssistant, calls) -> None:
+    """Test triggers with fixed thresholds only check crossed thresholds."""
+    hass.states.async_set("test.entity", 15)
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "below": threshold,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"below": threshold},
+                    },
+                }
+                for threshold in (10, 20, 30)
+            ]
+        },
+    )
+    indexes = hass.data[numeric_state_trigger.DATA_NUMERIC_STATE_INDEXES]
+    assert list(indexes) == [("test.entity", None)]
+
+    with patch.object(
+        numeric_state_trigger.IndexedTrigger,
+        "matches",
+        autospec=True,
+        side_effect=numeric_state_trigger.IndexedTrigger.matches,
+    ) as mock_matches:
+        # All triggers are checked after being set up
+        hass.states.async_set("test.entity", 16)
+        await hass.async_block_till_done()
+        assert mock_matches.call_count == 3
+        assert len(calls) == 0
+
+        # No threshold crossed
+        mock_matches.reset_mock()
+        hass.states.async_set("test.entity", 17)
+        await hass.async_block_till_done()
+        assert mock_matches.call_count == 0
+
+        # Only the trigger below 20 is crossed
+        hass.states.async_set("test.entity", 25)
+        await hass.async_block_till_done()
+        assert mock_matches.call_count == 1
+        assert len(calls) == 0
+
+        mock_matches.reset_mock()
+        hass.states.async_set("test.entity", 5)
+        await hass.async_block_till_done()
+        assert mock_matches.call_count == 2
+        assert sorted(call.data["below"] for call in calls) == [10, 20]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not indexes
@@ -3,7 +3,8 @@
 This includes tests for all mock object types.
 """
 
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -778,3 +779,71 @@ def test_home_driver(iid_storage) -> None:
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "title (any)", pin, "X-HM://0")
+
+
+async def test_home_driver_publish(hass: HomeAssistant, iid_storage) -> None:
+    """Test HomeDriver coalesces characteristic changes."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title", iid_storage=iid_storage)
+    driver.loop = hass.loop
+    driver.tid = threading.current_thread()
+    driver.topics = {"2.9": set(), "2.10": set(), "2.11": set()}
+
+    with patch("pyhap.accessory_driver.AccessoryDriver.publish") as mock_publish:
+        # Characteristics no controller is subscribed to are dropped
+        driver.publish({"aid": 2, "iid": 12, "value": 1})
+        await hass.async_block_till_done()
+        mock_publish.assert_not_called()
+
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        driver.publish({"aid": 2, "iid": 9, "value": 0})
+        driver.publish({"aid": 2, "iid": 10, "value": 50}, ("1.2.3.4", 5))
+        mock_publish.assert_not_called()
+        await hass.async_block_till_done()
+        assert mock_publish.mock_calls == [
+            call({"aid": 2, "iid": 9, "value": 0}, None),
+            call({"aid": 2, "iid": 10, "value": 50}, ("1.2.3.4", 5)),
+        ]
+        mock_publish.reset_mock()
+
+        # Values identical to the ones sent before are dropped
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        driver.publish({"aid": 2, "iid": 9, "value": 0})
+        driver.publish({"aid": 2, "iid": 10, "value": 50})
+        await hass.async_block_till_done()
+        mock_publish.assert_not_called()
+
+        # Immediate changes are always sent right away
+        driver.publish({"aid": 2, "iid": 11, "value": 0}, None, True)
+        driver.publish({"aid": 2, "iid": 11, "value": 0}, None, True)
+        assert mock_publish.mock_calls == [
+            call({"aid": 2, "iid": 11, "value": 0}, None, True),
+            call({"aid": 2, "iid": 11, "value": 0}, None, True),
+        ]
+        mock_publish.reset_mock()
+
+        # Changes published from other threads are queued in the event loop
+        await hass.async_add_executor_job(
+            driver.publish, {"aid": 2, "iid": 10, "value": 60}
+        )
+        await hass.async_block_till_done()
+        assert mock_publish.mock_calls == [
+            call({"aid": 2, "iid": 10, "value": 60}, None)
+        ]
+        mock_publish.reset_mock()
+
+        # Changes dropped while unsubscribed do not hide the next change
+        # from a controller that subscribes again
+        client = ("1.2.3.4", 5)
+        driver.async_subscribe_client_topic(client, "2.9", False)
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        await hass.async_block_till_done()
+        driver.async_subscribe_client_topic(client, "2.9")
+        driver.publish({"aid": 2, "iid": 9, "value": 0})
+        await hass.async_block_till_done()
+        assert mock_publish.mock_calls == [
+            call({"aid": 2, "iid": 9, "value": 0}, None)
+        ]
+
+    assert driver.sent_updates == 6
+    assert driver.suppressed_updates == 4
@@ -140,6 +140,7 @@ async def test_config_entry_running(
         },
         "config_version": 2,
         "pairing_id": ANY,
+        "updates": {"sent": ANY, "suppressed": ANY},
         "status": 1,
     }
 
@@ -289,6 +290,7 @@ async def test_config_entry_accessory(
         },
         "config_version": 2,
         "pairing_id": ANY,
+        "updates": {"sent": ANY, "suppressed": ANY},
         "iid_storage": {
             "1": {
                 "3E__14_": 2,
@@ -624,6 +626,7 @@ async def test_config_entry_with_trigger_accessory(
         },
         "config_version": 2,
         "pairing_id": ANY,
+        "updates": {"sent": ANY, "suppressed": ANY},
         "status": 1,
     }
     with (
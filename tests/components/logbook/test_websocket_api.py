@@ -28,6 +28,7 @@ from homeassistant.const import (
     CONF_INCLUDE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
 )
@@ -2965,3 +2966,84 @@ async def test_subscribe_all_entities_are_continuous_with_device(
     assert listeners_without_writes(
         hass.bus.async_listeners()
     ) == listeners_without_writes(init_listeners)
+
+
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_live_streams_share_listeners(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live streams share bus listeners and humanify each event once."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_wait_recording_done(hass)
+    init_listeners = hass.bus.async_listeners()
+    websocket_client = await hass_ws_client()
+    after_ws_created_listeners = hass.bus.async_listeners()
+
+    for msg_id, entity_ids in (
+        (7, None),
+        (8, ["light.small"]),
+        (9, ["light.other"]),
+    ):
+        request = {
+            "id": msg_id,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+        }
+        if entity_ids:
+            request["entity_ids"] = entity_ids
+        await websocket_client.send_json(request)
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == msg_id
+        assert msg["type"] == TYPE_RESULT
+        assert msg["success"]
+        for _ in range(2):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            assert msg["id"] == msg_id
+            assert msg["event"]["events"] == []
+
+    listeners = hass.bus.async_listeners()
+    assert (
+        listeners[EVENT_STATE_CHANGED]
+        == after_ws_created_listeners.get(EVENT_STATE_CHANGED, 0) + 1
+    )
+
+    with patch.object(
+        websocket_api.EventProcessor,
+        "humanify",
+        autospec=True,
+        side_effect=websocket_api.EventProcessor.humanify,
+    ) as mock_humanify:
+        hass.states.async_set("light.small", STATE_ON)
+        hass.states.async_set("light.small", STATE_OFF)
+        await hass.async_block_till_done()
+        state = hass.states.get("light.small")
+
+        messages = {}
+        for _ in range(2):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            messages[msg["id"]] = msg["event"]["events"]
+
+    assert messages == {
+        msg_id: [
+            {
+                "entity_id": "light.small",
+                "state": "off",
+                "when": state.last_updated.timestamp(),
+            }
+        ]
+        for msg_id in (7, 8)
+    }
+    assert mock_humanify.call_count == 1
+
+    await websocket_client.close()
+    await hass.async_block_till_done()
+
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
@@ -13,6 +13,7 @@ This file is responsible for testing:
 It uses binary_sensors/sensors to do black box testing of the read calls.
 """
 
+import asyncio
 from datetime import timedelta
 import logging
 from unittest import mock
@@ -25,7 +26,7 @@ import voluptuous as vol
 
 from homeassistant import config as hass_config
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.modbus import async_reset_platform
+from homeassistant.components.modbus import async_reset_platform, get_hub
 from homeassistant.components.modbus.const import (
     ATTR_ADDRESS,
     ATTR_HUB,
@@ -1781,3 +1782,95 @@ async def test_reset_platform(hass: HomeAssistant) -> None:
     """Run test for async_reset_platform."""
     await async_reset_platform(hass, "modbus")
     assert DOMAIN not in hass.data
+
+
+@pytest.mark.parametrize(
+    "do_config",
+    [
+        {
+            CONF_SENSORS: [
+                {
+                    CONF_NAME: TEST_ENTITY_NAME,
+                    CONF_ADDRESS: 51,
+                    CONF_SCAN_INTERVAL: 0,
+                }
+            ],
+        },
+    ],
+)
+async def test_pb_read_blocks(
+    hass: HomeAssistant, mock_modbus, mock_do_cycle: FrozenDateTimeFactory
+) -> None:
+    """Run test for merging queued reads into blocks."""
+
+    async def read_registers(address, count, slave=None):
+        await asyncio.sleep(0)
+        if count > 2:
+            # Illegal data address
+            return ExceptionResponse(0x03, 0x02)
+        return ReadResult(list(range(address, address + count)))
+
+    mock_modbus.read_holding_registers.reset_mock()
+    mock_modbus.read_holding_registers.side_effect = read_registers
+    hub = get_hub(hass, TEST_MODBUS_NAME)
+
+    # The first read keeps the hub busy while the other reads are queued
+    results = await asyncio.gather(
+        hub.async_pb_call(3, 0, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 101, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 300, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(2, 101, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert [result.registers for result in results] == [[0], [100], [101], [300], [101]]
+    assert mock_modbus.read_holding_registers.await_args_list == [
+        mock.call(0, 1, slave=3),
+        mock.call(100, 2, slave=1),
+        mock.call(300, 1, slave=1),
+        mock.call(101, 1, slave=2),
+    ]
+
+    # Requests of a block the device refuses are read one by one
+    mock_modbus.read_holding_registers.reset_mock()
+    results = await asyncio.gather(
+        hub.async_pb_call(3, 0, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 100, 2, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 104, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert [result.registers for result in results] == [[0], [100, 101], [104]]
+    assert mock_modbus.read_holding_registers.await_args_list == [
+        mock.call(0, 1, slave=3),
+        mock.call(100, 5, slave=1),
+        mock.call(100, 2, slave=1),
+        mock.call(104, 1, slave=1),
+    ]
+
+    # and are not merged anymore
+    mock_modbus.read_holding_registers.reset_mock()
+    await asyncio.gather(
+        hub.async_pb_call(3, 0, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 101, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert mock_modbus.read_holding_registers.await_count == 3
+
+    # A block which times out is not read again one by one
+    async def read_registers_timeout(address, count, slave=None):
+        await asyncio.sleep(0)
+        if count > 1:
+            raise ModbusException("timeout")
+        return ReadResult(list(range(address, address + count)))
+
+    mock_modbus.read_holding_registers.reset_mock()
+    mock_modbus.read_holding_registers.side_effect = read_registers_timeout
+    results = await asyncio.gather(
+        hub.async_pb_call(3, 0, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(2, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(2, 101, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert results[0].registers == [0]
+    assert results[1:] == [None, None]
+    assert mock_modbus.read_holding_registers.await_args_list == [
+        mock.call(0, 1, slave=3),
+        mock.call(100, 2, slave=2),
+    ]
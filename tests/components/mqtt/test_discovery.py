@@ -222,6 +222,39 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discovery_batches_new_items(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test new items discovered right after another are set up in one batch."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla0/config",
+        '{ "name": "Beer0", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    mqtt_data = hass.data["mqtt"]
+    batches = mqtt_data.discovery_batches
+    batched_items = mqtt_data.discovery_batched_items
+
+    for index in range(1, 4):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/sensor/bla{index}/config",
+            f'{{ "name": "Beer{index}", "state_topic": "test-topic" }}',
+        )
+    # The first item is set up right away, the others are batched
+    assert mqtt_data.discovery_pending_new == 2
+    await hass.async_block_till_done()
+
+    assert mqtt_data.discovery_pending_new == 0
+    assert mqtt_data.discovery_batches == batches + 2
+    assert mqtt_data.discovery_batched_items == batched_items + 3
+    for index in range(4):
+        assert hass.states.get(f"sensor.beer{index}") is not None
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1,6 +1,7 @@
 """The tests for the MQTT statestream component."""
 
-from unittest.mock import ANY, call
+from datetime import timedelta
+from unittest.mock import ANY, call, patch
 
 import pytest
 
@@ -8,8 +9,14 @@ import homeassistant.components.mqtt_statestream as statestream
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.setup import async_setup_component
-
-from tests.common import MockEntity, MockEntityPlatform, mock_state_change_event
+from homeassistant.util import dt as dt_util
+
+from tests.common import (
+    MockEntity,
+    MockEntityPlatform,
+    async_fire_time_changed,
+    mock_state_change_event,
+)
 from tests.typing import MqttMockHAClient
 
 
@@ -235,6 +242,60 @@ async def test_state_changed_attr_sends_message(
     assert mqtt_mock.async_publish.called
 
 
+async def test_state_changed_publishes_are_coalesced(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test queued messages are coalesced and unchanged attributes skipped."""
+    assert await add_statestream(hass, base_topic="pub", publish_attributes=True)
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish.reset_mock()
+
+    # Only the last state of the same loop iteration is published
+    mock_state_change_event(hass, State("fake.entity", "on", {"level": 1}))
+    mock_state_change_event(hass, State("fake.entity", "off", {"level": 2}))
+    await hass.async_block_till_done()
+    assert mqtt_mock.async_publish.mock_calls == [
+        call("pub/fake/entity/state", "off", 1, True),
+        call("pub/fake/entity/level", "2", 1, True),
+    ]
+    mqtt_mock.async_publish.reset_mock()
+
+    # Unchanged attributes are not published again
+    mock_state_change_event(hass, State("fake.entity", "on", {"level": 2}))
+    await hass.async_block_till_done()
+    assert mqtt_mock.async_publish.mock_calls == [
+        call("pub/fake/entity/state", "on", 1, True),
+    ]
+
+
+@patch(
+    "homeassistant.components.mqtt_statestream.publisher.MAX_PUBLISHES_PER_SECOND", 2
+)
+async def test_state_changed_publishes_are_rate_limited(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test messages above the rate limit are delayed and coalesced."""
+    assert await add_statestream(hass, base_topic="pub")
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish.reset_mock()
+
+    for idx in range(3):
+        mock_state_change_event(hass, State(f"fake.entity_{idx}", "on"))
+    await hass.async_block_till_done()
+    assert mqtt_mock.async_publish.call_count == 2
+
+    mock_state_change_event(hass, State("fake.entity_2", "off"))
+    await hass.async_block_till_done()
+    assert mqtt_mock.async_publish.call_count == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert mqtt_mock.async_publish.call_count == 3
+    mqtt_mock.async_publish.assert_called_with(
+        "pub/fake/entity_2/state", "off", 1, True
+    )
+
+
 async def test_state_changed_event_include_domain(
     hass: HomeAssistant, mqtt_mock: MqttMockHAClient
 ) -> None:
@@ -20,6 +20,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
 from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.window import SampleWindow
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -1614,3 +1615,46 @@ async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
 
     assert hass.states.get("sensor.test") is None
     assert hass.states.get("sensor.cputest")
+
+
+def test_sample_window_matches_full_calculation() -> None:
+    """Test the incremental aggregates match a calculation over all samples."""
+    window = SampleWindow(4)
+    start = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+    for idx, value in enumerate(VALUES_NUMERIC):
+        window.append(float(value), start + timedelta(seconds=idx * idx))
+        if idx == 6:
+            window.popleft()
+
+        states = list(window.states)
+        ages = list(window.ages)
+        assert window.mean == pytest.approx(statistics.mean(states))
+        assert window.median == statistics.median(states)
+        assert window.max_value == max(states)
+        assert window.min_value == min(states)
+        assert window.max_age == ages[states.index(max(states))]
+        assert window.min_age == ages[states.index(min(states))]
+        if len(states) < 2:
+            continue
+        assert window.variance == pytest.approx(statistics.variance(states))
+        assert window.percentile(25) == pytest.approx(
+            statistics.quantiles(states, n=100, method="exclusive")[24]
+        )
+        assert window.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in zip(states, states[1:], strict=False))
+        )
+        assert window.area_linear == pytest.approx(
+            sum(
+                0.5
+                * (states[i] + states[i - 1])
+                * (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(states))
+            )
+        )
+
+    with window.defer_aggregates():
+        for value in VALUES_NUMERIC:
+            window.append(float(value), start)
+    assert list(window.states) == [float(value) for value in VALUES_NUMERIC[-4:]]
+    assert window.sorted_states == sorted(window.states)
+    assert window.mean == pytest.approx(statistics.mean(window.states))
@@ -2,7 +2,7 @@
 
 from datetime import timedelta
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 from urllib.parse import urlparse
 
 import av
@@ -190,6 +190,7 @@ async def test_hls_stream(
         "orientation": Orientation.NO_TRANSFORM,
         "start_worker": 1,
         "video_codec": "h264",
+        "worker_cpu_time": ANY,
         "worker_error": 1,
     }
 
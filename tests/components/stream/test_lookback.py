@@ -0,0 +1,86 @@
+"""Test the stream lookback buffer."""
+
+from __future__ import annotations
+
+from homeassistant.components.stream.core import Part, Segment
+from homeassistant.components.stream.lookback import SegmentRing
+import homeassistant.util.dt as dt_util
+
+INIT = b"init"
+
+
+def make_segment(sequence: int, size: int, duration: float = 2.0) -> Segment:
+    """Create a completed segment with recognizable data."""
+    return Segment(
+        sequence=sequence,
+        init=INIT,
+        stream_id=0,
+        start_time=dt_util.utcnow(),
+        _stream_outputs=(),
+        duration=duration,
+        parts=[
+            Part(
+                duration=duration,
+                has_keyframe=True,
+                data=bytes([sequence % 256]) * size,
+            )
+        ],
+    )
+
+
+def test_ring_keeps_window() -> None:
+    """Test the ring keeps just enough segments to cover the window."""
+    ring = SegmentRing(6)
+    for sequence in range(10):
+        ring.append(make_segment(sequence, 100))
+
+    segments = ring.get_segments(60)
+    assert [segment.sequence for segment in segments] == [6, 7, 8, 9]
+    for segment in segments:
+        assert segment.init == INIT
+        assert segment.duration == 2.0
+        assert segment.get_data() == bytes([segment.sequence]) * 100
+
+    assert [segment.sequence for segment in ring.get_segments(3)] == [8, 9]
+    ring.close()
+
+
+def test_ring_reuses_space() -> None:
+    """Test the ring file stops growing once it holds the window."""
+    ring = SegmentRing(4)
+    for sequence in range(4):
+        ring.append(make_segment(sequence, 100))
+    capacity = ring._capacity
+
+    for sequence in range(4, 40):
+        ring.append(make_segment(sequence, 100))
+
+    assert ring._capacity == capacity
+    assert [segment.sequence for segment in ring.get_segments(4)] == [38, 39]
+    assert all(
+        segment.get_data() == bytes([segment.sequence]) * 100
+        for segment in ring.get_segments(60)
+    )
+    ring.close()
+
+
+def test_ring_variable_segment_sizes() -> None:
+    """Test segments of varying size never overwrite each other."""
+    ring = SegmentRing(10)
+    for sequence in range(50):
+        ring.append(make_segment(sequence, 50 + (sequence * 37) % 200))
+
+    for segment in ring.get_segments(60):
+        size = 50 + (segment.sequence * 37) % 200
+        assert segment.get_data() == bytes([segment.sequence]) * size
+    ring.close()
+
+
+def test_ring_closed() -> None:
+    """Test a closed ring ignores new segments."""
+    ring = SegmentRing(10)
+    assert ring.get_segments(10) == []
+    ring.append(make_segment(0, 10))
+    ring.close()
+    ring.append(make_segment(1, 10))
+    assert ring.get_segments(10) == []
@@ -0,0 +1,134 @@
+"""Test the stream worker pool."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import threading
+
+from homeassistant.components.stream import create_stream
+from homeassistant.components.stream.const import HLS_PROVIDER
+from homeassistant.components.stream.diagnostics import Diagnostics
+from homeassistant.components.stream.pool import StreamWorkerJob, StreamWorkerPool
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from .common import dynamic_stream_settings
+
+
+def _make_job(
+    name: str, order: list[str], steps: int
+) -> tuple[StreamWorkerJob, Diagnostics]:
+    """Create a job that records each step it runs."""
+
+    def _steps() -> Generator[float, None, None]:
+        for _ in range(steps):
+            order.append(name)
+            yield 0
+
+    diagnostics = Diagnostics()
+    return (
+        StreamWorkerJob(name, _steps(), threading.Event(), diagnostics),
+        diagnostics,
+    )
+
+
+def test_job_run_in_thread() -> None:
+    """Test a job runs to completion and accounts cpu time."""
+    order: list[str] = []
+    job, diagnostics = _make_job("a", order, 3)
+
+    assert job.is_alive()
+    job.run()
+
+    assert not job.is_alive()
+    assert order == ["a", "a", "a"]
+    assert diagnostics.as_dict()["worker_cpu_time"] >= 0
+
+
+def test_pool_interleaves_jobs() -> None:
+    """Test a single pool thread interleaves the steps of several jobs."""
+    order: list[str] = []
+    pool = StreamWorkerPool(1)
+    job_a, _ = _make_job("a", order, 3)
+    job_b, _ = _make_job("b", order, 3)
+    pool.submit(job_a)
+    pool.submit(job_b)
+    pool.start()
+
+    job_a.join(timeout=5)
+    job_b.join(timeout=5)
+    pool.shutdown()
+
+    assert not job_a.is_alive()
+    assert not job_b.is_alive()
+    assert order == ["a", "b", "a", "b", "a", "b"]
+
+
+def test_pool_wakes_job_on_quit() -> None:
+    """Test a job waiting to restart is resumed when asked to quit."""
+    quit_event = threading.Event()
+
+    def _steps() -> Generator[float, None, None]:
+        while not quit_event.is_set():
+            yield 3600
+
+    pool = StreamWorkerPool(2)
+    pool.start()
+    job = StreamWorkerJob("a", _steps(), quit_event, Diagnostics())
+    pool.submit(job)
+
+    quit_event.set()
+    pool.wake()
+    job.join(timeout=5)
+    pool.shutdown()
+
+    assert not job.is_alive()
+
+
+def test_pool_shutdown_closes_jobs() -> None:
+    """Test shutting down the pool closes unfinished jobs."""
+    started = threading.Event()
+    closed = threading.Event()
+
+    def _steps() -> Generator[float, None, None]:
+        try:
+            while True:
+                started.set()
+                yield 3600
+        finally:
+            closed.set()
+
+    pool = StreamWorkerPool(1)
+    pool.start()
+    job = StreamWorkerJob("a", _steps(), threading.Event(), Diagnostics())
+    pool.submit(job)
+    assert started.wait(timeout=5)
+    pool.shutdown()
+
+    assert closed.is_set()
+    assert not job.is_alive()
+
+
+async def test_stream_with_worker_pool(hass: HomeAssistant, h264_video) -> None:
+    """Test a stream worker runs on the configured pool."""
+    await async_setup_component(
+        hass, "stream", {"stream": {"ll_hls": False, "worker_pool_size": 2}}
+    )
+
+    stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+    stream.add_provider(HLS_PROVIDER)
+    await stream.start()
+
+    job = stream._thread
+    assert isinstance(job, StreamWorkerJob)
+    assert not any(thread.name == "stream_worker" for thread in threading.enumerate())
+
+    # The worker stops on its own at the end of the file
+    await hass.async_add_executor_job(job.join, 10)
+    assert not job.is_alive()
+    await hass.async_block_till_done()
+    await stream.stop()
+
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["start_worker"] == 1
+    assert diagnostics["worker_cpu_time"] >= 0
@@ -20,7 +20,7 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import av
 import numpy as np
@@ -965,6 +965,7 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "orientation": Orientation.NO_TRANSFORM,
         "start_worker": 1,
         "video_codec": "hevc",
+        "worker_cpu_time": ANY,
         "worker_error": 1,
     }
 
@@ -37,7 +37,7 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import async_fire_time_changed, async_mock_service, mock_restore_cache
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1765,3 +1765,153 @@ async def test_async_convert_audio_error(hass: HomeAssistant) -> None:
     with pytest.raises(RuntimeError):
         # Simulate a bad WAV file
         await tts.async_convert_audio(hass, "wav", bytes(0), "mp3")
+
+
+async def test_streaming_fetching(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test audio chunks are forwarded while the engine produces them."""
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that streams audio."""
+
+        _attr_supports_streaming = True
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def stream_chunks():
+                while (chunk := await chunks.get()) is not None:
+                    yield chunk
+
+            return ("mp3", stream_chunks())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message", "tts.test", "en_US", cache=False
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+    client_get_task = hass.async_create_task(client.get(url))
+
+    await chunks.put(b"first ")
+    req = await client_get_task
+    assert req.status == HTTPStatus.OK
+    assert await req.content.readexactly(6) == b"first "
+
+    await chunks.put(b"second")
+    assert await req.content.readexactly(6) == b"second"
+    await chunks.put(None)
+    assert await req.content.read() == b""
+
+    # Completed audio is served from the memory cache
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"first second"
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "tts/engine/metrics"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    metrics = msg["result"]["engines"]["tts.test"]
+    assert metrics["requests"] == 1
+    assert metrics["streamed"] == 1
+    assert metrics["last_time_to_first_byte"] is not None
+    assert msg["result"]["mem_cache"]["entries"] == 1
+
+
+async def test_streaming_error(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test an engine failing before the first chunk is not found."""
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that fails to stream audio."""
+
+        _attr_supports_streaming = True
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def stream_chunks():
+                raise HomeAssistantError("test error")
+                yield b""
+
+            return ("mp3", stream_chunks())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message", "tts.test", "en_US", cache=False
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+
+    req = await client.get(url)
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
+async def test_mem_cache_size_budget(hass: HomeAssistant) -> None:
+    """Test the memory cache evicts least recently used entries over budget."""
+    mem_cache = tts.TTSMemCache(hass, max_bytes=10, max_idle=300)
+
+    def entry(data: bytes) -> tts.TTSCache:
+        return {"filename": "", "voice": data, "pending": None, "stream": None}
+
+    mem_cache["a"] = entry(b"aaaa")
+    mem_cache["b"] = entry(b"bbbb")
+    assert mem_cache.size == 8
+
+    # Use a so b is the least recently used entry
+    assert mem_cache["a"]["voice"] == b"aaaa"
+    mem_cache["c"] = entry(b"cccc")
+    assert "b" not in mem_cache
+    assert "a" in mem_cache
+    assert "c" in mem_cache
+    assert mem_cache.size == 8
+
+    # The newest entry is kept even when it exceeds the budget on its own
+    mem_cache["d"] = entry(b"d" * 20)
+    assert len(mem_cache) == 1
+    assert mem_cache.size == 20
+
+    mem_cache.clear()
+    assert len(mem_cache) == 0
+    assert mem_cache.size == 0
+
+
+async def test_mem_cache_idle_expiry(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the memory cache drops entries that have not been used."""
+    mem_cache = tts.TTSMemCache(hass, max_bytes=100, max_idle=300)
+
+    def entry(data: bytes) -> tts.TTSCache:
+        return {"filename": "", "voice": data, "pending": None, "stream": None}
+
+    mem_cache["a"] = entry(b"aaaa")
+    freezer.tick(200)
+    mem_cache["b"] = entry(b"bbbb")
+
+    freezer.tick(101)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert "a" not in mem_cache
+    assert "b" in mem_cache
+
+    # Using an entry delays its expiry
+    assert mem_cache["b"]["voice"] == b"bbbb"
+    freezer.tick(250)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert "b" in mem_cache
+
+    freezer.tick(51)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(mem_cache) == 0
+    assert mem_cache.size == 0
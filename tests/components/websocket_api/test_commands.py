@@ -2511,6 +2511,41 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting what importing integrations cost."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value={
+            "august": loader.ImportTiming(1.5, 4096, ["yalexs"]),
+            "august.lock": loader.ImportTiming(0.5, 0, []),
+        },
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "august",
+            "platform": None,
+            "seconds": 1.5,
+            "max_rss_delta": 4096,
+            "packages": ["yalexs"],
+        },
+        {
+            "domain": "august",
+            "platform": "lock",
+            "seconds": 0.5,
+            "max_rss_delta": 0,
+            "packages": [],
+        },
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -171,6 +171,41 @@ async def test_and_condition(hass: HomeAssistant) -> None:
     )
 
 
+async def test_condition_without_trace(hass: HomeAssistant) -> None:
+    """Test nothing is recorded when no trace is being collected."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": 110,
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    trace.trace_cv.set(None)
+
+    with pytest.raises(ConditionError):
+        test(hass)
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert not test(hass)
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+
+    assert trace.trace_cv.get() is None
+    assert trace.trace_stack_cv.get() is None
+
+
 async def test_and_condition_raises(hass: HomeAssistant) -> None:
     """Test the 'and' condition."""
     config = {
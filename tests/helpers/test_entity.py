@@ -34,6 +34,7 @@ from homeassistant.core import (
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -41,6 +42,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -2300,6 +2302,55 @@ async def test_update_capabilities_too_often_cooldown(
     assert capabilities_too_often_warning not in caplog.text
 
 
+async def test_state_write_rate_limit(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test state writes are rate limited by the entity registry options."""
+    platform = MockEntityPlatform(hass)
+
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.OPTION_MIN_STATE_WRITE_INTERVAL: 10}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == STATE_UNKNOWN
+
+    # Writes within the interval are coalesced, the latest state is written
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == STATE_UNKNOWN
+    assert ent._suppressed_state_writes == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "2"
+
+    entity_registry.async_update_entity_options(
+        ent.entity_id,
+        "homeassistant",
+        {
+            entity.OPTION_MIN_STATE_WRITE_INTERVAL: 10,
+            entity.OPTION_DROP_ATTRIBUTE_ONLY_WRITES: True,
+        },
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=22))
+    await hass.async_block_till_done()
+
+    # Writes within the interval which only change attributes are dropped
+    ent._values["extra_state_attributes"] = {"bla": "blu"}
+    ent.async_write_ha_state()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=33))
+    await hass.async_block_till_done()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "2"
+    assert "bla" not in state.attributes
+
+
 @pytest.mark.parametrize(
     ("property", "default_value", "values"), [("attribution", None, ["abcd", "efgh"])]
 )
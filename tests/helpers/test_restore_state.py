@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,7 +18,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -358,6 +361,73 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_only_serializes_changes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test stored states are only serialized again when they changed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    extra_data = {"value": 1}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return the extra data."""
+            return RestoredExtraData(extra_data)
+
+    entities = []
+    for idx in range(3):
+        entity = MockRestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    dumps: list[list[Any]] = []
+
+    async def _mock_save(written_states: list[Any]) -> None:
+        dumps.append(list(written_states))
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save",
+        side_effect=_mock_save,
+    ):
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        extra_data["value"] = 2
+        await data.async_dump_states()
+        freezer.tick(LAST_SEEN_REFRESH + timedelta(seconds=1))
+        await data.async_dump_states()
+
+    first, state_changed, extra_data_changed, refreshed = dumps
+    assert state_changed[0] is first[0]
+    assert state_changed[1] is not first[1]
+    assert state_changed[2] is first[2]
+    assert json_round_trip(state_changed[1])["state"]["state"] == "off"
+
+    assert all(
+        new is not old
+        for new, old in zip(extra_data_changed, state_changed, strict=True)
+    )
+    assert json_round_trip(extra_data_changed[0])["extra_data"] == {"value": 2}
+
+    assert all(
+        new is not old for new, old in zip(refreshed, extra_data_changed, strict=True)
+    )
+    assert json_round_trip(refreshed) == [
+        {
+            **json_round_trip(old),
+            "last_seen": dt_util.utcnow().isoformat(),
+        }
+        for old in extra_data_changed
+    ]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -20,9 +20,10 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.json import load_json
 
 from tests.common import (
     async_fire_time_changed,
@@ -664,6 +665,172 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes of a journaled store are appended and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+
+        def _journaled_store() -> storage.Store:
+            return storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+            )
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fp:
+                return fp.read()
+
+        def _append(path: str, data: bytes) -> None:
+            with open(path, "ab") as fp:
+                fp.write(data)
+
+        store = _journaled_store()
+        await store.async_save(
+            {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 2}], "other": 1}
+        )
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        assert not os.path.exists(store._journal_path)
+
+        await store.async_save(
+            {
+                "items": storage.JournalItems(
+                    {
+                        "a": json_fragment(b'{"id":"a","value":3}'),
+                        "c": {"id": "c", "value": 4},
+                    }
+                ),
+                "other": 2,
+            }
+        )
+        # Only the changes were written
+        assert await hass.async_add_executor_job(_read, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read, store._journal_path)
+        assert journal.count(b"\n") == 1
+        assert len(journal) < len(snapshot)
+
+        expected = {
+            "items": [{"id": "a", "value": 3}, {"id": "c", "value": 4}],
+            "other": 2,
+        }
+        assert await _journaled_store().async_load() == expected
+        # Stores without journal_collections still apply the journal
+        assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == (
+            expected
+        )
+
+        # A record left incomplete by an interrupted write is ignored
+        await hass.async_add_executor_job(
+            _append, store._journal_path, b'{"generation":'
+        )
+        store = _journaled_store()
+        assert await store.async_load() == expected
+
+        # and the journal is compacted into the snapshot on the next write
+        await store.async_save({"items": [{"id": "c", "value": 4}], "other": 2})
+        assert not os.path.exists(store._journal_path)
+        assert await _journaled_store().async_load() == {
+            "items": [{"id": "c", "value": 4}],
+            "other": 2,
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_after_interval(tmpdir: py.path.local) -> None:
+    """Test the journal of a store is compacted once it gets old."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+        await store.async_save({"items": [{"id": "a", "value": 1}]})
+        await store.async_save({"items": [{"id": "a", "value": 2}]})
+        assert os.path.exists(store._journal_path)
+
+        with patch.object(storage, "JOURNAL_COMPACT_INTERVAL", 0):
+            await store.async_save({"items": [{"id": "a", "value": 3}]})
+
+        assert not os.path.exists(store._journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"items": [{"id": "a", "value": 3}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal of a store is compacted when shutting down."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+        await store.async_save({"items": [{"id": "a", "value": 1}]})
+        await store.async_save({"items": [{"id": "a", "value": 2}]})
+        assert os.path.exists(store._journal_path)
+
+        store.async_delay_save(lambda: {"items": [{"id": "a", "value": 3}]}, 3600)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not os.path.exists(store._journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"items": [{"id": "a", "value": 3}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write_after_flush(
+    tmpdir: py.path.local,
+) -> None:
+    """Test the journal is compacted when shutting down with nothing pending."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+        await store.async_save({"items": [{"id": "a", "value": 1}], "other": 1})
+        store.async_delay_save(
+            lambda: {"items": [{"id": "a", "value": 2}], "other": 2}, 1
+        )
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        assert os.path.exists(store._journal_path)
+
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not os.path.exists(store._journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"items": [{"id": "a", "value": 2}], "other": 2}
+
+        # A journal loaded from disk is compacted on the next shutdown
+        hass.set_state(CoreState.running)
+        await store.async_save({"items": [{"id": "a", "value": 3}], "other": 2})
+        assert os.path.exists(store._journal_path)
+        store._async_cleanup_final_write_listener()
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+        assert await store.async_load() == {
+            "items": [{"id": "a", "value": 3}],
+            "other": 2,
+        }
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not os.path.exists(store._journal_path)
+        data = await hass.async_add_executor_job(load_json, store.path)
+        assert data["data"] == {"items": [{"id": "a", "value": 3}], "other": 2}
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
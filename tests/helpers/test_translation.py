@@ -9,7 +9,10 @@ from unittest.mock import Mock, call, patch
 import pytest
 
 from homeassistant import loader
-from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
@@ -517,6 +520,48 @@ async def test_caching(hass: HomeAssistant) -> None:
         assert len(mock_build.mock_calls) > 1
 
 
+async def test_translation_bundle(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test translations are served from the bundle of the previous run."""
+    hass.config.components.add("sensor")
+    hass.config.components.add("light")
+
+    load1 = await translation.async_get_translations(hass, "de", "entity_component")
+    assert load1
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert set(hass_storage["core.translations.de"]["data"]["domains"]) == {
+        "light",
+        "sensor",
+    }
+
+    hass.data[translation.TRANSLATION_FLATTEN_CACHE] = translation._TranslationCache(
+        hass
+    )
+    translation._async_get_translations_cache.cache_clear()
+    with patch(
+        "homeassistant.helpers.translation._load_translations_files_by_language",
+    ) as mock_load:
+        load2 = await translation.async_get_translations(hass, "de", "entity_component")
+    assert not mock_load.mock_calls
+    assert load1 == load2
+
+    # Translations made by another version are not used
+    hass_storage["core.translations.de"]["data"]["ha_version"] = "1.0.0"
+    hass.data[translation.TRANSLATION_FLATTEN_CACHE] = translation._TranslationCache(
+        hass
+    )
+    translation._async_get_translations_cache.cache_clear()
+    with patch(
+        "homeassistant.helpers.translation._load_translations_files_by_language",
+        side_effect=translation._load_translations_files_by_language,
+    ) as mock_load:
+        load3 = await translation.async_get_translations(hass, "de", "entity_component")
+    assert len(mock_load.mock_calls) == 1
+    assert load1 == load3
+
+
 async def test_custom_component_translations(
     hass: HomeAssistant, enable_custom_integrations: None
 ) -> None:
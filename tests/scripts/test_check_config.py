@@ -1,5 +1,6 @@
 """Test check_config script."""
 
+import json
 import logging
 from unittest.mock import patch
 
@@ -111,6 +112,33 @@ def test_component_platform_not_found(
     assert len(res["yaml_files"]) == 1
 
 
+@pytest.mark.parametrize(
+    "hass_config_yaml", [BASE_CONFIG + "light:\n  platform: demo\nbeer:"]
+)
+def test_json_output(
+    mock_is_file,
+    event_loop,
+    mock_hass_config_yaml: None,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the result can be printed as JSON."""
+    with patch(
+        "sys.argv",
+        ["", "--script", "check_config", "-c", get_test_config_dir(), "--json"],
+    ):
+        assert check_config.run([]) == 0
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["valid"] is True
+    assert result["errors"] == {}
+    assert result["warnings"] == {
+        check_config.WARNING_STR: [
+            "Integration error: beer - Integration 'beer' not found."
+        ]
+    }
+    assert result["timings"].keys() == {"beer", "light"}
+
+
 @pytest.mark.parametrize(
     "hass_config_yaml_files",
     [
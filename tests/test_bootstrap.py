@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
 import glob
+import json
 import os
 import sys
 from typing import Any
@@ -1157,6 +1158,62 @@ async def test_bootstrap_empty_integrations(
     await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_multi_components_priorities(hass: HomeAssistant) -> None:
+    """Test base platforms start first, then domains with higher priority."""
+    started: list[str] = []
+
+    async def _mock_setup_component(
+        hass: HomeAssistant, domain: str, config: ConfigType
+    ) -> bool:
+        started.append(domain)
+        return True
+
+    with patch.object(bootstrap, "async_setup_component", _mock_setup_component):
+        await bootstrap.async_setup_multi_components(
+            hass,
+            {"leaf", "shared", "common", "sensor"},
+            {},
+            {"shared": 3, "common": 1},
+        )
+
+    assert started == ["sensor", "shared", "common", "leaf"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_startup_trace(hass: HomeAssistant) -> None:
+    """Test a Chrome trace of the setup is written when enabled."""
+    # setup times are only tracked when not running
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(hass, MockModule(domain="leaf", dependencies=["root"]))
+    bootstrap.async_enable_setup_trace(hass)
+
+    with patch.object(bootstrap, "write_utf8_file") as mock_write:
+        await bootstrap._async_set_up_integrations(hass, {"leaf": {}})
+
+    assert "leaf" in hass.config.components
+    assert len(mock_write.call_args_list) == 1
+    path, content = mock_write.call_args[0]
+    assert path == hass.config.path(bootstrap.STARTUP_TRACE_FILENAME)
+    trace = json.loads(content)
+    thread_names = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    spans = {
+        (thread_names[event["tid"]], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert ("bootstrap", "resolve") in spans
+    assert ("bootstrap", "stage 2") in spans
+    assert ("bootstrap", "wrap up") in spans
+    assert ("root", "root") in spans
+    assert ("leaf", "leaf") in spans
+
+
 @pytest.fixture(name="mock_mqtt_config_flow")
 def mock_mqtt_config_flow_fixture() -> Generator[None, None, None]:
     """Mock MQTT config flow."""
@@ -1,9 +1,12 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from fnmatch import fnmatchcase
 import os
+import pathlib
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -1025,6 +1028,35 @@ async def test_import_platform_executor(
     assert await config_flow_task1_result._async_has_devices(hass) is True
 
 
+async def test_import_timings(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the cost of importing a component is recorded."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    module = ModuleType(integration.pkg_path)
+
+    def _import_module(name: str) -> ModuleType:
+        sys.modules["test_heavy_library.submodule"] = ModuleType("submodule")
+        sys.modules[name] = module
+        return module
+
+    with (
+        patch.dict(sys.modules),
+        patch(
+            "homeassistant.loader.importlib.import_module", side_effect=_import_module
+        ),
+    ):
+        sys.modules.pop(integration.pkg_path, None)
+        assert integration.get_component() is module
+
+    timing = loader.async_get_import_timings(hass)["test_package_loaded_executor"]
+    assert timing.seconds >= 0
+    assert timing.max_rss_delta >= 0
+    assert timing.packages == ["test_heavy_library"]
+
+
 async def test_get_custom_components_recovery_mode(hass: HomeAssistant) -> None:
     """Test that we get empty custom components in recovery mode."""
     hass.config.recovery_mode = True
@@ -1959,3 +1991,59 @@ async def test_hass_helpers_use_reported(
             "Detected that custom integration 'test_integration_frame' "
             "accesses hass.helpers.aiohttp_client. This is deprecated"
         ) in caplog.text
+
+
+async def test_manifest_snapshot(
+    hass: HomeAssistant, enable_custom_integrations: None, tmp_path: pathlib.Path
+) -> None:
+    """Test manifests are read from the snapshot until they change."""
+    snapshot_path = str(tmp_path / "manifest_snapshot")
+    snapshot = loader.ManifestSnapshot(snapshot_path)
+    hass.data[loader.DATA_MANIFEST_SNAPSHOT] = snapshot
+    integration = await loader.async_get_integration(hass, "test_integration_platform")
+    assert snapshot.dirty
+    await hass.async_add_executor_job(snapshot.save)
+    assert not snapshot.dirty
+
+    async def _async_resolve_from_new_snapshot() -> list[str]:
+        hass.data[loader.DATA_INTEGRATIONS] = {}
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+        snapshot = loader.ManifestSnapshot(snapshot_path)
+        await hass.async_add_executor_job(snapshot.load)
+        hass.data[loader.DATA_MANIFEST_SNAPSHOT] = snapshot
+        paths: list[str] = []
+        original_os_listdir = os.listdir
+
+        def mock_list_dir(path: str) -> list[str]:
+            paths.append(path)
+            return original_os_listdir(path)
+
+        with patch("homeassistant.loader.os.listdir", mock_list_dir):
+            cached = await loader.async_get_integration(
+                hass, "test_integration_platform"
+            )
+        assert cached is not integration
+        assert cached.manifest == integration.manifest
+        assert cached.platforms_exists(["group"]) == ["group"]
+        return paths
+
+    assert await _async_resolve_from_new_snapshot() == []
+
+    # Touching the manifest invalidates the snapshot entry
+    manifest_path = integration.file_path / "manifest.json"
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert await _async_resolve_from_new_snapshot() == [integration.file_path]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["hue", "esp_*", "*-light", "*bridge*", "*", "tasmota-?", "[ab]*", "a*b*c", ""],
+)
+@pytest.mark.parametrize(
+    "name",
+    ["hue", "hue2", "esp_1234", "my-light", "smart-bridge-1", "tasmota-1", "abc", ""],
+)
+def test_compile_fnmatch(pattern: str, name: str) -> None:
+    """Test compiled fnmatch patterns match like fnmatch."""
+    assert loader.compile_fnmatch(pattern)(name) is fnmatchcase(name, pattern)
@@ -729,3 +729,61 @@ def test_load_yaml_dict_fail(try_both_loaders, mock_hass_config_yaml: None) -> N
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def test_load_yaml_cache(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are loaded from the cache with references resolved."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text(
+        "name: !secret name\nscript: !include scripts.yaml\nlist:\n  - 1\n  - two\n"
+    )
+    (tmp_path / "scripts.yaml").write_text("morning:\n  sequence: []\n")
+    (tmp_path / "secrets.yaml").write_text("name: Home\n")
+    cache_path = str(tmp_path / ".storage" / "core.yaml_cache")
+
+    expected = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path))
+    cache = yaml.YamlCache(cache_path)
+    loaded = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path), cache=cache)
+    assert loaded == expected
+    cache.save()
+
+    cache = yaml.YamlCache(cache_path)
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as parse_mock:
+        loaded = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path), cache=cache)
+    assert loaded == expected
+    # Only the secrets file was parsed
+    assert parse_mock.call_count == 1
+    for key in ("name", "script", "list"):
+        assert loaded[key].__config_file__ == expected[key].__config_file__
+        assert loaded[key].__line__ == expected[key].__line__
+    assert loaded["script"]["morning"].__config_file__ == str(tmp_path / "scripts.yaml")
+
+    # Secrets are resolved on every load
+    (tmp_path / "secrets.yaml").write_text("name: Away\n")
+    loaded = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path), cache=cache)
+    assert loaded["name"] == "Away"
+
+    # Changed files are parsed again
+    (tmp_path / "scripts.yaml").write_text("night:\n  sequence: []\n")
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as parse_mock:
+        loaded = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path), cache=cache)
+    assert list(loaded["script"]) == ["night"]
+    assert parse_mock.call_count == 2
+
+
+def test_load_yaml_cache_duplicate_key(
+    try_both_loaders, tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test files with duplicate keys are not cached to keep warning about them."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("key: 1\nkey: 2\n")
+    cache = yaml.YamlCache(None)
+
+    for _ in range(2):
+        caplog.clear()
+        assert yaml.load_yaml_dict(config_file, cache=cache) == {"key": 2}
+        assert 'contains duplicate key "key"' in caplog.text